@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .common import parse_str
+from .common import EntityKind, parse_str
 from .const import (
     API_AZ_AIDOO,
     API_AZ_AIDOO_PRO,
@@ -24,11 +24,17 @@ from .const import (
     AZD_MODEL,
 )
 from .hvac import HVAC
+from .snapshot import AidooSnapshot
 
 
 class Aidoo(HVAC):
     """Airzone Cloud Aidoo device."""
 
+    __slots__ = ("aidoo_type",)
+
+    kind = EntityKind.AIDOO
+    snapshot_class = AidooSnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud Aidoo device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -84,3 +90,5 @@ class Aidoo(HVAC):
             self.set_setpoint_vent(data[API_VALUE])
         elif param == API_SPEED_CONF:
             self.set_speed(data[API_VALUE])
+
+        self.set_dirty()
@@ -5,18 +5,23 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from .common import parse_str
+from .common import EntityKind, parse_str
 from .const import (
     API_AQ_SENSOR_FW,
     API_NAME,
     API_SYSTEM_NUMBER,
     API_ZONE_NUMBER,
+    AZD_AQ_PM_1,
+    AZD_AQ_PM_2P5,
+    AZD_AQ_PM_10,
     AZD_FIRMWARE,
     AZD_SYSTEM,
     AZD_ZONE,
 )
-from .device import Device
-from .entity import EntityUpdate
+from .device import DEVICE_FIELDS, Device
+from .fields import FieldSpec
+from .snapshot import AirQualitySnapshot
+from .timeseries import SeriesSpec
 
 if TYPE_CHECKING:
     from .system import System
@@ -24,10 +29,40 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+AIR_QUALITY_FIELDS = DEVICE_FIELDS.extend(
+    [
+        FieldSpec(
+            API_AQ_SENSOR_FW,
+            "aq_sensor_fw",
+            parse_str,
+            azd_key=AZD_FIRMWARE,
+        ),
+    ]
+)
+
+AIR_QUALITY_SERIES: tuple[SeriesSpec, ...] = (
+    SeriesSpec(AZD_AQ_PM_1, "get_aq_pm_1", frozenset({"aq_pm_1"})),
+    SeriesSpec(AZD_AQ_PM_2P5, "get_aq_pm_2p5", frozenset({"aq_pm_2p5"})),
+    SeriesSpec(AZD_AQ_PM_10, "get_aq_pm_10", frozenset({"aq_pm_10"})),
+)
+
 
 class AirQuality(Device):
     """Airzone Cloud Air Quality device."""
 
+    __slots__ = (
+        "aq_sensor_fw",
+        "system_number",
+        "systems",
+        "zone_number",
+        "zones",
+    )
+
+    fields = AIR_QUALITY_FIELDS
+    series = AIR_QUALITY_SERIES
+    kind = EntityKind.AIR_QUALITY
+    snapshot_class = AirQualitySnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud Air Quality device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -53,10 +88,6 @@ class AirQuality(Device):
         data[AZD_SYSTEM] = self.get_system_num()
         data[AZD_ZONE] = self.get_zone_num()
 
-        aq_sensor_fw = self.get_aq_sensor_fw()
-        if aq_sensor_fw is not None:
-            data[AZD_FIRMWARE] = aq_sensor_fw
-
         return data
 
     def add_system(self, system: System) -> None:
@@ -85,13 +116,3 @@ class AirQuality(Device):
 
     def set_param(self, param: str, data: dict[str, Any]) -> None:
         """Update Air Quality parameter from API request."""
-
-    def update_data(self, update: EntityUpdate) -> None:
-        """Update Air Quality data."""
-        super().update_data(update)
-
-        data = update.get_data()
-
-        aq_sensor_fw = parse_str(data.get(API_AQ_SENSOR_FW))
-        if aq_sensor_fw is not None:
-            self.aq_sensor_fw = aq_sensor_fw
@@ -0,0 +1,326 @@
+"""Airzone Cloud API requests budget."""
+
+from __future__ import annotations
+
+from collections import deque
+from enum import IntEnum
+from time import monotonic
+from typing import Any
+import urllib.parse
+
+from .const import (
+    API_AUTH_LOGIN,
+    API_AUTH_REFRESH_TOKEN,
+    API_CONFIG,
+    API_DEVICES,
+    API_GROUP,
+    API_INSTALLATION_ID,
+    API_INSTALLATIONS,
+    API_STATUS,
+    API_USER,
+    API_USER_LOGOUT,
+    API_V1,
+    API_WS,
+    BUDGET_CYCLE,
+    BUDGET_CYCLES,
+    BUDGET_CYCLES_OVER_LIMIT,
+    BUDGET_ENDPOINTS,
+    BUDGET_INSTALLATIONS,
+    BUDGET_ISSUED,
+    BUDGET_LIMIT,
+    BUDGET_MAX_CYCLES,
+    BUDGET_MAX_ISSUED,
+    BUDGET_OVER_LIMIT,
+    BUDGET_TIME,
+    BUDGET_WINDOW,
+    BUDGET_WINDOW_DATA,
+    REQUESTS_LIMIT,
+)
+
+# Path segments which aren't IDs
+ENDPOINT_NAMES: frozenset[str] = frozenset(
+    segment
+    for path in (
+        API_AUTH_LOGIN,
+        API_AUTH_REFRESH_TOKEN,
+        API_CONFIG,
+        API_DEVICES,
+        API_GROUP,
+        API_INSTALLATIONS,
+        API_STATUS,
+        API_USER,
+        API_USER_LOGOUT,
+        API_V1,
+        API_WS,
+    )
+    for segment in path.split("/")
+)
+ENDPOINT_PREFIX: str = f"{API_V1}/"
+
+
+class RequestOutcome(IntEnum):
+    """Airzone Cloud API request outcome."""
+
+    SUCCEEDED = 0
+    FAILED = 1
+    RATE_LIMITED = 2
+    SKIPPED = 3
+
+
+def get_endpoint(method: str, path: str, json: Any = None) -> tuple[str, str | None]:
+    """Return request endpoint, with IDs replaced, and installation ID."""
+    url = urllib.parse.urlsplit(path)
+    inst_id: str | None = None
+
+    segments = url.path.removeprefix(ENDPOINT_PREFIX).split("/")
+    for idx, segment in enumerate(segments):
+        if segment in ENDPOINT_NAMES:
+            continue
+        if idx > 0 and segments[idx - 1] == API_INSTALLATIONS:
+            inst_id = urllib.parse.unquote(segment)
+        segments[idx] = "{id}"
+
+    if inst_id is None:
+        query = urllib.parse.parse_qs(url.query)
+        if API_INSTALLATION_ID in query:
+            inst_id = query[API_INSTALLATION_ID][0]
+        elif isinstance(json, dict):
+            inst_id = json.get(API_INSTALLATION_ID)
+
+    return f"{method} {'/'.join(segments)}", inst_id
+
+
+class RequestCounts:
+    """Airzone Cloud API request counts by outcome.
+
+    Issued requests are the ones that reached the API: succeeded, failed
+    and rate limited. Skipped requests weren't sent.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self) -> None:
+        """Airzone Cloud Request Counts init."""
+        self.counts: list[int] = [0] * len(RequestOutcome)
+
+    def add(self, outcome: RequestOutcome) -> None:
+        """Count request outcome."""
+        self.counts[outcome] += 1
+
+    def data(self) -> dict[str, int]:
+        """Return request counts data."""
+        data = {
+            outcome.name.lower(): self.counts[outcome] for outcome in RequestOutcome
+        }
+        data[BUDGET_ISSUED] = self.get_issued()
+        return data
+
+    def get(self, outcome: RequestOutcome) -> int:
+        """Return number of requests with outcome."""
+        return self.counts[outcome]
+
+    def get_issued(self) -> int:
+        """Return number of requests sent to the API."""
+        counts = self.counts
+        return (
+            counts[RequestOutcome.SUCCEEDED]
+            + counts[RequestOutcome.FAILED]
+            + counts[RequestOutcome.RATE_LIMITED]
+        )
+
+    def merge(self, other: RequestCounts) -> None:
+        """Add counts from another Request Counts."""
+        for outcome, count in enumerate(other.counts):
+            self.counts[outcome] += count
+
+
+class CycleBudget:
+    """Airzone Cloud API requests of an update cycle."""
+
+    __slots__ = (
+        "end",
+        "endpoints",
+        "installations",
+        "start",
+        "total",
+        "update",
+    )
+
+    def __init__(self, start: float, update: bool = True) -> None:
+        """Airzone Cloud Cycle Budget init."""
+        self.end: float | None = None
+        self.endpoints: dict[str, RequestCounts] = {}
+        self.installations: dict[str, RequestCounts] = {}
+        self.start: float = start
+        self.total: RequestCounts = RequestCounts()
+        self.update: bool = update
+
+    def add(self, endpoint: str, inst_id: str | None, outcome: RequestOutcome) -> None:
+        """Count request outcome."""
+        self.total.add(outcome)
+
+        counts = self.endpoints.get(endpoint)
+        if counts is None:
+            counts = self.endpoints[endpoint] = RequestCounts()
+        counts.add(outcome)
+
+        if inst_id is not None:
+            counts = self.installations.get(inst_id)
+            if counts is None:
+                counts = self.installations[inst_id] = RequestCounts()
+            counts.add(outcome)
+
+    def data(self, limit: int) -> dict[str, Any]:
+        """Return cycle requests data."""
+        issued = self.total.get_issued()
+        data: dict[str, Any] = self.total.data()
+        data[BUDGET_ENDPOINTS] = {
+            endpoint: counts.data() for endpoint, counts in self.endpoints.items()
+        }
+        data[BUDGET_INSTALLATIONS] = {
+            inst_id: counts.data() for inst_id, counts in self.installations.items()
+        }
+        data[BUDGET_LIMIT] = limit
+        data[BUDGET_OVER_LIMIT] = issued > limit
+        if self.end is not None:
+            data[BUDGET_TIME] = self.end - self.start
+        return data
+
+    def get_requests(self) -> int:
+        """Return number of accounted requests."""
+        return sum(self.total.counts)
+
+    def merge(self, other: CycleBudget) -> None:
+        """Add requests from another Cycle Budget."""
+        self.total.merge(other.total)
+        for endpoint, counts in other.endpoints.items():
+            self.endpoints.setdefault(endpoint, RequestCounts()).merge(counts)
+        for inst_id, counts in other.installations.items():
+            self.installations.setdefault(inst_id, RequestCounts()).merge(counts)
+
+
+class RequestBudget:
+    """Airzone Cloud API requests budget.
+
+    Accounts the requests actually spent by each update cycle and over a
+    rolling window of recent cycles, so they can be compared with the
+    REQUESTS_LIMIT estimates. Requests made outside of update cycles, such
+    as setting parameters, are accounted in the window as their own cycle.
+    """
+
+    def __init__(
+        self,
+        limit: int = REQUESTS_LIMIT,
+        window: float = BUDGET_WINDOW,
+        max_cycles: int = BUDGET_MAX_CYCLES,
+    ) -> None:
+        """Airzone Cloud Request Budget init."""
+        self.current: CycleBudget | None = None
+        self.cycles: deque[CycleBudget] = deque(maxlen=max_cycles)
+        self.idle: CycleBudget = CycleBudget(monotonic(), False)
+        self.limit: int = limit
+        self.window: float = window
+
+    def add(self, endpoint: str, inst_id: str | None, outcome: RequestOutcome) -> None:
+        """Count request outcome in the current cycle."""
+        cycle = self.current
+        if cycle is None:
+            cycle = self.idle
+        cycle.add(endpoint, inst_id, outcome)
+
+    def add_request(
+        self, method: str, path: str, json: Any, outcome: RequestOutcome
+    ) -> None:
+        """Count API request outcome in the current cycle."""
+        endpoint, inst_id = get_endpoint(method, path, json)
+        self.add(endpoint, inst_id, outcome)
+
+    def end_cycle(self) -> None:
+        """Finish current update cycle."""
+        cycle = self.current
+        if cycle is None:
+            return
+        cycle.end = monotonic()
+        self.cycles.append(cycle)
+        self.current = None
+
+    def flush_idle(self, now: float) -> None:
+        """Move requests made outside of update cycles to the window."""
+        idle = self.idle
+        if idle.get_requests() > 0:
+            idle.end = now
+            self.cycles.append(idle)
+        self.idle = CycleBudget(now, False)
+
+    def get_current(self) -> CycleBudget | None:
+        """Return current update cycle."""
+        return self.current
+
+    def get_issued(self) -> int:
+        """Return number of requests issued in the current update cycle."""
+        if self.current is None:
+            return 0
+        return self.current.total.get_issued()
+
+    def get_last(self) -> CycleBudget | None:
+        """Return last finished update cycle."""
+        for cycle in reversed(self.cycles):
+            if cycle.update:
+                return cycle
+        return None
+
+    def get_window(self, now: float | None = None) -> list[CycleBudget]:
+        """Return cycles finished inside the rolling window."""
+        if now is None:
+            now = monotonic()
+        since = now - self.window
+        cycles = [
+            cycle
+            for cycle in self.cycles
+            if cycle.end is not None and cycle.end >= since
+        ]
+        if self.current is not None:
+            cycles += [self.current]
+        if self.idle.get_requests() > 0:
+            cycles += [self.idle]
+        return cycles
+
+    def start_cycle(self) -> CycleBudget:
+        """Start a new update cycle."""
+        self.end_cycle()
+        now = monotonic()
+        self.flush_idle(now)
+        self.current = CycleBudget(now)
+        return self.current
+
+    def data(self) -> dict[str, Any]:
+        """Return last cycle and rolling window requests data."""
+        now = monotonic()
+        cycles = self.get_window(now)
+
+        window = CycleBudget(now - self.window, False)
+        max_issued = 0
+        over_limit = 0
+        update_cycles = 0
+        for cycle in cycles:
+            window.merge(cycle)
+            if not cycle.update:
+                continue
+            issued = cycle.total.get_issued()
+            max_issued = max(max_issued, issued)
+            if issued > self.limit:
+                over_limit += 1
+            update_cycles += 1
+
+        window_data = window.data(self.limit)
+        del window_data[BUDGET_OVER_LIMIT]
+        window_data[BUDGET_CYCLES] = update_cycles
+        window_data[BUDGET_CYCLES_OVER_LIMIT] = over_limit
+        window_data[BUDGET_MAX_ISSUED] = max_issued
+        window_data[BUDGET_TIME] = self.window
+
+        last = self.get_last()
+        return {
+            BUDGET_CYCLE: last.data(self.limit) if last is not None else None,
+            BUDGET_WINDOW_DATA: window_data,
+        }
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import Lock, Semaphore
-from collections.abc import Callable
+from asyncio import Lock, Task
+from collections.abc import Callable, Iterable, Iterator, Mapping
 import logging
+from time import monotonic, perf_counter
+from types import MappingProxyType
 from typing import Any, cast
 import urllib.parse
 
@@ -18,7 +20,8 @@ from aiohttp import (
 
 from .aidoo import Aidoo
 from .air_quality import AirQuality
-from .common import ConnectionOptions, OperationMode
+from .budget import RequestBudget, RequestOutcome
+from .common import ConnectionOptions, EntityKind, OperationMode
 from .const import (
     API_AUTH_LOGIN,
     API_AUTH_REFRESH_TOKEN,
@@ -47,7 +50,6 @@ from .const import (
     API_STATUS,
     API_TYPE,
     API_TYPE_USER,
-    API_URL,
     API_USER,
     API_USER_LOGOUT,
     API_V1,
@@ -64,7 +66,7 @@ from .const import (
     AZD_WEBSERVERS,
     AZD_ZONES,
     HTTP_CALL_TIMEOUT,
-    HTTP_MAX_REQUESTS,
+    METRICS_HISTOGRAM_API,
     RAW_DEVICES_CONFIG,
     RAW_DEVICES_STATUS,
     RAW_INSTALLATIONS,
@@ -72,10 +74,21 @@ from .const import (
     RAW_USER,
     RAW_WEBSERVERS,
     RAW_WEBSOCKETS,
+    RAW_WEBSOCKETS_STATS,
     REQUESTS_LIMIT,
+    WS_INIT_TIMEOUT,
 )
 from .device import Device
-from .entity import EntityUpdate, UpdateType
+from .device_group import DeviceGroup
+from .dispatcher import WebSocketsHandler
+from .entity import (
+    Entity,
+    EntityChanges,
+    EntityData,
+    EntityEvent,
+    EntityUpdate,
+    UpdateType,
+)
 from .exceptions import (
     AirzoneCloudError,
     APIError,
@@ -88,11 +101,19 @@ from .exceptions import (
 from .group import Group
 from .hotwater import HotWater
 from .installation import Installation
+from .limiter import RequestLimiter
+from .metrics import EventMetrics
 from .output import Output
+from .query import DeviceQuery
+from .raw_data import RawDataStore
+from .snapshot import EntitySnapshot
 from .system import System
 from .token import AirzoneCloudToken
+from .topology import DeviceTopology
+from .tracing import Tracer
 from .webserver import WebServer
-from .websockets import AirzoneCloudIWS
+from .websockets import AirzoneCloudIWS, WebSocketsState
+from .websockets_manager import WebSocketsManager
 from .zone import Zone
 
 _LOGGER = logging.getLogger(__name__)
@@ -102,28 +123,37 @@ class AirzoneCloudApi:
     """Airzone Cloud API."""
 
     callback_function: Callable[[dict[str, Any]], None] | None
+    changes_function: Callable[[list[EntityEvent]], None] | None
 
     def __init__(
         self,
         session: ClientSession,
         options: ConnectionOptions,
+        limiter: RequestLimiter | None = None,
     ):
         """Airzone Cloud API init."""
-        self._api_raw_data: dict[str, Any] = {
-            RAW_DEVICES_CONFIG: {},
-            RAW_DEVICES_STATUS: {},
-            RAW_INSTALLATIONS: {},
-            RAW_WEBSERVERS: {},
-        }
-        self._api_raw_data_lock = Lock()
-        self._api_semaphore: Semaphore = Semaphore(HTTP_MAX_REQUESTS)
+        self._api_raw_data: RawDataStore = RawDataStore(
+            (
+                RAW_DEVICES_CONFIG,
+                RAW_DEVICES_STATUS,
+                RAW_INSTALLATIONS,
+                RAW_WEBSERVERS,
+            ),
+            options.raw_data,
+            options.raw_data_max,
+        )
+        self._api_budget: RequestBudget = RequestBudget()
+        self._api_limiter: RequestLimiter = limiter or RequestLimiter()
+        self._api_metrics: EventMetrics = EventMetrics(METRICS_HISTOGRAM_API)
         self._api_timeout: ClientTimeout = ClientTimeout(total=HTTP_CALL_TIMEOUT)
         self.aidoos: dict[str, Aidoo] = {}
         self.air_quality: dict[str, AirQuality] = {}
         self.callback_function = None
         self.callback_lock: Lock = Lock()
+        self.changes_function = None
         self.devices: dict[str, Device] = {}
         self.dhws: dict[str, HotWater] = {}
+        self.entity_events: list[EntityEvent] = []
         self.groups: dict[str, Group] = {}
         self.installations: dict[str, Installation] = {}
         self.loop = asyncio.get_running_loop()
@@ -131,10 +161,16 @@ class AirzoneCloudApi:
         self.outputs: dict[str, Output] = {}
         self.session = session
         self.systems: dict[str, System] = {}
+        self.query: DeviceQuery = DeviceQuery()
         self.token: AirzoneCloudToken = AirzoneCloudToken()
+        self.topology: DeviceTopology = DeviceTopology()
+        self.tracer: Tracer = Tracer(options.tracing)
         self.webservers: dict[str, WebServer] = {}
         self.websockets: dict[str, AirzoneCloudIWS] = {}
         self.websockets_first: bool = True
+        self.websockets_handlers: list[tuple[str, WebSocketsHandler, bool]] = []
+        self.websockets_manager: WebSocketsManager = WebSocketsManager(self)
+        self.websockets_state: WebSocketsState = WebSocketsState()
         self.zones: dict[str, Zone] = {}
 
     async def set_api_raw_data(
@@ -142,11 +178,7 @@ class AirzoneCloudApi:
     ) -> None:
         """Save API raw data if not empty."""
         if data is not None:
-            async with self._api_raw_data_lock:
-                if subkey is None:
-                    self._api_raw_data[key] = data
-                else:
-                    self._api_raw_data[key][subkey] = data
+            self._api_raw_data.set(key, subkey, data)
 
     async def api_request(
         self, method: str, path: str, json: Any | None = None
@@ -154,37 +186,52 @@ class AirzoneCloudApi:
         """Airzone Cloud API request."""
         _LOGGER.debug("aiohttp request: /%s (params=%s)", path, json)
 
-        async with self._api_semaphore:
-            try:
-                async with self.session.request(
-                    method,
-                    f"{API_URL}/{path}",
-                    headers=self.token.headers(),
-                    json=json,
-                    raise_for_status=True,
-                    timeout=self._api_timeout,
-                ) as resp:
-                    resp_json = await resp.json(content_type=None)
-            except ClientConnectorError as err:
-                raise AirzoneCloudError(err) from err
-            except ClientResponseError as err:
-                if path.endswith(API_AUTH_LOGIN):
-                    raise LoginError(err) from err
-                if path.endswith(API_AUTH_REFRESH_TOKEN):
-                    raise TokenRefreshError(err) from err
-
-                if err.status == 400:
-                    raise APIError(err) from err
-                if err.status == 401:
-                    raise AuthError(err) from err
-                if err.status == 422:
-                    raise UnprocessableEntity(err) from err
-                if err.status == 429:
-                    raise TooManyRequests(err) from err
-
-                raise AirzoneCloudError(err) from err
-            except TimeoutError as err:
-                raise TimeoutError(err) from err
+        http_path = path.split("?", 1)[0]
+        with self.tracer.span("http", method=method, path=http_path) as span:
+            async with self._api_limiter:
+                start = perf_counter()
+                outcome = RequestOutcome.FAILED
+                try:
+                    async with self.session.request(
+                        method,
+                        f"{self.options.api_url}/{path}",
+                        headers=self.token.headers(),
+                        json=json,
+                        raise_for_status=True,
+                        timeout=self._api_timeout,
+                    ) as resp:
+                        resp_json = await resp.json(content_type=None)
+                        if span is not None:
+                            span.set_attribute("status", resp.status)
+                    outcome = RequestOutcome.SUCCEEDED
+                except ClientConnectorError as err:
+                    raise AirzoneCloudError(err) from err
+                except ClientResponseError as err:
+                    if span is not None:
+                        span.set_attribute("status", err.status)
+                    if path.endswith(API_AUTH_LOGIN):
+                        raise LoginError(err) from err
+                    if path.endswith(API_AUTH_REFRESH_TOKEN):
+                        raise TokenRefreshError(err) from err
+
+                    if err.status == 400:
+                        raise APIError(err) from err
+                    if err.status == 401:
+                        raise AuthError(err) from err
+                    if err.status == 422:
+                        raise UnprocessableEntity(err) from err
+                    if err.status == 429:
+                        outcome = RequestOutcome.RATE_LIMITED
+                        raise TooManyRequests(err) from err
+
+                    raise AirzoneCloudError(err) from err
+                except TimeoutError as err:
+                    raise TimeoutError(err) from err
+                finally:
+                    self._api_metrics.observe(
+                        perf_counter() - start, outcome != RequestOutcome.SUCCEEDED
+                    )
+                    self._api_budget.add_request(method, path, json, outcome)
 
         _LOGGER.debug("aiohttp response: %s", resp_json)
 
@@ -192,17 +239,21 @@ class AirzoneCloudApi:
 
     async def api_get_device_config(self, device: Device) -> dict[str, Any]:
         """Request API device config data."""
+        dev_id = device.get_id()
+        inst_id = device.get_installation()
+        config_endpoint = f"GET {API_DEVICES}/{{id}}/{API_CONFIG}"
+
         if not self.options.device_config:
+            self._api_budget.add(config_endpoint, inst_id, RequestOutcome.SKIPPED)
             return {}
 
         ws_id = device.get_webserver()
         ws = self.webservers.get(ws_id)
         if ws is not None and ws.get_old():
             _LOGGER.debug("device_config: legacy webserver")
+            self._api_budget.add(config_endpoint, inst_id, RequestOutcome.SKIPPED)
             return {}
 
-        dev_id = device.get_id()
-        inst_id = device.get_installation()
         url_id = urllib.parse.quote(dev_id)
 
         inst = self.get_installation_id(inst_id)
@@ -394,6 +445,11 @@ class AirzoneCloudApi:
 
         device.set_param(param, data)
 
+        self.query.update_device(device)
+        if isinstance(device, System):
+            for zone in device.zones.values():
+                self.query.update_device(zone)
+
     async def api_set_device_params(
         self, device: Device, params: dict[str, Any]
     ) -> None:
@@ -422,6 +478,8 @@ class AirzoneCloudApi:
 
         group.set_params(params)
 
+        self.update_query_group(group)
+
     async def api_set_installation_params(
         self, inst: Installation, params: dict[str, Any]
     ) -> None:
@@ -439,6 +497,8 @@ class AirzoneCloudApi:
 
         inst.set_params(params)
 
+        self.update_query_group(inst)
+
     async def api_set_aidoo_id_params(
         self, aidoo_id: str, params: dict[str, Any]
     ) -> None:
@@ -521,6 +581,28 @@ class AirzoneCloudApi:
 
         return stat_req
 
+    def count_installation_poll_requests(self, inst: Installation) -> int:
+        """Count number of poll requests for an installation."""
+        num_aidoos = len(inst.aidoos)
+        num_air_quality = len(inst.air_quality)
+        num_dhws = len(inst.dhws)
+        num_outputs = len(inst.outputs)
+        num_systems = len(inst.systems)
+        num_zones = len(inst.zones)
+
+        conf_req = num_aidoos + num_air_quality + num_outputs + num_systems + num_zones
+        stat_req = (
+            num_aidoos
+            + num_air_quality
+            + num_dhws
+            + num_outputs
+            + num_systems
+            + num_zones
+        )
+        ws_req = len(inst.get_webservers())
+
+        return conf_req + stat_req + ws_req
+
     def count_ws_poll_requests_devices(self) -> int:
         """Count number of WS poll devices requests."""
         num_aidoos = len(self.aidoos)
@@ -575,74 +657,205 @@ class AirzoneCloudApi:
             _LOGGER.debug("refresh resp: %s", resp)
             self.token.update(resp, True)
 
-    def raw_data(self) -> dict[str, Any]:
-        """Return raw Airzone Cloud API data."""
-        raw_data = self._api_raw_data
-        raw_data[RAW_WEBSOCKETS] = {}
+    def register_websockets_handler(
+        self, event: str, handler: WebSocketsHandler, prefix: bool = False
+    ) -> None:
+        """Register WebSockets event handler for all installations."""
+        self.websockets_handlers += [(event, handler, prefix)]
+        for inst_ws in self.websockets.values():
+            inst_ws.register_handler(event, handler, prefix)
+
+    def websockets_stats(self) -> dict[str, Any]:
+        """Return WebSockets statistics by installation."""
+        stats: dict[str, Any] = {}
+        for inst_id, inst_ws in self.websockets.items():
+            stats[inst_id] = inst_ws.get_stats()
+        return stats
+
+    def api_metrics(self) -> dict[str, Any]:
+        """Return API requests metrics."""
+        return self._api_metrics.data()
+
+    def api_budget(self) -> dict[str, Any]:
+        """Return API requests budget of last update and rolling window."""
+        return self._api_budget.data()
+
+    def get_api_budget(self) -> RequestBudget:
+        """Return API requests budget."""
+        return self._api_budget
+
+    def get_api_limiter(self) -> RequestLimiter:
+        """Return API requests limiter."""
+        return self._api_limiter
+
+    def get_api_metrics(self) -> EventMetrics:
+        """Return API requests metrics."""
+        return self._api_metrics
+
+    def get_tracer(self) -> Tracer:
+        """Return API tracer."""
+        return self.tracer
+
+    def traces(self) -> list[dict[str, Any]]:
+        """Return last finished traces."""
+        return self.tracer.get_traces()
+
+    def websockets_metrics(self) -> dict[str, Any]:
+        """Return WebSockets events metrics by installation."""
+        metrics: dict[str, Any] = {}
+        for inst_id, inst_ws in self.websockets.items():
+            metrics[inst_id] = inst_ws.get_events_metrics()
+        return metrics
+
+    def raw_data(self) -> Mapping[str, Any]:
+        """Return read-only snapshot of raw Airzone Cloud API data."""
+        raw_data = dict(self._api_raw_data.get_snapshot())
+        ws_data: dict[str, Any] = {}
+        ws_stats: dict[str, Any] = {}
         for ws_id, ws in self.websockets.items():
-            raw_data[RAW_WEBSOCKETS][ws_id] = ws.device_data
-        return raw_data
+            ws_data[ws_id] = MappingProxyType(dict(ws.device_data))
+            ws_stats[ws_id] = ws.get_stats()
+        raw_data[RAW_WEBSOCKETS] = MappingProxyType(ws_data)
+        raw_data[RAW_WEBSOCKETS_STATS] = MappingProxyType(ws_stats)
+        return MappingProxyType(raw_data)
 
-    def data(self) -> dict[str, Any]:
-        """Return Airzone Cloud data."""
-        data: dict[str, Any] = {}
+    def get_raw_data_store(self) -> RawDataStore:
+        """Return API raw data store."""
+        return self._api_raw_data
+
+    def data(
+        self,
+        installation_id: str | None = None,
+        group_id: str | None = None,
+        webserver_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Return Airzone Cloud data, optionally limited to a scope.
 
-        if len(self.aidoos) > 0:
-            aidoos: dict[str, Any] = {}
-            for key, aidoo in self.aidoos.items():
-                aidoos[key] = aidoo.data()
-            data[AZD_AIDOOS] = aidoos
-
-        if len(self.air_quality) > 0:
-            air_quality_data: dict[str, Any] = {}
-            for key, air_quality in self.air_quality.items():
-                air_quality_data[key] = air_quality.data()
-            data[AZD_AIR_QUALITY] = air_quality_data
-
-        if len(self.dhws) > 0:
-            dhws: dict[str, Any] = {}
-            for key, dhw in self.dhws.items():
-                dhws[key] = dhw.data()
-            data[AZD_HOT_WATERS] = dhws
-
-        if len(self.groups) > 0:
-            groups: dict[str, Any] = {}
-            for key, group in self.groups.items():
-                groups[key] = group.data()
-            data[AZD_GROUPS] = groups
-
-        if len(self.installations) > 0:
-            installations: dict[str, Any] = {}
-            for key, installation in self.installations.items():
-                installations[key] = installation.data()
-            data[AZD_INSTALLATIONS] = installations
-
-        if len(self.outputs) > 0:
-            outputs: dict[str, Any] = {}
-            for key, output in self.outputs.items():
-                outputs[key] = output.data()
-            data[AZD_OUTPUTS] = outputs
-
-        if len(self.systems) > 0:
-            systems: dict[str, Any] = {}
-            for key, system in self.systems.items():
-                systems[key] = system.data()
-            data[AZD_SYSTEMS] = systems
-
-        if len(self.webservers) > 0:
-            webservers: dict[str, Any] = {}
-            for key, webserver in self.webservers.items():
-                webservers[key] = webserver.data()
-            data[AZD_WEBSERVERS] = webservers
-
-        if len(self.zones) > 0:
-            zones: dict[str, Any] = {}
-            for key, zone in self.zones.items():
-                zones[key] = zone.data()
-            data[AZD_ZONES] = zones
+        Entity dicts are copies of the cached data, but nested values are
+        shared with the cache and must not be modified.
+        """
+        entities = self.get_entities(installation_id, group_id, webserver_id)
+
+        data: dict[str, Any] = {}
+        for key, items in entities.items():
+            if len(items) > 0:
+                data[key] = {
+                    item_id: dict(item.get_data()) for item_id, item in items.items()
+                }
 
         return data
 
+    def snapshots(
+        self,
+        installation_id: str | None = None,
+        group_id: str | None = None,
+        webserver_id: str | None = None,
+    ) -> dict[str, dict[str, EntitySnapshot]]:
+        """Return Airzone Cloud entity snapshots, optionally limited to a scope."""
+        entities = self.get_entities(installation_id, group_id, webserver_id)
+
+        snapshots: dict[str, dict[str, EntitySnapshot]] = {}
+        for key, items in entities.items():
+            if len(items) > 0:
+                snapshots[key] = {
+                    item_id: item.get_snapshot() for item_id, item in items.items()
+                }
+
+        return snapshots
+
+    def get_entities(
+        self,
+        installation_id: str | None = None,
+        group_id: str | None = None,
+        webserver_id: str | None = None,
+    ) -> dict[str, Mapping[str, EntityData]]:
+        """Return Airzone Cloud entities reachable from scope.
+
+        Without a scope all entities are returned. Scopes can be combined
+        and only entities matching all of them are returned.
+        """
+        if installation_id is None and group_id is None and webserver_id is None:
+            return {
+                AZD_AIDOOS: self.aidoos,
+                AZD_AIR_QUALITY: self.air_quality,
+                AZD_HOT_WATERS: self.dhws,
+                AZD_GROUPS: self.groups,
+                AZD_INSTALLATIONS: self.installations,
+                AZD_OUTPUTS: self.outputs,
+                AZD_SYSTEMS: self.systems,
+                AZD_WEBSERVERS: self.webservers,
+                AZD_ZONES: self.zones,
+            }
+
+        devices: dict[EntityKind, dict[str, Device]] = {
+            EntityKind.AIDOO: {},
+            EntityKind.AIR_QUALITY: {},
+            EntityKind.HOT_WATER: {},
+            EntityKind.OUTPUT: {},
+            EntityKind.SYSTEM: {},
+            EntityKind.ZONE: {},
+        }
+        groups: dict[str, Group] = {}
+        installations: dict[str, Installation] = {}
+        webservers: dict[str, WebServer] = {}
+
+        inst = None
+        if installation_id is not None:
+            inst = self.get_installation_id(installation_id)
+            if inst is not None:
+                installations[installation_id] = inst
+
+        scope: DeviceGroup | None = inst
+        if group_id is not None:
+            scope = None
+            group = self.get_group_id(group_id)
+            if group is not None and installation_id in (
+                None,
+                group.get_installation(),
+            ):
+                groups[group_id] = group
+                scope = group
+        elif inst is not None:
+            groups.update(inst.groups)
+
+        if installation_id is None and group_id is None:
+            for device in self.query.get_devices(webserver_id=webserver_id):
+                devices[device.get_kind()][device.get_id()] = device
+        elif scope is not None:
+            for device in scope.get_devices():
+                if webserver_id in (None, device.get_webserver()):
+                    devices[device.get_kind()][device.get_id()] = device
+
+        ws_ids: list[str]
+        if webserver_id is not None:
+            ws_ids = [webserver_id]
+        elif inst is not None:
+            ws_ids = inst.get_webservers()
+        else:
+            ws_ids = list(
+                {
+                    device.get_webserver(): None
+                    for items in devices.values()
+                    for device in items.values()
+                }
+            )
+        for ws_id in ws_ids:
+            ws = self.get_webserver_id(ws_id)
+            if ws is not None and installation_id in (None, ws.get_installation()):
+                webservers[ws_id] = ws
+
+        return {
+            AZD_AIDOOS: devices[EntityKind.AIDOO],
+            AZD_AIR_QUALITY: devices[EntityKind.AIR_QUALITY],
+            AZD_HOT_WATERS: devices[EntityKind.HOT_WATER],
+            AZD_GROUPS: groups,
+            AZD_INSTALLATIONS: installations,
+            AZD_OUTPUTS: devices[EntityKind.OUTPUT],
+            AZD_SYSTEMS: devices[EntityKind.SYSTEM],
+            AZD_WEBSERVERS: webservers,
+            AZD_ZONES: devices[EntityKind.ZONE],
+        }
+
     def add_aidoo(self, aidoo: Aidoo) -> None:
         """Add Airzone Cloud Aidoo."""
         self.aidoos[aidoo.get_id()] = aidoo
@@ -652,12 +865,16 @@ class AirzoneCloudApi:
         """Add Airzone Cloud Aidoo."""
         self.air_quality[air_quality.get_id()] = air_quality
         self.add_device(air_quality)
+        self.topology.add_air_quality(air_quality)
 
     def add_device(self, device: Device) -> None:
         """Add Airzone Cloud Device."""
         dev_id = device.get_id()
         if dev_id not in self.devices:
             self.devices[dev_id] = device
+            self.query.add_device(device)
+            if self.options.timeseries is not None:
+                device.enable_timeseries(self.options.timeseries)
 
     def add_dhw(self, dhw: HotWater) -> None:
         """Add Airzone Cloud Domestic Hot Water."""
@@ -673,11 +890,13 @@ class AirzoneCloudApi:
         """Add Airzone Cloud System."""
         self.systems[system.get_id()] = system
         self.add_device(system)
+        self.topology.add_system(system)
 
     def add_zone(self, zone: Zone) -> None:
         """Add Airzone Cloud System."""
         self.zones[zone.get_id()] = zone
         self.add_device(zone)
+        self.topology.add_zone(zone)
 
     def get_aidoo_id(self, aidoo_id: str) -> Aidoo | None:
         """Return Airzone Cloud Aidoo by ID."""
@@ -723,6 +942,41 @@ class AirzoneCloudApi:
         """Return Airzone Cloud Zone by ID."""
         return self.zones.get(zone_id)
 
+    def query_devices(
+        self,
+        *,
+        available: bool | None = None,
+        group_id: str | None = None,
+        installation_id: str | None = None,
+        kind: EntityKind | None = None,
+        mode: OperationMode | None = None,
+        system_num: int | None = None,
+        webserver_id: str | None = None,
+    ) -> Iterator[Device]:
+        """Return lazy iterator of Airzone Cloud devices matching the filters."""
+        return self.query.get_devices(
+            available=available,
+            group_id=group_id,
+            installation_id=installation_id,
+            kind=kind,
+            mode=mode,
+            system_num=system_num,
+            webserver_id=webserver_id,
+        )
+
+    async def discover(self) -> None:
+        """Discover all installations, their devices and webservers."""
+        with self.tracer.span("discover"):
+            await self.update_installations()
+
+            tasks = [
+                asyncio.create_task(self.update_installation(inst))
+                for inst in list(self.installations.values())
+            ]
+            await asyncio.gather(*tasks)
+
+            await self.update_webservers(True)
+
     async def list_installations(self) -> list[Installation]:
         """Return Airzone Cloud installations list."""
         inst_list: list[Installation] = []
@@ -738,13 +992,8 @@ class AirzoneCloudApi:
         inst_id = inst.get_id()
 
         if self.options.websockets:
-            for _inst in list(self.installations):
-                inst_ws = self.websockets.get(_inst)
-                if inst_ws is not None and inst_ws.disconnect():
-                    self.websockets.pop(_inst)
-
-            if inst_id not in self.websockets:
-                self.websockets[inst_id] = AirzoneCloudIWS(self, inst)
+            self.websockets_manager.clear()
+            self.websockets_manager.add_installation(inst)
 
         self.installations = {
             inst_id: inst,
@@ -754,93 +1003,50 @@ class AirzoneCloudApi:
             if self.get_webserver_id(ws_id) is None:
                 self.webservers[ws_id] = WebServer(inst_id, ws_id)
 
-    def set_air_quality_system_zones_data(self, air_quality: AirQuality) -> None:
-        """Set Air Quality system and zones data."""
-        air_quality_ws = air_quality.get_webserver()
-        installation_id = air_quality.get_installation()
-        system_num = air_quality.get_system_num()
-        zone_num = air_quality.get_zone_num()
-        for system in self.systems.values():
-            if (
-                system.get_installation() != installation_id
-                or system.get_system_num() != system_num
-                or system.get_webserver() != air_quality_ws
-            ):
-                continue
-
-            air_quality.add_system(system)
-            system.set_air_quality(air_quality)
-        for zone in self.zones.values():
-            if (
-                zone.get_installation() != installation_id
-                or zone.get_system_num() != system_num
-                or zone.get_webserver() != air_quality_ws
-                or zone.get_zone() != zone_num
-            ):
-                continue
-
-            air_quality.add_zone(zone)
-            zone.set_air_quality(air_quality)
-
-    def set_system_zones_data(self, system: System) -> None:
-        """Set slave zones modes from master zone."""
-        modes = system.get_modes()
-        installation_id = system.get_installation()
-        system_num = system.get_system_num()
-        system_ws = system.get_webserver()
-        for zone in self.zones.values():
-            if (
-                zone.get_installation() != installation_id
-                or zone.get_system_num() != system_num
-                or zone.get_webserver() != system_ws
-            ):
-                continue
-
-            system.add_zone(zone)
-            zone.set_system(system)
-            if zone.get_master() is False and modes:
-                zone.set_modes(modes)
-
     def link_devices(self) -> None:
         """Process and link Airzone Cloud devices."""
-        for air_quality in self.air_quality.values():
-            self.set_air_quality_system_zones_data(air_quality)
-
-        for system in self.systems.values():
-            self.set_system_zones_data(system)
+        with self.tracer.span("link_devices"):
+            self.topology.link()
 
     async def update_aidoo(self, aidoo: Aidoo) -> None:
         """Update Airzone Cloud Aidoo from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(aidoo))
         status_task = asyncio.create_task(self.api_get_device_status(aidoo))
 
         config_data = await config_task
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, config_data | status_data)
+        update = EntityUpdate(
+            UpdateType.API_FULL, status_data, config_data, start=start
+        )
 
-        await aidoo.update(update)
+        await self.update_entity(aidoo, update)
 
     async def update_aidoos(self) -> None:
         """Update all Airzone Cloud Aidoos."""
-        tasks = []
+        with self.tracer.span("update_aidoos"):
+            tasks = []
 
-        for aidoo in self.aidoos.values():
-            tasks += [asyncio.create_task(self.update_aidoo(aidoo))]
+            for aidoo in self.aidoos.values():
+                tasks += [asyncio.create_task(self.update_aidoo(aidoo))]
 
-        await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
 
     async def update_air_quality(self, air_quality: AirQuality) -> None:
         """Update Airzone Cloud Air Quality from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(air_quality))
         status_task = asyncio.create_task(self.api_get_device_status(air_quality))
 
         config_data = await config_task
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, config_data | status_data)
+        update = EntityUpdate(
+            UpdateType.API_FULL, status_data, config_data, start=start
+        )
 
-        await air_quality.update(update)
+        await self.update_entity(air_quality, update)
 
     async def update_air_qualitys(self) -> None:
         """Update all Airzone Cloud Air Qualitys."""
@@ -853,34 +1059,50 @@ class AirzoneCloudApi:
 
     async def update_dhw(self, dhw: HotWater) -> None:
         """Update Airzone Cloud DHW from API."""
+        start = monotonic()
         status_task = asyncio.create_task(self.api_get_device_status(dhw))
 
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, status_data)
+        update = EntityUpdate(UpdateType.API_FULL, status_data, start=start)
 
-        await dhw.update(update)
+        await self.update_entity(dhw, update)
 
     async def update_dhws(self) -> None:
         """Update all Airzone Cloud DHWs."""
-        tasks = []
+        with self.tracer.span("update_dhws"):
+            tasks = []
 
-        for dhw in self.dhws.values():
-            tasks += [asyncio.create_task(self.update_dhw(dhw))]
+            for dhw in self.dhws.values():
+                tasks += [asyncio.create_task(self.update_dhw(dhw))]
 
-        await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
 
-    async def connect_installation_websockets(self, inst_id: str) -> None:
-        """Connect installation WebSockets."""
+    async def connect_installation_websockets(self, inst_id: str) -> WebSocketsState:
+        """Connect installation WebSockets and wait for its initial state."""
         if not self.options.websockets:
-            return
+            return WebSocketsState()
 
         self.websockets_first = True
 
+        inst = self.get_installation_id(inst_id)
+        if inst is not None:
+            self.websockets_manager.add_installation(inst)
+
         inst_ws = self.websockets.get(inst_id)
-        if inst_ws is not None:
-            inst_ws.connect()
-            await inst_ws.state_wait()
+        if inst_ws is None:
+            return WebSocketsState()
+
+        inst_ws.connect()
+        return await self.state_wait_websockets([inst_id])
+
+    def subscribe_installation(self, inst_id: str) -> None:
+        """Subscribe to installation live updates."""
+        self.websockets_manager.subscribe(inst_id)
+
+    def unsubscribe_installation(self, inst_id: str) -> None:
+        """Unsubscribe from installation live updates."""
+        self.websockets_manager.unsubscribe(inst_id)
 
     async def update_installation(self, inst: Installation) -> None:
         """Update Airzone Cloud installation from API."""
@@ -941,8 +1163,45 @@ class AirzoneCloudApi:
                         "unsupported device_type=%s %s", device_type, device_data
                     )
 
+            self.query.add_group(group)
+
         await self.connect_installation_websockets(inst_id)
 
+    async def update_installation_devices(self, inst: Installation) -> None:
+        """Update Airzone Cloud installation devices from API."""
+        tasks = []
+
+        for ws_id in inst.get_webservers():
+            ws = self.get_webserver_id(ws_id)
+            if ws is not None:
+                tasks += [asyncio.create_task(self.update_webserver(ws, False))]
+        for aidoo in inst.aidoos.values():
+            tasks += [asyncio.create_task(self.update_aidoo(aidoo))]
+        for air_quality in inst.air_quality.values():
+            tasks += [asyncio.create_task(self.update_air_quality(air_quality))]
+        for dhw in inst.dhws.values():
+            tasks += [asyncio.create_task(self.update_dhw(dhw))]
+        for output in inst.outputs.values():
+            tasks += [asyncio.create_task(self.update_output(output))]
+        for system in inst.systems.values():
+            tasks += [asyncio.create_task(self.update_system(system))]
+        for zone in inst.zones.values():
+            tasks += [asyncio.create_task(self.update_zone(zone))]
+
+        await asyncio.gather(*tasks)
+
+    async def update_polled_installations(self) -> None:
+        """Update installations without WebSockets using REST polling."""
+        with self.tracer.span("update_polled_installations"):
+            tasks = []
+
+            # Requests already issued in this update cycle count too
+            budget = REQUESTS_LIMIT - self._api_budget.get_issued()
+            for inst in self.websockets_manager.get_polled_budget(budget):
+                tasks += [asyncio.create_task(self.update_installation_devices(inst))]
+
+            await asyncio.gather(*tasks)
+
     async def update_installations(self) -> None:
         """Update Airzone Cloud installations from API."""
         installations_data = await self.api_get_installations()
@@ -959,24 +1218,28 @@ class AirzoneCloudApi:
 
     async def update_output(self, output: Output) -> None:
         """Update Airzone Cloud Output from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(output))
         status_task = asyncio.create_task(self.api_get_device_status(output))
 
         config_data = await config_task
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, config_data | status_data)
+        update = EntityUpdate(
+            UpdateType.API_FULL, status_data, config_data, start=start
+        )
 
-        await output.update(update)
+        await self.update_entity(output, update)
 
     async def update_outputs(self) -> None:
         """Update all Airzone Cloud Outputs."""
-        tasks = []
+        with self.tracer.span("update_outputs"):
+            tasks = []
 
-        for aidoo in self.outputs.values():
-            tasks += [asyncio.create_task(self.update_output(aidoo))]
+            for aidoo in self.outputs.values():
+                tasks += [asyncio.create_task(self.update_output(aidoo))]
 
-        await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
 
     def get_ws_device_data(self, device: Device) -> dict[str, Any] | None:
         """Get WebSockets device data."""
@@ -988,15 +1251,18 @@ class AirzoneCloudApi:
 
     async def update_system(self, system: System) -> None:
         """Update Airzone Cloud System from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(system))
         status_task = asyncio.create_task(self.api_get_device_status(system))
 
         config_data = await config_task
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, config_data | status_data)
+        update = EntityUpdate(
+            UpdateType.API_FULL, status_data, config_data, start=start
+        )
 
-        await system.update(update)
+        await self.update_entity(system, update)
 
     async def update_system_id(self, sys_id: str) -> None:
         """Update Airzone Cloud System by ID."""
@@ -1015,28 +1281,35 @@ class AirzoneCloudApi:
 
     async def update_systems_zones(self) -> None:
         """Update all Airzone Cloud Systems/Zones."""
-        tasks = [
-            asyncio.create_task(self.update_air_qualitys()),
-            asyncio.create_task(self.update_systems()),
-            asyncio.create_task(self.update_zones()),
-        ]
+        with self.tracer.span("update_systems_zones"):
+            tasks = [
+                asyncio.create_task(self.update_air_qualitys()),
+                asyncio.create_task(self.update_systems()),
+                asyncio.create_task(self.update_zones()),
+            ]
 
-        await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
 
-        self.link_devices()
+            self.link_devices()
 
     async def update_webserver(self, ws: WebServer, devices: bool) -> None:
         """Update Airzone Cloud WebServer from API."""
         inst_id = ws.get_installation()
         inst = self.get_installation_id(inst_id)
         if inst and not inst.user_access.is_admin():
+            self._api_budget.add(
+                f"GET {API_DEVICES}/{API_WS}/{{id}}/{API_STATUS}",
+                inst_id,
+                RequestOutcome.SKIPPED,
+            )
             return
 
+        start = monotonic()
         ws_data = await self.api_get_webserver(ws, devices)
 
-        update = EntityUpdate(UpdateType.API_FULL, ws_data)
+        update = EntityUpdate(UpdateType.API_FULL, ws_data, start=start)
 
-        await ws.update(update)
+        await self.update_entity(ws, update)
         if devices:
             ws_id = ws.get_id()
             inst_id = ws.get_installation()
@@ -1091,6 +1364,13 @@ class AirzoneCloudApi:
                         "unsupported device_type=%s %s", device_type, device_data
                     )
 
+    def update_query_group(self, group: DeviceGroup) -> None:
+        """Refresh query indexes of DeviceGroup HVAC devices."""
+        for aidoo in group.aidoos.values():
+            self.query.update_device(aidoo)
+        for zone in group.zones.values():
+            self.query.update_device(zone)
+
     async def update_webserver_id(self, ws_id: str, devices: bool) -> None:
         """Update Airzone Cloud WebServer by ID."""
         ws = self.get_webserver_id(ws_id)
@@ -1099,24 +1379,28 @@ class AirzoneCloudApi:
 
     async def update_webservers(self, devices: bool) -> None:
         """Update all Airzone Cloud WebServers."""
-        tasks = []
+        with self.tracer.span("update_webservers"):
+            tasks = []
 
-        for ws in self.webservers.values():
-            tasks += [asyncio.create_task(self.update_webserver(ws, devices))]
+            for ws in self.webservers.values():
+                tasks += [asyncio.create_task(self.update_webserver(ws, devices))]
 
-        await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
 
     async def update_zone(self, zone: Zone) -> None:
         """Update Airzone Cloud Zone from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(zone))
         status_task = asyncio.create_task(self.api_get_device_status(zone))
 
         config_data = await config_task
         status_data = await status_task
 
-        update = EntityUpdate(UpdateType.API_FULL, config_data | status_data)
+        update = EntityUpdate(
+            UpdateType.API_FULL, status_data, config_data, start=start
+        )
 
-        await zone.update(update)
+        await self.update_entity(zone, update)
 
     async def update_zone_id(self, zone_id: str) -> None:
         """Update Airzone Cloud Zone by ID."""
@@ -1135,13 +1419,14 @@ class AirzoneCloudApi:
 
     async def ws_poll_aidoo(self, aidoo: Aidoo) -> None:
         """Poll Airzone Cloud Aidoo config from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(aidoo))
 
         config_data = await config_task
 
-        update = EntityUpdate(UpdateType.API_PARTIAL, config_data)
+        update = EntityUpdate(UpdateType.API_PARTIAL, config_data, start=start)
 
-        await aidoo.update(update)
+        await self.update_entity(aidoo, update)
 
     async def ws_poll_aidoos(self) -> None:
         """Poll all Airzone Cloud Aidoos config."""
@@ -1154,13 +1439,14 @@ class AirzoneCloudApi:
 
     async def ws_poll_air_quality(self, air_quality: AirQuality) -> None:
         """Poll Airzone Cloud Air Quality config from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(air_quality))
 
         config_data = await config_task
 
-        update = EntityUpdate(UpdateType.API_PARTIAL, config_data)
+        update = EntityUpdate(UpdateType.API_PARTIAL, config_data, start=start)
 
-        await air_quality.update(update)
+        await self.update_entity(air_quality, update)
 
     async def ws_poll_air_qualitys(self) -> None:
         """Poll all Airzone Cloud Air Qualitys config."""
@@ -1173,13 +1459,14 @@ class AirzoneCloudApi:
 
     async def ws_poll_output(self, output: Output) -> None:
         """Poll Airzone Cloud Output config from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(output))
 
         config_data = await config_task
 
-        update = EntityUpdate(UpdateType.API_PARTIAL, config_data)
+        update = EntityUpdate(UpdateType.API_PARTIAL, config_data, start=start)
 
-        await output.update(update)
+        await self.update_entity(output, update)
 
     async def ws_poll_outputs(self) -> None:
         """Poll all Airzone Cloud Outputs config."""
@@ -1192,13 +1479,14 @@ class AirzoneCloudApi:
 
     async def ws_poll_system(self, system: System) -> None:
         """Poll Airzone Cloud System config from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(system))
 
         config_data = await config_task
 
-        update = EntityUpdate(UpdateType.API_PARTIAL, config_data)
+        update = EntityUpdate(UpdateType.API_PARTIAL, config_data, start=start)
 
-        await system.update(update)
+        await self.update_entity(system, update)
 
     async def ws_poll_systems(self) -> None:
         """Poll all Airzone Cloud Systems config."""
@@ -1211,13 +1499,14 @@ class AirzoneCloudApi:
 
     async def ws_poll_zone(self, zone: Zone) -> None:
         """Poll Airzone Cloud Zone config from API."""
+        start = monotonic()
         config_task = asyncio.create_task(self.api_get_device_config(zone))
 
         config_data = await config_task
 
-        update = EntityUpdate(UpdateType.API_PARTIAL, config_data)
+        update = EntityUpdate(UpdateType.API_PARTIAL, config_data, start=start)
 
-        await zone.update(update)
+        await self.update_entity(zone, update)
 
     async def ws_poll_zones(self) -> None:
         """WS poll all Airzone Cloud Zones config."""
@@ -1230,55 +1519,113 @@ class AirzoneCloudApi:
 
     async def update_polling(self) -> None:
         """Perform a polling update of Airzone Cloud data."""
-        req_cnt = self.count_api_poll_requests_devices()
-        if req_cnt > REQUESTS_LIMIT:
-            _LOGGER.debug("websockets should be used for %s requests", req_cnt)
-
-        await self.update_webservers(False)
-
-        tasks = [
-            asyncio.create_task(self.update_systems_zones()),
-            asyncio.create_task(self.update_aidoos()),
-            asyncio.create_task(self.update_dhws()),
-            asyncio.create_task(self.update_outputs()),
-        ]
+        with self.tracer.span("update_polling"):
+            req_cnt = self.count_api_poll_requests_devices()
+            if req_cnt > REQUESTS_LIMIT:
+                _LOGGER.debug("websockets should be used for %s requests", req_cnt)
 
-        await asyncio.gather(*tasks)
-
-    async def first_update_websockets(self) -> None:
-        """Perform the first websockets update of Airzone Cloud data."""
-        # Prevent HTTP 429 errors
-        if self.count_ws_poll_requests_devices() <= REQUESTS_LIMIT:
             await self.update_webservers(False)
 
             tasks = [
-                asyncio.create_task(self.ws_poll_aidoos()),
-                asyncio.create_task(self.ws_poll_air_qualitys()),
-                asyncio.create_task(self.ws_poll_outputs()),
-                asyncio.create_task(self.ws_poll_systems()),
-                asyncio.create_task(self.ws_poll_zones()),
+                asyncio.create_task(self.update_systems_zones()),
+                asyncio.create_task(self.update_aidoos()),
+                asyncio.create_task(self.update_dhws()),
+                asyncio.create_task(self.update_outputs()),
             ]
 
             await asyncio.gather(*tasks)
-        elif self.count_poll_requests_webservers() <= REQUESTS_LIMIT:
-            _LOGGER.debug("websockets: only webserver polling")
-            await self.update_webservers(False)
-        else:
-            _LOGGER.debug("websockets: avoid API polling")
 
-    async def update_websockets(self) -> None:
-        """Perform a websockets update of Airzone Cloud data."""
-        if self.websockets_first:
-            await self.first_update_websockets()
-            self.websockets_first = False
+    async def first_update_websockets(self) -> None:
+        """Perform the first websockets update of Airzone Cloud data."""
+        with self.tracer.span("first_update_websockets"):
+            # Prevent HTTP 429 errors
+            if self.count_ws_poll_requests_devices() <= REQUESTS_LIMIT:
+                await self.update_webservers(False)
+
+                tasks = [
+                    asyncio.create_task(self.ws_poll_aidoos()),
+                    asyncio.create_task(self.ws_poll_air_qualitys()),
+                    asyncio.create_task(self.ws_poll_outputs()),
+                    asyncio.create_task(self.ws_poll_systems()),
+                    asyncio.create_task(self.ws_poll_zones()),
+                ]
+
+                await asyncio.gather(*tasks)
+            elif self.count_poll_requests_webservers() <= REQUESTS_LIMIT:
+                _LOGGER.debug("websockets: only webserver polling")
+                await self.update_webservers(False)
+            else:
+                _LOGGER.debug("websockets: avoid API polling")
+
+    async def state_wait_websockets(
+        self, inst_ids: Iterable[str] | None = None
+    ) -> WebSocketsState:
+        """Wait for installations WebSockets initial state concurrently.
+
+        All installations WebSockets are waited for if inst_ids is None.
+        Installations that time out or fail are reported in the returned
+        state instead of raising.
+        """
+        with self.tracer.span("state_wait_websockets"):
+            state = WebSocketsState()
+
+            if inst_ids is None:
+                inst_ids = self.websockets.keys()
+
+            tasks: dict[Task[None], str] = {}
+            for inst_id in inst_ids:
+                inst_ws = self.websockets.get(inst_id)
+                if inst_ws is not None:
+                    tasks[asyncio.create_task(inst_ws.state_wait_end())] = inst_id
+
+            if len(tasks) == 0:
+                return state
+
+            _, pending = await asyncio.wait(tasks, timeout=WS_INIT_TIMEOUT)
+
+            for task in pending:
+                task.cancel()
+            if len(pending) > 0:
+                await asyncio.wait(pending)
+
+            for task, inst_id in tasks.items():
+                if task in pending:
+                    _LOGGER.warning("WS[%s]: initial state timeout", inst_id)
+                    state.timed_out += [inst_id]
+                    continue
+
+                err = task.exception()
+                if err is not None:
+                    _LOGGER.warning("WS[%s]: initial state failed (%s)", inst_id, err)
+                    state.failed[inst_id] = err
+                else:
+                    state.completed += [inst_id]
 
-        for inst_ws in self.websockets.values():
-            if not inst_ws.is_alive():
-                inst_ws.reconnect()
+            return state
 
-            await inst_ws.state_wait()
+    async def update_websockets(self) -> WebSocketsState:
+        """Perform a websockets update of Airzone Cloud data."""
+        with self.tracer.span("update_websockets"):
+            if self.websockets_first:
+                await self.first_update_websockets()
+                self.websockets_first = False
+
+            self.websockets_manager.rebalance()
+
+            for inst_ws in self.websockets.values():
+                if inst_ws.task is None:
+                    inst_ws.connect()
+                elif not inst_ws.is_alive():
+                    inst_ws.reconnect()
+
+            self.websockets_state, _ = await asyncio.gather(
+                self.state_wait_websockets(),
+                self.update_polled_installations(),
+            )
 
-        self.link_devices()
+            self.link_devices()
+
+            return self.websockets_state
 
     async def _update(self) -> None:
         """Update Airzone Cloud data using websockets and fall back to polling."""
@@ -1289,18 +1636,56 @@ class AirzoneCloudApi:
 
     async def update(self) -> None:
         """Update all Airzone Cloud data."""
-
-        if self.token.check_refresh():
+        with self.tracer.span("update"):
+            self._api_budget.start_cycle()
             try:
-                await self.token_refresh()
-            except TokenRefreshError:
-                await self.login()
-
+                if self.token.check_refresh():
+                    with self.tracer.span("token_refresh"):
+                        try:
+                            await self.token_refresh()
+                        except TokenRefreshError:
+                            await self.login()
+
+                try:
+                    await self._update()
+                except LoginError:
+                    with self.tracer.span("login"):
+                        await self.login()
+                    await self._update()
+            finally:
+                self._api_budget.end_cycle()
+
+            self.entity_changes_callback()
+
+    def add_entity_changes(self, entity: Entity, changes: EntityChanges) -> None:
+        """Add Entity changes to pending change events."""
+        self.query.update_changes(entity, changes)
+        self.topology.update_changes(entity, changes)
+        if self.changes_function is not None and len(changes) > 0:
+            event = EntityEvent(entity.get_kind(), entity.get_id(), changes)
+            self.entity_events += [event]
+
+    async def update_entity(self, entity: Entity, update: EntityUpdate) -> None:
+        """Update Entity and add its changes, even if the update failed."""
+        changes: EntityChanges = {}
         try:
-            await self._update()
-        except LoginError:
-            await self.login()
-            await self._update()
+            await entity.update(update, changes)
+        finally:
+            self.add_entity_changes(entity, changes)
+
+    def entity_changes_callback(self) -> None:
+        """Perform change events callback with pending events."""
+        events = self.entity_events
+        if self.changes_function is not None and len(events) > 0:
+            self.entity_events = []
+            self.changes_function(events)
+
+    def set_changes_callback(
+        self, changes_function: Callable[[list[EntityEvent]], None] | None
+    ) -> None:
+        """Set change events callback."""
+        self.changes_function = changes_function
+        self.entity_events = []
 
     async def _update_callback(self) -> None:
         """Perform update callback."""
@@ -1310,6 +1695,8 @@ class AirzoneCloudApi:
 
     def update_callback(self) -> None:
         """Create update callback task."""
+        if self.callback_function is None:
+            return
         asyncio.run_coroutine_threadsafe(self._update_callback(), self.loop)
 
     def set_update_callback(
@@ -2,10 +2,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from enum import IntEnum, StrEnum
 from typing import Any
 
+from .const import (
+    API_URL,
+    AZD_AIDOOS,
+    AZD_AIR_QUALITY,
+    AZD_GROUPS,
+    AZD_HOT_WATERS,
+    AZD_INSTALLATIONS,
+    AZD_OUTPUTS,
+    AZD_SYSTEMS,
+    AZD_WEBSERVERS,
+    AZD_ZONES,
+    RAW_DATA_MAX,
+    WS_URL,
+)
+
+
+class RawDataMode(StrEnum):
+    """Airzone Cloud raw data retention modes."""
+
+    OFF = "off"
+    LATEST = "latest"
+    FULL = "full"
+
 
 @dataclass
 class ConnectionOptions:
@@ -15,6 +39,14 @@ class ConnectionOptions:
     password: str
     device_config: bool = True
     websockets: bool = True
+    websockets_max: int | None = None
+    websockets_record: str | None = None
+    timeseries: int | None = None
+    tracing: bool = False
+    api_url: str = API_URL
+    ws_url: str = WS_URL
+    raw_data: RawDataMode = RawDataMode.FULL
+    raw_data_max: int = RAW_DATA_MAX
 
 
 class AirQualityMode(StrEnum):
@@ -31,6 +63,20 @@ class AirQualityMode(StrEnum):
         return cls.UNKNOWN
 
 
+class EntityKind(StrEnum):
+    """Airzone Cloud entity kinds."""
+
+    AIDOO = AZD_AIDOOS
+    AIR_QUALITY = AZD_AIR_QUALITY
+    GROUP = AZD_GROUPS
+    HOT_WATER = AZD_HOT_WATERS
+    INSTALLATION = AZD_INSTALLATIONS
+    OUTPUT = AZD_OUTPUTS
+    SYSTEM = AZD_SYSTEMS
+    WEBSERVER = AZD_WEBSERVERS
+    ZONE = AZD_ZONES
+
+
 class HotWaterOperation(IntEnum):
     """Airzone Cloud Hot Water operations."""
 
@@ -45,6 +91,60 @@ class HotWaterOperation(IntEnum):
         return cls.UNKNOWN
 
 
+class MergedData(Mapping[str, Any]):
+    """Airzone Cloud read-only merged data view.
+
+    Layers are not copied, later layers take precedence over earlier ones.
+    """
+
+    __slots__ = ("keys_cache", "layers")
+
+    def __init__(self, layers: tuple[Mapping[str, Any], ...]) -> None:
+        """Airzone Cloud Merged Data init."""
+        self.keys_cache: dict[str, None] | None = None
+        self.layers: tuple[Mapping[str, Any], ...] = layers
+
+    def __contains__(self, key: object) -> bool:
+        """Check if key is in any layer."""
+        for layer in self.layers:
+            if key in layer:
+                return True
+        return False
+
+    def __getitem__(self, key: str) -> Any:
+        """Return key value from the topmost layer."""
+        for layer in reversed(self.layers):
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over unique keys."""
+        return iter(self.get_keys())
+
+    def __len__(self) -> int:
+        """Return number of unique keys."""
+        return len(self.get_keys())
+
+    def __repr__(self) -> str:
+        """Return merged data representation."""
+        return repr(dict(self.items()))
+
+    def get_keys(self) -> dict[str, None]:
+        """Return unique keys."""
+        keys = self.keys_cache
+        if keys is None:
+            keys = {}
+            for layer in self.layers:
+                keys.update(dict.fromkeys(layer))
+            self.keys_cache = keys
+        return keys
+
+    def get_layers(self) -> tuple[Mapping[str, Any], ...]:
+        """Return merged data layers."""
+        return self.layers
+
+
 class OperationAction(IntEnum):
     """Airzone Cloud operation actions."""
 
@@ -269,9 +269,75 @@ AZD_ZONES: Final[str] = "zones"
 HEADER_AUTHORIZATION: Final[str] = "Authorization"
 HEADER_BEARER: Final[str] = "Bearer"
 
+BUDGET_CYCLE: Final[str] = "cycle"
+BUDGET_CYCLES: Final[str] = "cycles"
+BUDGET_CYCLES_OVER_LIMIT: Final[str] = "cycles_over_limit"
+BUDGET_ENDPOINTS: Final[str] = "endpoints"
+BUDGET_INSTALLATIONS: Final[str] = "installations"
+BUDGET_ISSUED: Final[str] = "issued"
+BUDGET_LIMIT: Final[str] = "limit"
+BUDGET_MAX_CYCLES: Final[int] = 64
+BUDGET_MAX_ISSUED: Final[str] = "max_issued"
+BUDGET_OVER_LIMIT: Final[str] = "over_limit"
+BUDGET_TIME: Final[str] = "time"
+BUDGET_WINDOW: Final[float] = 3600.0
+BUDGET_WINDOW_DATA: Final[str] = "window"
+
 HTTP_CALL_TIMEOUT: Final[int] = 90
 HTTP_MAX_REQUESTS: Final[int] = 4
+HTTP_RATE_BURST: Final[int] = 16
+HTTP_RATE_LIMIT: Final[float] = 4.0
+
+MANAGER_MAX_REQUESTS: Final[int] = 64
+MANAGER_RATE_BURST: Final[int] = 64
+MANAGER_RATE_LIMIT: Final[float] = 32.0
+# Golden ratio conjugate, spreads account updates over the interval
+MANAGER_SCHEDULE_SPREAD: Final[float] = 0.6180339887498949
+MANAGER_UPDATE_INTERVAL: Final[int] = 60
+
+METRICS_HISTOGRAM: Final[tuple[float, ...]] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+METRICS_HISTOGRAM_API: Final[tuple[float, ...]] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+METRICS_ACCOUNTS: Final[str] = "accounts"
+METRICS_ACTIVE: Final[str] = "active"
+METRICS_API: Final[str] = "api"
+METRICS_BUCKETS: Final[str] = "buckets"
+METRICS_BUCKETS_INF: Final[str] = "+Inf"
+METRICS_COUNT: Final[str] = "count"
+METRICS_ERRORS: Final[str] = "errors"
+METRICS_LIMITER: Final[str] = "limiter"
+METRICS_MAX: Final[str] = "max"
+METRICS_MIN: Final[str] = "min"
+METRICS_P50: Final[str] = "p50"
+METRICS_P90: Final[str] = "p90"
+METRICS_P99: Final[str] = "p99"
+METRICS_RATE: Final[str] = "rate"
+METRICS_SUM: Final[str] = "sum"
+METRICS_TIME: Final[str] = "time"
+METRICS_UPDATES: Final[str] = "updates"
+METRICS_WEBSOCKETS: Final[str] = "websockets"
 
+RAW_DATA_MAX: Final[int] = 256
 RAW_DEVICES_CONFIG: Final[str] = "devices-config"
 RAW_DEVICES_STATUS: Final[str] = "devices-status"
 RAW_INSTALLATIONS: Final[str] = "installations"
@@ -279,9 +345,17 @@ RAW_INSTALLATIONS_LIST: Final[str] = "installations-list"
 RAW_USER: Final[str] = "user"
 RAW_WEBSERVERS: Final[str] = "webservers"
 RAW_WEBSOCKETS: Final[str] = "websockets"
+RAW_WEBSOCKETS_STATS: Final[str] = "websockets-stats"
 
 REQUESTS_LIMIT: Final[int] = 16
 
+RUNNER_POLL_TIMEOUT: Final[float] = 1.0
+RUNNER_VNODES: Final[int] = 64
+
+TIMESERIES_CAPACITY: Final[int] = 1440
+
+TRACING_MAX_TRACES: Final[int] = 16
+
 TOKEN_REFRESH_PERIOD: Final[timedelta] = timedelta(hours=12)
 
 WS_ADV_CONF: Final[str] = "adv_conf"
@@ -293,11 +367,27 @@ WS_CORR_ID: Final[str] = "corrId"
 WS_DEVICE_STATE: Final[str] = "DEVICE_STATE"
 WS_DEVICE_STATE_END: Final[str] = "DEVICE_STATE_END"
 WS_DEVICES_UPDATES: Final[str] = "DEVICES_UPDATES"
+WS_DISPATCH_CACHE: Final[int] = 256
+WS_DISPATCH_UNKNOWN: Final[str] = "unknown"
 WS_EVENT: Final[str] = "event"
 WS_INIT_TIMEOUT: Final[int] = 15
 WS_INSTALLATION: Final[str] = "installation"
 WS_INSTALLATION_ID: Final[str] = "installationId"
 WS_JWT: Final[str] = "jwt"
+WS_RECORD_DATA: Final[str] = "d"
+WS_RECORD_EXT: Final[str] = "jsonl"
+WS_RECORD_TIME: Final[str] = "t"
+WS_RECORD_TYPE: Final[str] = "m"
+WS_STATS_BYTES: Final[str] = "bytes"
+WS_STATS_DEVICES: Final[str] = "devices"
+WS_STATS_FRAMES: Final[str] = "frames"
+WS_STATS_HANDLER_LATENCY: Final[str] = "handler-latency"
+WS_STATS_LAST_FRAME_AGE: Final[str] = "last-frame-age"
+WS_STATS_PERIOD: Final[int] = 60
+WS_STATS_RATES: Final[str] = "rates"
+WS_STATS_RECONNECTS: Final[str] = "reconnects"
+WS_STATS_SAMPLES: Final[int] = 1024
+WS_STATS_STATE_DURATION: Final[str] = "state-duration"
 WS_STATUS: Final[str] = "status"
 WS_URL: Final[str] = f"wss://{AIRZONE_SERVER}"
 WS_WEBSERVER_UPDATES: Final[str] = "WEBSERVER_UPDATES"
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from .common import OperationMode, parse_bool, parse_int, parse_str
 from .const import (
@@ -52,8 +52,11 @@ from .const import (
     AZD_WARNINGS,
     AZD_WEBSERVER,
     AZD_WS_CONNECTED,
+    TIMESERIES_CAPACITY,
 )
-from .entity import Entity, EntityUpdate
+from .entity import Entity, EntityChanges, EntityUpdate, UpdateType
+from .fields import FieldSpec, FieldTable
+from .timeseries import EntityTimeSeries, SeriesSpec, TimeSeries
 
 if TYPE_CHECKING:
     from .air_quality import AirQuality
@@ -61,9 +64,114 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def parse_modes(data: Any) -> list[OperationMode] | None:
+    """Convert data to operation modes list."""
+    if len(data) > 0:
+        return [OperationMode(mode) for mode in data]
+    return None
+
+
+DEVICE_FIELDS = FieldTable(
+    [
+        FieldSpec(None, "available", azd_key=AZD_AVAILABLE, always=True),
+        FieldSpec(
+            API_DOUBLE_SET_POINT,
+            "double_set_point",
+            parse_bool,
+            azd_key=AZD_DOUBLE_SET_POINT,
+            always=True,
+        ),
+        FieldSpec(None, "id", azd_key=AZD_ID, always=True),
+        FieldSpec(
+            None,
+            "installation_id",
+            azd_key=AZD_INSTALLATION,
+            getter="get_installation",
+            always=True,
+        ),
+        FieldSpec(
+            API_IS_CONNECTED,
+            "is_connected",
+            parse_bool,
+            azd_key=AZD_IS_CONNECTED,
+            always=True,
+        ),
+        FieldSpec(None, "name", azd_key=AZD_NAME, always=True),
+        FieldSpec(None, "problems", azd_key=AZD_PROBLEMS, always=True),
+        FieldSpec(
+            None,
+            "webserver_id",
+            azd_key=AZD_WEBSERVER,
+            getter="get_webserver",
+            always=True,
+        ),
+        FieldSpec(
+            API_WS_CONNECTED,
+            "ws_connected",
+            parse_bool,
+            azd_key=AZD_WS_CONNECTED,
+            always=True,
+        ),
+        FieldSpec(API_AQ_ACTIVE, "aq_active", parse_bool, azd_key=AZD_AQ_ACTIVE),
+        FieldSpec(None, "aq_index", azd_key=AZD_AQ_INDEX),
+        FieldSpec(API_AQ_PM_1, "aq_pm_1", parse_int, azd_key=AZD_AQ_PM_1),
+        FieldSpec(API_AQ_PM_2P5, "aq_pm_2p5", parse_int, azd_key=AZD_AQ_PM_2P5),
+        FieldSpec(API_AQ_PM_10, "aq_pm_10", parse_int, azd_key=AZD_AQ_PM_10),
+        FieldSpec(API_AQ_PRESENT, "aq_present", parse_bool, azd_key=AZD_AQ_PRESENT),
+        FieldSpec(API_AQ_QUALITY, "aq_status", parse_str, azd_key=AZD_AQ_STATUS),
+        FieldSpec(
+            API_DUAL_SP_CONF, "dual_sp_conf", parse_bool, azd_key=AZD_DUAL_SP_CONF
+        ),
+        FieldSpec(API_ERRORS, "errors", list, azd_key=AZD_ERRORS),
+        FieldSpec(API_MODE, "mode", OperationMode, azd_key=AZD_MODE),
+        FieldSpec(
+            API_AUTO_MODE,
+            "auto_mode",
+            OperationMode,
+            azd_key=AZD_MODE_AUTO,
+            getter="get_mode_auto",
+        ),
+        FieldSpec(API_MODE_AVAIL, "modes", parse_modes, azd_key=AZD_MODES),
+        FieldSpec(
+            API_SIMULATOR_MODE,
+            "simulator_mode",
+            parse_bool,
+            azd_key=AZD_SIMULATOR_MODE,
+        ),
+        FieldSpec(API_WARNINGS, "warnings", list, azd_key=AZD_WARNINGS),
+    ]
+)
+
+
 class Device(Entity):
     """Airzone Cloud Device."""
 
+    __slots__ = (
+        "air_quality",
+        "aq_active",
+        "aq_pm_1",
+        "aq_pm_10",
+        "aq_pm_2p5",
+        "aq_present",
+        "aq_status",
+        "auto_mode",
+        "double_set_point",
+        "dual_sp_conf",
+        "errors",
+        "installation_id",
+        "is_connected",
+        "mode",
+        "modes",
+        "simulator_mode",
+        "timeseries",
+        "warnings",
+        "webserver_id",
+        "ws_connected",
+    )
+
+    fields = DEVICE_FIELDS
+    series: ClassVar[tuple[SeriesSpec, ...]] = ()
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud Device init."""
         super().__init__()
@@ -85,6 +193,7 @@ class Device(Entity):
         self.modes: list[OperationMode] = []
         self.name: str = "Device"
         self.simulator_mode: bool | None = None
+        self.timeseries: EntityTimeSeries | None = None
         self.warnings: list[str] = []
         self.webserver_id = ws_id
         self.ws_connected: bool = True
@@ -111,75 +220,12 @@ class Device(Entity):
 
     def data(self) -> dict[str, Any]:
         """Return Device data."""
-        data: dict[str, Any] = {
-            AZD_AVAILABLE: self.get_available(),
-            AZD_DOUBLE_SET_POINT: self.get_double_set_point(),
-            AZD_ID: self.get_id(),
-            AZD_INSTALLATION: self.get_installation(),
-            AZD_IS_CONNECTED: self.get_is_connected(),
-            AZD_NAME: self.get_name(),
-            AZD_PROBLEMS: self.get_problems(),
-            AZD_WEBSERVER: self.get_webserver(),
-            AZD_WS_CONNECTED: self.get_ws_connected(),
-        }
-
-        aq_active = self.get_aq_active()
-        if aq_active is not None:
-            data[AZD_AQ_ACTIVE] = aq_active
-
-        aq_index = self.get_aq_index()
-        if aq_index is not None:
-            data[AZD_AQ_INDEX] = aq_index
-
-        aq_pm_1 = self.get_aq_pm_1()
-        if aq_pm_1 is not None:
-            data[AZD_AQ_PM_1] = aq_pm_1
-
-        aq_pm_2p5 = self.get_aq_pm_2p5()
-        if aq_pm_2p5 is not None:
-            data[AZD_AQ_PM_2P5] = aq_pm_2p5
-
-        aq_pm_10 = self.get_aq_pm_10()
-        if aq_pm_10 is not None:
-            data[AZD_AQ_PM_10] = aq_pm_10
-
-        aq_present = self.get_aq_present()
-        if aq_present is not None:
-            data[AZD_AQ_PRESENT] = aq_present
-
-        aq_status = self.get_aq_status()
-        if aq_status is not None:
-            data[AZD_AQ_STATUS] = aq_status
-
-        dual_sp_conf = self.get_dual_sp_conf()
-        if dual_sp_conf is not None:
-            data[AZD_DUAL_SP_CONF] = dual_sp_conf
-
-        errors = self.get_errors()
-        if len(errors) > 0:
-            data[AZD_ERRORS] = errors
-
-        mode = self.get_mode()
-        if mode is not None:
-            data[AZD_MODE] = mode
-
-        mode_auto = self.get_mode_auto()
-        if mode_auto is not None:
-            data[AZD_MODE_AUTO] = mode_auto
-
-        modes = self.get_modes()
-        if modes is not None:
-            data[AZD_MODES] = modes
-
-        simulator_mode = self.get_simulator_mode()
-        if simulator_mode is not None:
-            data[AZD_SIMULATOR_MODE] = simulator_mode
-
-        warnings = self.get_warnings()
-        if len(warnings) > 0:
-            data[AZD_WARNINGS] = warnings
+        return self.fields.data(self, {})
 
-        return data
+    def enable_timeseries(self, capacity: int = TIMESERIES_CAPACITY) -> None:
+        """Enable Device metrics time series."""
+        if self.timeseries is None and len(self.series) > 0:
+            self.timeseries = EntityTimeSeries(self.series, capacity)
 
     def get_aq_active(self) -> bool | None:
         """Return HVAC device Air Quality active status."""
@@ -282,6 +328,12 @@ class Device(Entity):
         """Return Device simulator mode."""
         return self.simulator_mode
 
+    def get_timeseries(self, name: str) -> TimeSeries | None:
+        """Return Device metric time series."""
+        if self.timeseries is not None:
+            return self.timeseries.get_series(name)
+        return None
+
     def get_warnings(self) -> list[str]:
         """Return Device warnings."""
         return self.warnings
@@ -296,7 +348,10 @@ class Device(Entity):
 
     def set_air_quality(self, air_quality: AirQuality) -> None:
         """Set Air Quality."""
-        self.air_quality = air_quality
+        if self.air_quality is not air_quality:
+            self.air_quality = air_quality
+            air_quality.add_dependent(self)
+            self.set_dirty()
 
     def set_mode(self, mode: int | OperationMode) -> None:
         """Set device operation mode."""
@@ -310,75 +365,19 @@ class Device(Entity):
     def set_param(self, param: str, data: dict[str, Any]) -> None:
         """Update device parameter from API request."""
 
+    async def update(
+        self, update: EntityUpdate, changes: EntityChanges | None = None
+    ) -> EntityChanges:
+        """Update Device and record metrics time series."""
+        changes = await super().update(update, changes)
+        if self.timeseries is not None and len(changes) > 0:
+            self.timeseries.add_changes(
+                self, changes, update.get_datetime().timestamp()
+            )
+        return changes
+
     def update_data(self, update: EntityUpdate) -> None:
         """Update Device data."""
-        data = update.get_data()
-
-        is_connected = parse_bool(data.get(API_IS_CONNECTED))
-        if is_connected is not None:
-            self.is_connected = is_connected
-        ws_connected = parse_bool(data.get(API_WS_CONNECTED))
-        if ws_connected is not None:
-            self.ws_connected = ws_connected
-
-        aq_active = parse_bool(data.get(API_AQ_ACTIVE))
-        if aq_active is not None:
-            self.aq_active = aq_active
-
-        aq_pm_1 = parse_int(data.get(API_AQ_PM_1))
-        if aq_pm_1 is not None:
-            self.aq_pm_1 = aq_pm_1
-
-        aq_pm_2p5 = parse_int(data.get(API_AQ_PM_2P5))
-        if aq_pm_2p5 is not None:
-            self.aq_pm_2p5 = aq_pm_2p5
-
-        aq_pm_10 = parse_int(data.get(API_AQ_PM_10))
-        if aq_pm_10 is not None:
-            self.aq_pm_10 = aq_pm_10
-
-        aq_present = parse_bool(data.get(API_AQ_PRESENT))
-        if aq_present is not None:
-            self.aq_present = aq_present
-
-        aq_status = parse_str(data.get(API_AQ_QUALITY))
-        if aq_status is not None:
-            self.aq_status = aq_status
-
-        auto_mode = data.get(API_AUTO_MODE)
-        if auto_mode is not None:
-            self.auto_mode = OperationMode(auto_mode)
-
-        double_set_point = parse_bool(data.get(API_DOUBLE_SET_POINT))
-        if double_set_point is not None:
-            self.double_set_point = double_set_point
-
-        dual_sp_conf = parse_bool(data.get(API_DUAL_SP_CONF))
-        if dual_sp_conf is not None:
-            self.dual_sp_conf = dual_sp_conf
-
-        errors = data.get(API_ERRORS)
-        if errors is not None:
-            self.errors = []
-            for error in errors:
-                self.errors += [error]
-
-        mode = data.get(API_MODE)
-        if mode is not None:
-            self.mode = OperationMode(mode)
-        mode_avail = data.get(API_MODE_AVAIL)
-        if mode_avail is not None and len(mode_avail) > 0:
-            modes = []
-            for mode in mode_avail:
-                modes += [OperationMode(mode)]
-            self.modes = modes
-
-        simulator_mode = parse_bool(data.get(API_SIMULATOR_MODE))
-        if simulator_mode is not None:
-            self.simulator_mode = simulator_mode
-
-        warnings = data.get(API_WARNINGS)
-        if warnings is not None:
-            self.warnings = []
-            for warning in warnings:
-                self.warnings += [warning]
+        self.fields.update(
+            self, update.get_data(), update.get_type() != UpdateType.WS_PARTIAL
+        )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from abc import ABC
 from collections import Counter
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, Final, NamedTuple, cast
 
 from .aidoo import Aidoo
 from .air_quality import AirQuality
@@ -35,24 +35,189 @@ from .const import (
     AZD_TEMP_STEP,
     AZD_ZONES,
 )
+from .device import Device
+from .entity import EntityData
 from .hotwater import HotWater
+from .hvac import HVAC
 from .output import Output
 from .system import System
 from .zone import Zone
 
+# Any finite float is a multiple of 2**-1074
+AVERAGE_SHIFT: Final[int] = 1074
+
+
+class HVACValues(NamedTuple):
+    """Airzone Cloud HVAC values aggregated by DeviceGroups."""
+
+    action: OperationAction
+    active: bool | None
+    available: bool
+    humidity: int | None
+    mode: OperationMode | None
+    modes: tuple[OperationMode, ...]
+    power: bool | None
+    temp: float | None
+    temp_set: float | None
+    temp_set_max: float | None
+    temp_set_min: float | None
+
+    @classmethod
+    def from_hvac(cls, hvac: HVAC) -> HVACValues:
+        """Return HVAC aggregated values."""
+        return cls(
+            hvac.get_action(),
+            hvac.get_active(),
+            hvac.get_available(),
+            hvac.get_humidity(),
+            hvac.get_mode(),
+            tuple(hvac.get_modes() or ()),
+            hvac.get_power(),
+            hvac.get_temperature(),
+            hvac.get_temp_set(),
+            hvac.get_temp_set_max(),
+            hvac.get_temp_set_min(),
+        )
+
+
+class AverageValue:
+    """Airzone Cloud running average.
+
+    The total is kept as an exact fixed-point integer so that removing
+    values doesn't accumulate floating point errors. The average is the
+    exact mean rounded once to a float, so it can differ in the last bit
+    from a float sum divided by the count, which depends on member order.
+    When the mean is a decimal halfway value, such as 22.05, this can change
+    the rounding to one decimal (22.1 instead of 22.0).
+    """
+
+    __slots__ = (
+        "count",
+        "total",
+    )
 
-class DeviceGroup(ABC):
+    def __init__(self) -> None:
+        """Airzone Cloud Average Value init."""
+        self.count: int = 0
+        self.total: int = 0
+
+    def add(self, value: float | None, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) value from average."""
+        if value is not None:
+            num, den = float(value).as_integer_ratio()
+            self.count += sign
+            self.total += sign * (num << (AVERAGE_SHIFT + 1 - den.bit_length()))
+
+    def get(self) -> float | None:
+        """Return average value."""
+        if self.count > 0:
+            return self.total / (self.count << AVERAGE_SHIFT)
+        return None
+
+
+class DeviceGroupAggregates:
+    """Airzone Cloud DeviceGroup running aggregates.
+
+    Values are kept as counters and running sums so that group getters
+    don't depend on the number of member devices. Ties between the most
+    common values are resolved by member order, as before.
+    """
+
+    __slots__ = (
+        "action",
+        "active",
+        "available",
+        "humidity",
+        "mode",
+        "power",
+        "temp",
+        "temp_set",
+        "temp_set_max",
+        "temp_set_min",
+    )
+
+    def __init__(self) -> None:
+        """Airzone Cloud DeviceGroup Aggregates init."""
+        self.action: Counter[OperationAction] = Counter()
+        self.active: Counter[bool] = Counter()
+        self.available: int = 0
+        self.humidity: AverageValue = AverageValue()
+        self.mode: Counter[OperationMode] = Counter()
+        self.power: Counter[bool] = Counter()
+        self.temp: AverageValue = AverageValue()
+        self.temp_set: AverageValue = AverageValue()
+        self.temp_set_max: AverageValue = AverageValue()
+        self.temp_set_min: AverageValue = AverageValue()
+
+    def add(self, values: HVACValues, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) HVAC values from aggregates."""
+        count_value(self.action, values.action, sign)
+        count_value(self.active, values.active, sign)
+        if values.available:
+            self.available += sign
+        self.humidity.add(values.humidity, sign)
+        count_value(self.mode, values.mode, sign)
+        count_value(self.power, values.power, sign)
+        self.temp.add(values.temp, sign)
+        self.temp_set.add(values.temp_set, sign)
+        self.temp_set_max.add(values.temp_set_max, sign)
+        self.temp_set_min.add(values.temp_set_min, sign)
+
+
+def count_value(counter: Counter[Any], value: Any, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) value from counter."""
+    if value is not None:
+        cnt = counter[value] + sign
+        if cnt > 0:
+            counter[value] = cnt
+        else:
+            del counter[value]
+
+
+def most_common(counter: Counter[Any], exclude: tuple[Any, ...]) -> list[Any]:
+    """Return most common counter values not excluded."""
+    values: list[Any] = []
+    values_cnt = 0
+    for key, cnt in counter.items():
+        if key in exclude or cnt < values_cnt:
+            continue
+        if cnt > values_cnt:
+            values = []
+            values_cnt = cnt
+        values += [key]
+    return values
+
+
+class DeviceGroup(EntityData):
     """Airzone Cloud DeviceGroup."""
 
+    __slots__ = (
+        "aggregates",
+        "aidoos",
+        "air_quality",
+        "dhws",
+        "hvacs",
+        "id",
+        "modes",
+        "name",
+        "outputs",
+        "systems",
+        "zones",
+    )
+
     id: str
     name: str
 
     def __init__(self) -> None:
         """Airzone Cloud DeviceGroup init."""
+        super().__init__()
 
+        self.aggregates: DeviceGroupAggregates = DeviceGroupAggregates()
         self.aidoos: dict[str, Aidoo] = {}
         self.air_quality: dict[str, AirQuality] = {}
         self.dhws: dict[str, HotWater] = {}
+        self.hvacs: dict[str, HVACValues] = {}
+        self.modes: list[OperationMode] | None = None
         self.outputs: dict[str, Output] = {}
         self.systems: dict[str, System] = {}
         self.zones: dict[str, Zone] = {}
@@ -107,107 +272,103 @@ class DeviceGroup(ABC):
 
         return data
 
-    def get_action(self) -> OperationAction:
-        """Return DeviceGroup action."""
-        action_values: list[OperationAction] = []
-        for aidoo in self.aidoos.values():
-            action_values += [aidoo.get_action()]
-        for zone in self.zones.values():
-            action_values += [zone.get_action()]
-        if len(action_values) > 0:
-            action_cnt = Counter(action_values)
-            idle_cnt = action_cnt[OperationAction.IDLE]
-            del action_cnt[OperationAction.IDLE]
-            del action_cnt[OperationAction.OFF]
-            action_mc = action_cnt.most_common(1)
-            if len(action_mc) > 0:
-                return action_mc[0][0]
-            if idle_cnt > 0:
-                return OperationAction.IDLE
-        return OperationAction.OFF
-
-    def get_active(self) -> bool | None:
-        """Return DeviceGroup active status."""
-        active_values: list[bool] = []
-        for aidoo in self.aidoos.values():
-            active = aidoo.get_active()
-            if active is not None:
-                active_values += [active]
-        for zone in self.zones.values():
-            active = zone.get_active()
-            if active is not None:
-                active_values += [active]
-        if len(active_values) > 0:
-            if True in active_values:
-                return True
-            if False in active_values:
-                return False
-        return None
-
     def add_aidoo(self, aidoo: Aidoo) -> None:
         """Add Aidoo to DeviceGroup."""
         aidoo_id = aidoo.get_id()
         if aidoo_id not in self.aidoos:
             self.aidoos[aidoo_id] = aidoo
+            aidoo.add_dependent(self)
+            self.update_hvac(aidoo)
+            self.set_dirty()
 
     def add_air_quality(self, air_quality: AirQuality) -> None:
         """Add Air Quality to DeviceGroup."""
         air_quality_id = air_quality.get_id()
         if air_quality_id not in self.air_quality:
             self.air_quality[air_quality_id] = air_quality
+            self.set_dirty()
 
     def add_dhw(self, dhw: HotWater) -> None:
         """Add DHW to DeviceGroup."""
         dhw_id = dhw.get_id()
         if dhw_id not in self.dhws:
             self.dhws[dhw_id] = dhw
+            self.set_dirty()
 
     def add_output(self, output: Output) -> None:
         """Add Output to DeviceGroup."""
         output_id = output.get_id()
         if output_id not in self.outputs:
             self.outputs[output_id] = output
+            self.set_dirty()
 
     def add_system(self, system: System) -> None:
         """Add System to DeviceGroup."""
         system_id = system.get_id()
         if system_id not in self.systems:
             self.systems[system_id] = system
+            self.set_dirty()
 
     def add_zone(self, zone: Zone) -> None:
         """Add Zone to DeviceGroup."""
         zone_id = zone.get_id()
         if zone_id not in self.zones:
             self.zones[zone_id] = zone
+            zone.add_dependent(self)
+            self.update_hvac(zone)
+            self.set_dirty()
+
+    def get_action(self) -> OperationAction:
+        """Return DeviceGroup action."""
+        action_cnt = self.aggregates.action
+        actions = most_common(action_cnt, (OperationAction.IDLE, OperationAction.OFF))
+        if len(actions) > 0:
+            return cast(OperationAction, self.get_first_value("action", actions))
+        if action_cnt[OperationAction.IDLE] > 0:
+            return OperationAction.IDLE
+        return OperationAction.OFF
+
+    def get_active(self) -> bool | None:
+        """Return DeviceGroup active status."""
+        return get_any(self.aggregates.active)
 
     def get_available(self) -> bool:
         """Return DeviceGroup availability status."""
-        for aidoo in self.aidoos.values():
-            if aidoo.get_available():
-                return True
-        for zone in self.zones.values():
-            if zone.get_available():
-                return True
-        return False
+        return self.aggregates.available > 0
+
+    def get_devices(self) -> Iterator[Device]:
+        """Return DeviceGroup devices."""
+        yield from self.aidoos.values()
+        yield from self.air_quality.values()
+        yield from self.dhws.values()
+        yield from self.outputs.values()
+        yield from self.systems.values()
+        yield from self.zones.values()
 
     def get_devices_num(self) -> int:
         """Return DeviceGroup devices count."""
         return len(self.aidoos) + len(self.zones)
 
+    def get_first_value(self, field: str, values: list[Any]) -> Any:
+        """Return first member value out of several tied values."""
+        if len(values) > 1:
+            for hvac_values in self.get_hvac_values():
+                value = getattr(hvac_values, field)
+                if value in values:
+                    return value
+        return values[0]
+
+    def get_hvac_values(self) -> Iterator[HVACValues]:
+        """Return Aidoos and Zones aggregated values."""
+        for aidoo_id in self.aidoos:
+            yield self.hvacs[aidoo_id]
+        for zone_id in self.zones:
+            yield self.hvacs[zone_id]
+
     def get_humidity(self) -> int | None:
         """Return DeviceGroup humidity."""
-        humidity: int | float | None
-        humidity_values: list[int] = []
-        for aidoo in self.aidoos.values():
-            humidity = aidoo.get_humidity()
-            if humidity is not None:
-                humidity_values += [humidity]
-        for zone in self.zones.values():
-            humidity = zone.get_humidity()
-            if humidity is not None:
-                humidity_values += [humidity]
-        if len(humidity_values) > 0:
-            humidity = sum(humidity_values) / len(humidity_values)
+        humidity = self.aggregates.humidity.get()
+        if humidity is not None:
             return int(humidity)
         return None
 
@@ -217,38 +378,23 @@ class DeviceGroup(ABC):
 
     def get_mode(self) -> OperationMode | None:
         """Return DeviceGroup mode."""
-        mode_values: list[OperationMode] = []
-        for aidoo in self.aidoos.values():
-            mode = aidoo.get_mode()
-            if mode is not None:
-                mode_values += [mode]
-        for zone in self.zones.values():
-            mode = zone.get_mode()
-            if mode is not None:
-                mode_values += [mode]
-        if len(mode_values) > 0:
-            mode_cnt = Counter(mode_values)
-            del mode_cnt[OperationMode.STOP]
-            mode_mc = mode_cnt.most_common(1)
-            if len(mode_mc) > 0:
-                return mode_mc[0][0]
+        modes = most_common(self.aggregates.mode, (OperationMode.STOP,))
+        if len(modes) > 0:
+            return cast(OperationMode, self.get_first_value("mode", modes))
         return OperationMode.STOP
 
     def get_modes(self) -> list[OperationMode] | None:
         """Return DeviceGroup modes."""
-        mode_values: list[OperationMode] = []
-        for aidoo in self.aidoos.values():
-            modes = aidoo.get_modes() or []
-            for mode in modes:
-                if mode not in mode_values:
-                    mode_values += [mode]
-        for zone in self.zones.values():
-            modes = zone.get_modes() or []
-            for mode in modes:
-                if mode not in mode_values:
-                    mode_values += [mode]
-        if len(mode_values) > 0:
-            return mode_values
+        modes = self.modes
+        if modes is None:
+            modes = []
+            for values in self.get_hvac_values():
+                for mode in values.modes:
+                    if mode not in modes:
+                        modes += [mode]
+            self.modes = modes
+        if len(modes) > 0:
+            return modes
         return None
 
     def get_name(self) -> str:
@@ -257,85 +403,23 @@ class DeviceGroup(ABC):
 
     def get_power(self) -> bool | None:
         """Return DeviceGroup power status."""
-        power_values: list[bool] = []
-        for aidoo in self.aidoos.values():
-            power = aidoo.get_power()
-            if power is not None:
-                power_values += [power]
-        for zone in self.zones.values():
-            power = zone.get_power()
-            if power is not None:
-                power_values += [power]
-        if len(power_values) > 0:
-            if True in power_values:
-                return True
-            if False in power_values:
-                return False
-        return None
+        return get_any(self.aggregates.power)
 
     def get_temperature(self) -> float | None:
         """Return DeviceGroup temperature."""
-        temp_values: list[float] = []
-        for aidoo in self.aidoos.values():
-            temp = aidoo.get_temperature()
-            if temp is not None:
-                temp_values += [temp]
-        for zone in self.zones.values():
-            temp = zone.get_temperature()
-            if temp is not None:
-                temp_values += [temp]
-        if len(temp_values) > 0:
-            temp = sum(temp_values) / len(temp_values)
-            return round(temp, 1)
-        return None
+        return round_average(self.aggregates.temp)
 
     def get_temp_set(self) -> float | None:
         """Return DeviceGroup setpoint."""
-        temp_set_values: list[float] = []
-        for aidoo in self.aidoos.values():
-            temp_set = aidoo.get_temp_set()
-            if temp_set is not None:
-                temp_set_values += [temp_set]
-        for zone in self.zones.values():
-            temp_set = zone.get_temp_set()
-            if temp_set is not None:
-                temp_set_values += [temp_set]
-        if len(temp_set_values) > 0:
-            temp_set = sum(temp_set_values) / len(temp_set_values)
-            return round(temp_set, 1)
-        return None
+        return round_average(self.aggregates.temp_set)
 
     def get_temp_set_max(self) -> float | None:
         """Return DeviceGroup max setpoint."""
-        temp_set_max_values: list[float] = []
-        for aidoo in self.aidoos.values():
-            temp_set_max = aidoo.get_temp_set_max()
-            if temp_set_max is not None:
-                temp_set_max_values += [temp_set_max]
-        for zone in self.zones.values():
-            temp_set_max = zone.get_temp_set_max()
-            if temp_set_max is not None:
-                temp_set_max_values += [temp_set_max]
-        if len(temp_set_max_values) > 0:
-            temp_set_max = sum(temp_set_max_values) / len(temp_set_max_values)
-            return round(temp_set_max, 1)
-        return None
+        return round_average(self.aggregates.temp_set_max)
 
     def get_temp_set_min(self) -> float | None:
         """Return DeviceGroup min setpoint."""
-        temp_set_min_values: list[float] = []
-        for aidoo in self.aidoos.values():
-            temp_set_min = aidoo.get_temp_set_min()
-            if temp_set_min is not None:
-                temp_set_min_values += [temp_set_min]
-        for zone in self.zones.values():
-            temp_set_min = zone.get_temp_set_min()
-            if temp_set_min is not None:
-                temp_set_min_values += [temp_set_min]
-        if len(temp_set_min_values) > 0:
-            temp_set_min = sum(temp_set_min_values) / len(temp_set_min_values)
-            return round(temp_set_min, 1)
-        return None
+        return round_average(self.aggregates.temp_set_min)
 
     def get_temp_step(self) -> float | None:
         """Return DeviceGroup temperature step."""
@@ -353,3 +437,39 @@ class DeviceGroup(ABC):
                 aidoo.set_param(param, data)
             for zone in self.zones.values():
                 zone.set_param(param, data)
+
+    def update_dependency(self, entity: EntityData) -> None:
+        """Handle changes of a DeviceGroup member."""
+        if isinstance(entity, HVAC):
+            self.update_hvac(entity)
+        super().update_dependency(entity)
+
+    def update_hvac(self, hvac: HVAC) -> None:
+        """Update DeviceGroup aggregates with HVAC values."""
+        hvac_id = hvac.get_id()
+        values = HVACValues.from_hvac(hvac)
+        cur = self.hvacs.get(hvac_id)
+        if cur != values:
+            if cur is not None:
+                self.aggregates.add(cur, -1)
+            self.aggregates.add(values, 1)
+            self.hvacs[hvac_id] = values
+            if cur is None or cur.modes != values.modes:
+                self.modes = None
+
+
+def get_any(counter: Counter[bool]) -> bool | None:
+    """Return True if any value is True, False if any is False or None."""
+    if counter[True] > 0:
+        return True
+    if counter[False] > 0:
+        return False
+    return None
+
+
+def round_average(value: AverageValue) -> float | None:
+    """Return average value rounded to one decimal."""
+    avg = value.get()
+    if avg is not None:
+        return round(avg, 1)
+    return None
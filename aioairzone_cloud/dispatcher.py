@@ -0,0 +1,112 @@
+"""Airzone Cloud WebSockets event dispatcher."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import logging
+from time import perf_counter
+from typing import Any
+
+from aiohttp import ClientWebSocketResponse
+
+from .const import WS_DISPATCH_CACHE, WS_DISPATCH_UNKNOWN, WS_EVENT
+from .metrics import EventMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+WebSocketsHandler = Callable[[ClientWebSocketResponse, dict[str, Any]], Awaitable[None]]
+
+
+class WebSocketsDispatcher:
+    """Airzone Cloud WebSockets event dispatcher."""
+
+    def __init__(self) -> None:
+        """Airzone Cloud WebSockets Dispatcher init."""
+        self.cache: dict[str, tuple[str, WebSocketsHandler] | None] = {}
+        self.events: dict[str, WebSocketsHandler] = {}
+        self.metrics: dict[str, EventMetrics] = {}
+        self.prefixes: dict[str, WebSocketsHandler] = {}
+
+    def register(
+        self, event: str, handler: WebSocketsHandler, prefix: bool = False
+    ) -> None:
+        """Register WebSockets event handler."""
+        if prefix:
+            self.prefixes[event] = handler
+            # Longest prefixes must be checked first
+            self.prefixes = dict(
+                sorted(self.prefixes.items(), key=lambda item: -len(item[0]))
+            )
+        else:
+            self.events[event] = handler
+        self.cache.clear()
+
+    def unregister(self, event: str) -> None:
+        """Unregister WebSockets event handler."""
+        self.events.pop(event, None)
+        self.prefixes.pop(event, None)
+        self.cache.clear()
+
+    def resolve(self, event: str) -> tuple[str, WebSocketsHandler] | None:
+        """Return WebSockets event metrics key and handler."""
+        if event in self.cache:
+            return self.cache[event]
+
+        res: tuple[str, WebSocketsHandler] | None = None
+        handler = self.events.get(event)
+        if handler is not None:
+            res = (event, handler)
+        else:
+            for prefix, prefix_handler in self.prefixes.items():
+                if event.startswith(prefix):
+                    res = (prefix, prefix_handler)
+                    break
+
+        if len(self.cache) >= WS_DISPATCH_CACHE:
+            self.cache.clear()
+        self.cache[event] = res
+
+        return res
+
+    def get_key(self, event: str) -> str:
+        """Return WebSockets event metrics key."""
+        res = self.resolve(event)
+        if res is not None:
+            return res[0]
+        return WS_DISPATCH_UNKNOWN
+
+    def get_metrics(self, key: str) -> EventMetrics:
+        """Return WebSockets event metrics."""
+        metrics = self.metrics.get(key)
+        if metrics is None:
+            metrics = EventMetrics()
+            self.metrics[key] = metrics
+        return metrics
+
+    async def dispatch(self, ws: ClientWebSocketResponse, data: dict[str, Any]) -> bool:
+        """Dispatch WebSockets event to its handler."""
+        event: str = data.get(WS_EVENT, "")
+
+        res = self.resolve(event)
+        if res is None:
+            # Unknown events share a single key to keep metrics bounded
+            self.get_metrics(WS_DISPATCH_UNKNOWN).observe(0.0, True)
+            return False
+
+        key, handler = res
+        error = True
+        start = perf_counter()
+        try:
+            await handler(ws, data)
+            error = False
+        finally:
+            self.get_metrics(key).observe(perf_counter() - start, error)
+
+        return True
+
+    def data(self) -> dict[str, Any]:
+        """Return WebSockets events metrics data."""
+        data: dict[str, Any] = {}
+        for key, metrics in self.metrics.items():
+            data[key] = metrics.data()
+        return data
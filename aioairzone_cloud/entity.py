@@ -4,15 +4,23 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from asyncio import Lock
+from collections.abc import Mapping
 from datetime import datetime
 from enum import IntEnum
+from itertools import count
 import logging
-from typing import Any
+from time import monotonic
+from typing import Any, ClassVar, NamedTuple
 
+from .common import EntityKind, MergedData
 from .const import WS_ADV_CONF, WS_CHANGE, WS_STATUS
+from .fields import FieldTable
+from .snapshot import EntitySnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_SEQUENCE = count(1)
+
 
 class UpdateType(IntEnum):
     """Airzone Cloud Update type."""
@@ -22,44 +30,125 @@ class UpdateType(IntEnum):
     WS_FULL = 3
     WS_PARTIAL = 4
 
+    def get_source(self) -> UpdateSource:
+        """Return Update source."""
+        if self in (UpdateType.API_FULL, UpdateType.API_PARTIAL):
+            return UpdateSource.API
+        return UpdateSource.WS
+
+
+class UpdateSource(IntEnum):
+    """Airzone Cloud Update source."""
+
+    API = 1
+    WS = 2
+
+
+class EntityChange(NamedTuple):
+    """Airzone Cloud Entity attribute change."""
+
+    old: Any
+    new: Any
+
+
+EntityChanges = dict[str, EntityChange]
+
+
+class EntityEvent(NamedTuple):
+    """Airzone Cloud Entity change event."""
+
+    kind: EntityKind
+    id: str
+    changes: EntityChanges
+
+    def get_values(self) -> dict[str, Any]:
+        """Return changed attributes new values."""
+        return {attr: change.new for attr, change in self.changes.items()}
+
 
 class EntityUpdate:
     """Airzone Cloud Entity Update."""
 
+    __slots__ = (
+        "base",
+        "data",
+        "datetime",
+        "merged",
+        "sequence",
+        "start",
+        "type",
+    )
+
     data: dict[str, Any]
 
-    def __init__(self, _type: UpdateType, data: dict[str, Any]):
+    def __init__(
+        self,
+        _type: UpdateType,
+        data: dict[str, Any],
+        base: dict[str, Any] | None = None,
+        start: float | None = None,
+    ):
         """Airzone Cloud Update init."""
+        self.base: dict[str, Any] | None = base
         self.datetime: datetime = datetime.now()
         self.data: dict[str, Any] = data
+        self.merged: Mapping[str, Any] | None = None
+        self.sequence: int = next(UPDATE_SEQUENCE)
+        self.start: float = monotonic() if start is None else start
         self.type: UpdateType = _type
 
     def check_dt(self, dt: datetime) -> bool:
         """Check if Update data is newer than provided datetime."""
         return self.datetime >= dt
 
-    def get_data(self) -> dict[str, Any]:
+    def get_data(self) -> Mapping[str, Any]:
         """Get Entity Update data."""
-        adv_conf: dict[str, Any]
+        merged = self.merged
+        if merged is None:
+            merged = self.merge_data()
+            self.merged = merged
+        return merged
+
+    def merge_data(self) -> Mapping[str, Any]:
+        """Merge Entity Update data layers without copying them."""
         change: dict[str, Any]
         data: dict[str, Any] = self.data
-        status: dict[str, Any]
+        layers: tuple[dict[str, Any], ...]
 
         if self.type == UpdateType.WS_PARTIAL:
             change = data.get(WS_CHANGE) or {}
-            adv_conf = change.get(WS_ADV_CONF) or {}
-            status = change.get(WS_STATUS) or {}
-            data = adv_conf | status
+            layers = (
+                change.get(WS_ADV_CONF) or {},
+                change.get(WS_STATUS) or {},
+            )
         elif self.type == UpdateType.WS_FULL:
-            status = self.data.get(WS_STATUS) or {}
-            data = self.data | status
+            layers = (data, data.get(WS_STATUS) or {})
+        else:
+            layers = (self.base or {}, data)
 
-        return data
+        layers = tuple(layer for layer in layers if len(layer) > 0)
+        if len(layers) == 0:
+            return {}
+        if len(layers) == 1:
+            return layers[0]
+        return MergedData(layers)
 
     def get_datetime(self) -> datetime:
         """Get Entity Update datetime."""
         return self.datetime
 
+    def get_sequence(self) -> int:
+        """Get Entity Update sequence number."""
+        return self.sequence
+
+    def get_source(self) -> UpdateSource:
+        """Get Entity Update source."""
+        return self.type.get_source()
+
+    def get_start(self) -> float:
+        """Get Entity Update data request start (monotonic)."""
+        return self.start
+
     def get_type(self) -> UpdateType:
         """Get Entity Update type."""
         return self.type
@@ -71,6 +160,7 @@ class EntityUpdate:
     def set_data(self, data: dict[str, Any]) -> None:
         """Set Entity Update data."""
         self.data = data
+        self.merged = None
 
     def __str__(self) -> str:
         """Return Entity Update string representation."""
@@ -79,23 +169,103 @@ class EntityUpdate:
         return f"{_type} with data={_data}"
 
 
-class Entity(ABC):
+class EntityData(ABC):
+    """Airzone Cloud Entity cached data."""
+
+    __slots__ = (
+        "data_cache",
+        "dependents",
+        "snapshot_cache",
+        "version",
+    )
+
+    snapshot_class: ClassVar[type[EntitySnapshot]]
+
+    def __init__(self) -> None:
+        """Airzone Cloud Entity Data init."""
+        self.data_cache: dict[str, Any] | None = None
+        self.dependents: list[EntityData] = []
+        self.snapshot_cache: EntitySnapshot | None = None
+        self.version: int = 0
+
+    @abstractmethod
+    def data(self) -> dict[str, Any]:
+        """Return Entity data."""
+
+    def add_dependent(self, dependent: EntityData) -> None:
+        """Add Entity whose data depends on this one."""
+        if dependent not in self.dependents:
+            self.dependents += [dependent]
+
+    def get_data(self) -> dict[str, Any]:
+        """Return cached Entity data, rebuilding it if needed."""
+        data = self.data_cache
+        if data is None:
+            data = self.data()
+            self.data_cache = data
+        return data
+
+    def get_snapshot(self) -> EntitySnapshot:
+        """Return cached Entity snapshot, rebuilding it if needed."""
+        snapshot = self.snapshot_cache
+        if snapshot is None:
+            snapshot = self.snapshot_class.from_data(self.get_data())
+            self.snapshot_cache = snapshot
+        return snapshot
+
+    def get_version(self) -> int:
+        """Return Entity data version."""
+        return self.version
+
+    def set_dirty(self) -> None:
+        """Invalidate Entity cached data and its dependents."""
+        self.data_cache = None
+        self.snapshot_cache = None
+        self.version += 1
+        for dependent in self.dependents:
+            dependent.update_dependency(self)
+
+    # pylint: disable-next=unused-argument
+    def update_dependency(self, entity: EntityData) -> None:
+        """Handle changes of an Entity this one depends on."""
+        self.set_dirty()
+
+
+class Entity(EntityData):
     """Airzone Cloud Entity."""
 
+    __slots__ = (
+        "changes",
+        "datetime",
+        "id",
+        "init",
+        "lock",
+        "name",
+        "stamp",
+        "stamps",
+        "update_start",
+        "versions",
+    )
+
     datetime: datetime
+    fields: ClassVar[FieldTable]
     id: str
+    kind: ClassVar[EntityKind]
     lock: Lock
     name: str
 
     def __init__(self) -> None:
         """Airzone Cloud Device init."""
+        super().__init__()
+
+        self.changes: EntityChanges = {}
         self.datetime: datetime = datetime.now()
         self.init: bool = False
         self.lock: Lock = Lock()
-
-    @abstractmethod
-    def data(self) -> dict[str, Any]:
-        """Return Entity data."""
+        self.stamp: float = 0.0
+        self.stamps: dict[str, float] = {}
+        self.update_start: float | None = None
+        self.versions: dict[UpdateSource, int] = {}
 
     def get_id(self) -> str:
         """Return Entity ID."""
@@ -105,29 +275,94 @@ class Entity(ABC):
         """Return Entity Init."""
         return self.init
 
+    def get_kind(self) -> EntityKind:
+        """Return Entity kind."""
+        return self.kind
+
     def get_name(self) -> str:
         """Return Entity name."""
         return self.name
 
+    def get_source_version(self, source: UpdateSource) -> int:
+        """Return sequence number of the last update applied from source."""
+        return self.versions.get(source, 0)
+
+    def set_attr(self, attr: str, value: Any) -> None:
+        """Set Entity attribute and record its change.
+
+        During updates, values coming from requests started before the
+        last write of the attribute are discarded.
+        """
+        start = self.update_start
+        if start is not None:
+            if start < self.stamps.get(attr, self.stamp):
+                _LOGGER.debug("%s[%s]: stale %s discarded", self.kind, self.id, attr)
+                return
+            if start > self.stamp:
+                self.stamps[attr] = start
+
+        cur = getattr(self, attr)
+        if cur == value:
+            return
+
+        change = self.changes.get(attr)
+        old = cur if change is None else change.old
+        if old == value:
+            self.changes.pop(attr)
+        else:
+            self.changes[attr] = EntityChange(old, value)
+
+        setattr(self, attr, value)
+
     @abstractmethod
     def update_data(self, update: EntityUpdate) -> None:
         """Update Entity data."""
 
-    async def update(self, update: EntityUpdate) -> None:
-        """Update Entity."""
-        newer: bool = update.check_dt(self.datetime)
+    async def update(
+        self, update: EntityUpdate, changes: EntityChanges | None = None
+    ) -> EntityChanges:
+        """Update Entity and return changed attributes.
+
+        Changes are added to the changes dict if provided, so callers get the
+        attributes changed before update_data() failed.
+        """
+        if changes is None:
+            changes = {}
 
         _LOGGER.debug(
-            "%s[%s] update (newer=%s) update=%s",
+            "%s[%s] update (seq=%s) update=%s",
             type(self).__name__,
             self.get_id(),
-            newer,
+            update.get_sequence(),
             update,
         )
 
-        if newer:
-            async with self.lock:
+        async with self.lock:
+            self.changes = changes
+            self.update_start = update.get_start()
+            try:
                 self.update_data(update)
+            finally:
+                self.changes = {}
+                self.update_start = None
+                if len(changes) > 0:
+                    self.set_dirty()
+
+            if update.is_full():
+                self.update_stamp(update.get_start())
+            self.versions[update.get_source()] = update.get_sequence()
+
+            if update.check_dt(self.datetime):
                 self.datetime = update.get_datetime()
-                if update.get_type() == UpdateType.API_FULL:
-                    self.init = True
+            if update.get_type() == UpdateType.API_FULL:
+                self.init = True
+
+        return changes
+
+    def update_stamp(self, start: float) -> None:
+        """Update Entity base stamp and drop older attribute stamps."""
+        if start > self.stamp:
+            self.stamp = start
+            self.stamps = {
+                attr: stamp for attr, stamp in self.stamps.items() if stamp > start
+            }
@@ -0,0 +1,145 @@
+"""Airzone Cloud entity fields."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from .common import MergedData
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+
+class FieldNull(IntEnum):
+    """Airzone Cloud field null value handling."""
+
+    IGNORE = 1
+    FALSE = 2
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Airzone Cloud entity field.
+
+    Values are read from data[api_key][sub_key] (or data[api_key] when there
+    is no sub_key), converted with parser and stored in attr. Parsers may
+    return None to discard a value.
+    """
+
+    api_key: str | None
+    attr: str
+    parser: Callable[[Any], Any] | None = None
+    sub_key: str | None = None
+    null: FieldNull = FieldNull.IGNORE
+    reset: bool = False
+    azd_key: str | None = None
+    getter: str | None = None
+    always: bool = False
+
+    def get_getter(self) -> str:
+        """Return field getter name."""
+        if self.getter is not None:
+            return self.getter
+        return f"get_{self.attr}"
+
+    def set_value(self, entity: Entity, value: Any) -> None:
+        """Parse field value and set entity attribute."""
+        if self.sub_key is not None:
+            if isinstance(value, Mapping):
+                value = value.get(self.sub_key)
+            else:
+                value = None
+
+        if value is None:
+            if self.null is FieldNull.FALSE:
+                # API sends null instead of False
+                entity.set_attr(self.attr, False)
+            return
+
+        if self.parser is not None:
+            value = self.parser(value)
+            if value is None:
+                return
+
+        entity.set_attr(self.attr, value)
+
+
+class FieldTable:
+    """Airzone Cloud entity fields table."""
+
+    def __init__(self, specs: Iterable[FieldSpec]) -> None:
+        """Airzone Cloud Field Table init."""
+        self.specs: tuple[FieldSpec, ...] = tuple(specs)
+
+        self.api: dict[str, FieldSpec] = {}
+        self.azd: list[tuple[str, str, bool]] = []
+        self.resets: list[FieldSpec] = []
+        for spec in self.specs:
+            if spec.api_key is not None:
+                self.api[spec.api_key] = spec
+                if spec.reset:
+                    self.resets += [spec]
+            if spec.azd_key is not None:
+                self.azd += [(spec.azd_key, spec.get_getter(), spec.always)]
+
+    def extend(self, specs: Iterable[FieldSpec]) -> FieldTable:
+        """Return new table with additional fields."""
+        return FieldTable(self.specs + tuple(specs))
+
+    def data(self, entity: Entity, data: dict[str, Any]) -> dict[str, Any]:
+        """Add entity fields to data."""
+        for azd_key, getter, always in self.azd:
+            value = getattr(entity, getter)()
+            if always or not is_empty(value):
+                data[azd_key] = value
+        return data
+
+    def update(self, entity: Entity, data: Mapping[str, Any], reset: bool) -> None:
+        """Update entity fields present in data."""
+        if isinstance(data, MergedData):
+            layers = data.get_layers()
+            for idx, layer in enumerate(layers):
+                self.update_layer(entity, layer, layers[idx + 1 :])
+        else:
+            self.update_layer(entity, data, ())
+
+        if reset:
+            for spec in self.resets:
+                if spec.api_key not in data:
+                    entity.set_attr(spec.attr, None)
+
+    def update_layer(
+        self,
+        entity: Entity,
+        data: Mapping[str, Any],
+        upper: tuple[Mapping[str, Any], ...],
+    ) -> None:
+        """Update entity fields present in data layer."""
+        specs = self.api
+
+        # Walk the smaller side: sparse updates only carry a few keys
+        if len(data) <= len(specs):
+            for key, value in data.items():
+                spec = specs.get(key)
+                if spec is not None and (not upper or not is_overridden(key, upper)):
+                    spec.set_value(entity, value)
+        else:
+            for key, spec in specs.items():
+                if key in data and (not upper or not is_overridden(key, upper)):
+                    spec.set_value(entity, data[key])
+
+
+def is_overridden(key: str, upper: tuple[Mapping[str, Any], ...]) -> bool:
+    """Check if key is present in upper data layers."""
+    for layer in upper:
+        if key in layer:
+            return True
+    return False
+
+
+def is_empty(value: Any) -> bool:
+    """Check if field value is empty."""
+    return value is None or (isinstance(value, list) and len(value) == 0)
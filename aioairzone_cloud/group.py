@@ -6,11 +6,16 @@ from typing import Any
 
 from .const import API_GROUP_ID, API_NAME, AZD_INSTALLATION
 from .device_group import DeviceGroup
+from .snapshot import GroupSnapshot
 
 
 class Group(DeviceGroup):
     """Airzone Cloud Group."""
 
+    __slots__ = ("installation_id",)
+
+    snapshot_class = GroupSnapshot
+
     def __init__(self, inst_id: str, group_data: dict[str, Any]) -> None:
         """Airzone Cloud Group init."""
         super().__init__()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .common import HotWaterOperation, parse_bool, parse_float, parse_int
+from .common import EntityKind, HotWaterOperation, parse_bool, parse_float, parse_int
 from .const import (
     API_ACTIVE,
     API_CELSIUS,
@@ -28,13 +28,88 @@ from .const import (
     AZD_TEMP_SET_MIN,
     AZD_TEMP_STEP,
 )
-from .device import Device
-from .entity import EntityUpdate, UpdateType
+from .device import DEVICE_FIELDS, Device
+from .fields import FieldNull, FieldSpec
+from .snapshot import HotWaterSnapshot
+
+HOT_WATER_FIELDS = DEVICE_FIELDS.extend(
+    [
+        FieldSpec(
+            API_ACTIVE,
+            "active",
+            parse_bool,
+            null=FieldNull.FALSE,
+            reset=True,
+            azd_key=AZD_ACTIVE,
+            always=True,
+        ),
+        FieldSpec(None, "operation", azd_key=AZD_OPERATION, always=True),
+        FieldSpec(None, "operations", azd_key=AZD_OPERATIONS, always=True),
+        FieldSpec(API_POWER, "power", parse_bool, azd_key=AZD_POWER, always=True),
+        FieldSpec(
+            API_TANK_TEMP,
+            "temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP,
+            getter="get_temperature",
+            always=True,
+        ),
+        FieldSpec(
+            API_SETPOINT,
+            "temp_set",
+            parse_int,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET,
+            always=True,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_ACS,
+            "temp_set_max",
+            parse_int,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX,
+            always=True,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_ACS,
+            "temp_set_min",
+            parse_int,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN,
+            always=True,
+        ),
+        FieldSpec(
+            API_STEP,
+            "temp_step",
+            parse_int,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_STEP,
+            always=True,
+        ),
+        FieldSpec(API_POWERFUL_MODE, "power_mode", parse_bool, azd_key=AZD_POWER_MODE),
+    ]
+)
 
 
 class HotWater(Device):
     """Airzone Cloud Domestic Hot Water device."""
 
+    __slots__ = (
+        "active",
+        "power",
+        "power_mode",
+        "temp",
+        "temp_set",
+        "temp_set_max",
+        "temp_set_min",
+        "temp_step",
+    )
+
+    fields = HOT_WATER_FIELDS
+    kind = EntityKind.HOT_WATER
+    snapshot_class = HotWaterSnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud DHW device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -49,26 +124,6 @@ class HotWater(Device):
         self.temp: float | None = None
         self.temp_step: int | None = None
 
-    def data(self) -> dict[str, Any]:
-        """Return DHW device data."""
-        data = super().data()
-
-        data[AZD_ACTIVE] = self.get_active()
-        data[AZD_OPERATION] = self.get_operation()
-        data[AZD_OPERATIONS] = self.get_operations()
-        data[AZD_POWER] = self.get_power()
-        data[AZD_TEMP] = self.get_temperature()
-        data[AZD_TEMP_SET] = self.get_temp_set()
-        data[AZD_TEMP_SET_MAX] = self.get_temp_set_max()
-        data[AZD_TEMP_SET_MIN] = self.get_temp_set_min()
-        data[AZD_TEMP_STEP] = self.get_temp_step()
-
-        power_mode = self.get_power_mode()
-        if power_mode is not None:
-            data[AZD_POWER_MODE] = power_mode
-
-        return data
-
     def get_active(self) -> bool | None:
         """Return DHW device active status."""
         return self.active
@@ -145,52 +200,4 @@ class HotWater(Device):
         elif param == API_SETPOINT:
             self.set_setpoint(data[API_VALUE])
 
-    def update_data(self, update: EntityUpdate) -> None:
-        """Update DHW device data."""
-        super().update_data(update)
-
-        data = update.get_data()
-
-        if API_ACTIVE in data:
-            active = parse_bool(data.get(API_ACTIVE))
-            if active is not None:
-                self.active = active
-            else:
-                # API sends active as null instead of False
-                self.active = False
-        else:
-            if update.get_type() != UpdateType.WS_PARTIAL:
-                self.active = None
-
-        power = parse_bool(data.get(API_POWER))
-        if power is not None:
-            self.power = power
-
-        powerful_mode = parse_bool(data.get(API_POWERFUL_MODE))
-        if powerful_mode is not None:
-            self.power_mode = powerful_mode
-
-        api_range_sp_max_acs = data.get(API_RANGE_SP_MAX_ACS) or {}
-        range_sp_max_acs = parse_int(api_range_sp_max_acs.get(API_CELSIUS))
-        if range_sp_max_acs is not None:
-            self.temp_set_max = range_sp_max_acs
-
-        api_range_sp_min_acs = data.get(API_RANGE_SP_MIN_ACS) or {}
-        range_sp_min_acs = parse_int(api_range_sp_min_acs.get(API_CELSIUS))
-        if range_sp_min_acs is not None:
-            self.temp_set_min = range_sp_min_acs
-
-        api_setpoint = data.get(API_SETPOINT) or {}
-        setpoint = parse_int(api_setpoint.get(API_CELSIUS))
-        if setpoint is not None:
-            self.temp_set = setpoint
-
-        api_step = data.get(API_STEP) or {}
-        step = parse_int(api_step.get(API_CELSIUS))
-        if step is not None:
-            self.temp_step = step
-
-        api_tank_temp = data.get(API_TANK_TEMP) or {}
-        tank_temp = parse_float(api_tank_temp.get(API_CELSIUS))
-        if tank_temp is not None:
-            self.temp = tank_temp
+        self.set_dirty()
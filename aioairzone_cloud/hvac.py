@@ -114,13 +114,414 @@ from .const import (
     AZD_THERMOSTAT_FW,
     AZD_THERMOSTAT_MODEL,
 )
-from .device import Device
-from .entity import EntityUpdate, UpdateType
+from .device import DEVICE_FIELDS, Device
+from .fields import FieldNull, FieldSpec
+from .timeseries import SeriesSpec
+
+
+def parse_aq_modes(data: Any) -> list[AirQualityMode]:
+    """Convert data to Air Quality modes list."""
+    return [AirQualityMode(aq_mode) for aq_mode in data]
+
+
+def parse_speeds(data: Any) -> dict[int, int]:
+    """Convert data to HVAC speeds."""
+    speeds: dict[int, int] = {}
+
+    if 0 in data:
+        speeds[0] = 0
+
+    speed_count = 1
+    for speed_value in sorted(data):
+        if speed_value > 0:
+            speeds[speed_count] = int(speed_value)
+            speed_count += 1
+
+    return speeds
+
+
+HVAC_FIELDS = DEVICE_FIELDS.extend(
+    [
+        FieldSpec(None, "action", azd_key=AZD_ACTION, always=True),
+        FieldSpec(
+            API_ACTIVE,
+            "active",
+            parse_bool,
+            null=FieldNull.FALSE,
+            reset=True,
+            azd_key=AZD_ACTIVE,
+            always=True,
+        ),
+        FieldSpec(
+            API_AIR_ACTIVE, "air_demand", parse_bool, null=FieldNull.FALSE, reset=True
+        ),
+        FieldSpec(
+            API_RAD_ACTIVE, "floor_demand", parse_bool, null=FieldNull.FALSE, reset=True
+        ),
+        FieldSpec(API_POWER, "power", parse_bool, azd_key=AZD_POWER, always=True),
+        FieldSpec(
+            API_LOCAL_TEMP,
+            "temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP,
+            getter="get_temperature",
+            always=True,
+        ),
+        FieldSpec(
+            API_STEP,
+            "temp_step",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_STEP,
+            always=True,
+        ),
+        FieldSpec(
+            API_AQ_MODE_CONF, "aq_mode_conf", AirQualityMode, azd_key=AZD_AQ_MODE_CONF
+        ),
+        FieldSpec(
+            API_AQ_MODE_VALUES,
+            "aq_mode_values",
+            parse_aq_modes,
+            azd_key=AZD_AQ_MODE_VALUES,
+        ),
+        FieldSpec(API_HUMIDITY, "humidity", parse_int, azd_key=AZD_HUMIDITY),
+        FieldSpec(
+            API_EXCH_HEAT_TEMP_IU,
+            "indoor_exchanger_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_INDOOR_EXCHANGER_TEMP,
+            getter="get_indoor_exchanger_temperature",
+        ),
+        FieldSpec(
+            API_RETURN_TEMP,
+            "indoor_return_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_INDOOR_RETURN_TEMP,
+            getter="get_indoor_return_temperature",
+        ),
+        FieldSpec(
+            API_WORK_TEMP,
+            "indoor_work_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_INDOOR_WORK_TEMP,
+            getter="get_indoor_work_temperature",
+        ),
+        FieldSpec(
+            API_PC_UE,
+            "outdoor_condenser_press",
+            parse_float,
+            azd_key=AZD_OUTDOOR_CONDENSER_PRESS,
+            getter="get_outdoor_condenser_pressure",
+        ),
+        FieldSpec(
+            API_DISCH_COMP_TEMP_UE,
+            "outdoor_discharge_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_OUTDOOR_DISCHARGE_TEMP,
+            getter="get_outdoor_discharge_temperature",
+        ),
+        FieldSpec(
+            API_CONSUMPTION_UE,
+            "outdoor_electric_current",
+            parse_float,
+            azd_key=AZD_OUTDOOR_ELECTRIC_CURRENT,
+        ),
+        FieldSpec(
+            API_PE_UE,
+            "outdoor_evaporator_press",
+            parse_float,
+            azd_key=AZD_OUTDOOR_EVAPORATOR_PRESS,
+            getter="get_outdoor_evaporator_pressure",
+        ),
+        FieldSpec(
+            API_EXCH_HEAT_TEMP_UE,
+            "outdoor_exchanger_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_OUTDOOR_EXCHANGER_TEMP,
+            getter="get_outdoor_exchanger_temperature",
+        ),
+        FieldSpec(
+            API_EXT_TEMP,
+            "outdoor_temp",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_OUTDOOR_TEMP,
+            getter="get_outdoor_temperature",
+        ),
+        FieldSpec(API_SPEED_CONF, "speed", parse_int, azd_key=AZD_SPEED),
+        FieldSpec(API_SPEED_VALUES, "speeds", parse_speeds, azd_key=AZD_SPEEDS),
+        FieldSpec(API_SPEED_TYPE, "speed_type", SpeedType, azd_key=AZD_SPEED_TYPE),
+        FieldSpec(
+            API_RANGE_MAX_AIR,
+            "temp_set_max",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_AUTO_AIR,
+            "temp_set_max_auto_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_AUTO_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_COOL_AIR,
+            "temp_set_max_cool_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_COOL_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_DRY_AIR,
+            "temp_set_max_dry_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_DRY_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_EMERHEAT_AIR,
+            "temp_set_max_emerheat_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_EMERHEAT_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_HOT_AIR,
+            "temp_set_max_hot_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_HOT_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_STOP_AIR,
+            "temp_set_max_stop_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_STOP_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MAX_VENT_AIR,
+            "temp_set_max_vent_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MAX_VENT_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_MIN_AIR,
+            "temp_set_min",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_AUTO_AIR,
+            "temp_set_min_auto_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_AUTO_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_COOL_AIR,
+            "temp_set_min_cool_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_COOL_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_DRY_AIR,
+            "temp_set_min_dry_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_DRY_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_EMERHEAT_AIR,
+            "temp_set_min_emerheat_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_EMERHEAT_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_HOT_AIR,
+            "temp_set_min_hot_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_HOT_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_STOP_AIR,
+            "temp_set_min_stop_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_STOP_AIR,
+        ),
+        FieldSpec(
+            API_RANGE_SP_MIN_VENT_AIR,
+            "temp_set_min_vent_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_MIN_VENT_AIR,
+        ),
+        FieldSpec(None, "temp_set", azd_key=AZD_TEMP_SET),
+        FieldSpec(
+            API_SP_AIR_AUTO,
+            "temp_set_auto_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_AUTO_AIR,
+        ),
+        FieldSpec(
+            API_SP_AIR_COOL,
+            "temp_set_cool_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_COOL_AIR,
+        ),
+        FieldSpec(
+            API_SP_AIR_DRY,
+            "temp_set_dry_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_DRY_AIR,
+        ),
+        FieldSpec(
+            API_SP_AIR_HEAT,
+            "temp_set_hot_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_HOT_AIR,
+        ),
+        FieldSpec(
+            API_SP_AIR_STOP,
+            "temp_set_stop_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_STOP_AIR,
+        ),
+        FieldSpec(
+            API_SP_AIR_VENT,
+            "temp_set_vent_air",
+            parse_float,
+            sub_key=API_CELSIUS,
+            azd_key=AZD_TEMP_SET_VENT_AIR,
+        ),
+        FieldSpec(
+            API_RADIO_BATTERY_PERCENT,
+            "thermostat_battery",
+            parse_int,
+            azd_key=AZD_THERMOSTAT_BATTERY,
+        ),
+        FieldSpec(None, "thermostat_battery_low", azd_key=AZD_THERMOSTAT_BATTERY_LOW),
+        FieldSpec(
+            API_RADIO_COVERAGE_PERCENT,
+            "thermostat_coverage",
+            parse_int,
+            azd_key=AZD_THERMOSTAT_COVERAGE,
+        ),
+        FieldSpec(
+            API_THERMOSTAT_FW, "thermostat_fw", parse_str, azd_key=AZD_THERMOSTAT_FW
+        ),
+        FieldSpec(
+            API_THERMOSTAT_TYPE,
+            "thermostat_type",
+            parse_str,
+            azd_key=AZD_THERMOSTAT_MODEL,
+        ),
+    ]
+)
+
+HVAC_SERIES: tuple[SeriesSpec, ...] = (
+    SeriesSpec(AZD_HUMIDITY, "get_humidity", frozenset({"humidity"})),
+    SeriesSpec(
+        AZD_OUTDOOR_ELECTRIC_CURRENT,
+        "get_outdoor_electric_current",
+        frozenset({"outdoor_electric_current"}),
+    ),
+    SeriesSpec(
+        AZD_OUTDOOR_TEMP, "get_outdoor_temperature", frozenset({"outdoor_temp"})
+    ),
+    SeriesSpec(AZD_TEMP, "get_temperature", frozenset({"temp"})),
+    SeriesSpec(
+        AZD_TEMP_SET,
+        "get_temp_set",
+        frozenset(
+            {
+                "mode",
+                "temp_set_auto_air",
+                "temp_set_cool_air",
+                "temp_set_dry_air",
+                "temp_set_hot_air",
+                "temp_set_stop_air",
+                "temp_set_vent_air",
+            }
+        ),
+    ),
+)
 
 
 class HVAC(Device):
     """Airzone Cloud HVAC device."""
 
+    __slots__ = (
+        "active",
+        "air_demand",
+        "aq_mode_conf",
+        "aq_mode_values",
+        "floor_demand",
+        "humidity",
+        "indoor_exchanger_temp",
+        "indoor_return_temp",
+        "indoor_work_temp",
+        "outdoor_condenser_press",
+        "outdoor_discharge_temp",
+        "outdoor_electric_current",
+        "outdoor_evaporator_press",
+        "outdoor_exchanger_temp",
+        "outdoor_temp",
+        "power",
+        "speed",
+        "speed_type",
+        "speeds",
+        "temp",
+        "temp_set_auto_air",
+        "temp_set_cool_air",
+        "temp_set_dry_air",
+        "temp_set_hot_air",
+        "temp_set_max",
+        "temp_set_max_auto_air",
+        "temp_set_max_cool_air",
+        "temp_set_max_dry_air",
+        "temp_set_max_emerheat_air",
+        "temp_set_max_hot_air",
+        "temp_set_max_stop_air",
+        "temp_set_max_vent_air",
+        "temp_set_min",
+        "temp_set_min_auto_air",
+        "temp_set_min_cool_air",
+        "temp_set_min_dry_air",
+        "temp_set_min_emerheat_air",
+        "temp_set_min_hot_air",
+        "temp_set_min_stop_air",
+        "temp_set_min_vent_air",
+        "temp_set_stop_air",
+        "temp_set_vent_air",
+        "temp_step",
+        "thermostat_battery",
+        "thermostat_coverage",
+        "thermostat_fw",
+        "thermostat_type",
+    )
+
+    fields = HVAC_FIELDS
+    series = HVAC_SERIES
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud HVAC device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -174,170 +575,6 @@ class HVAC(Device):
         self.thermostat_fw: str | None = None
         self.thermostat_type: str | None = None
 
-    def data(self) -> dict[str, Any]:
-        """Return HVAC device data."""
-        data = super().data()
-
-        data[AZD_ACTION] = self.get_action()
-        data[AZD_ACTIVE] = self.get_active()
-        data[AZD_POWER] = self.get_power()
-        data[AZD_TEMP] = self.get_temperature()
-        data[AZD_TEMP_STEP] = self.get_temp_step()
-
-        aq_mode_conf = self.get_aq_mode_conf()
-        if aq_mode_conf is not None:
-            data[AZD_AQ_MODE_CONF] = aq_mode_conf
-
-        aq_mode_values = self.get_aq_mode_values()
-        if aq_mode_values is not None:
-            data[AZD_AQ_MODE_VALUES] = aq_mode_values
-
-        humidity = self.get_humidity()
-        if humidity is not None:
-            data[AZD_HUMIDITY] = humidity
-
-        indoor_exchanger_temperature = self.get_indoor_exchanger_temperature()
-        if indoor_exchanger_temperature is not None:
-            data[AZD_INDOOR_EXCHANGER_TEMP] = indoor_exchanger_temperature
-
-        indoor_return_temperature = self.get_indoor_return_temperature()
-        if indoor_return_temperature is not None:
-            data[AZD_INDOOR_RETURN_TEMP] = indoor_return_temperature
-
-        indoor_work_temperature = self.get_indoor_work_temperature()
-        if indoor_work_temperature is not None:
-            data[AZD_INDOOR_WORK_TEMP] = indoor_work_temperature
-
-        outdoor_condenser_press = self.get_outdoor_condenser_pressure()
-        if outdoor_condenser_press is not None:
-            data[AZD_OUTDOOR_CONDENSER_PRESS] = outdoor_condenser_press
-
-        outdoor_discharge_temp = self.get_outdoor_discharge_temperature()
-        if outdoor_discharge_temp is not None:
-            data[AZD_OUTDOOR_DISCHARGE_TEMP] = outdoor_discharge_temp
-
-        outdoor_electric_current = self.get_outdoor_electric_current()
-        if outdoor_electric_current is not None:
-            data[AZD_OUTDOOR_ELECTRIC_CURRENT] = outdoor_electric_current
-
-        outdoor_evaporator_press = self.get_outdoor_evaporator_pressure()
-        if outdoor_evaporator_press is not None:
-            data[AZD_OUTDOOR_EVAPORATOR_PRESS] = outdoor_evaporator_press
-
-        outdoor_exchanger_temperature = self.get_outdoor_exchanger_temperature()
-        if outdoor_exchanger_temperature is not None:
-            data[AZD_OUTDOOR_EXCHANGER_TEMP] = outdoor_exchanger_temperature
-
-        outdoor_temperature = self.get_outdoor_temperature()
-        if outdoor_temperature is not None:
-            data[AZD_OUTDOOR_TEMP] = outdoor_temperature
-
-        speed = self.get_speed()
-        if speed is not None:
-            data[AZD_SPEED] = speed
-
-        speeds = self.get_speeds()
-        if speeds is not None:
-            data[AZD_SPEEDS] = speeds
-
-        speed_type = self.get_speed_type()
-        if speed_type is not None:
-            data[AZD_SPEED_TYPE] = speed_type
-
-        temp_set_max = self.get_temp_set_max()
-        if temp_set_max is not None:
-            data[AZD_TEMP_SET_MAX] = temp_set_max
-        temp_set_max_auto_air = self.get_temp_set_max_auto_air()
-        if temp_set_max_auto_air is not None:
-            data[AZD_TEMP_SET_MAX_AUTO_AIR] = temp_set_max_auto_air
-        temp_set_max_cool_air = self.get_temp_set_max_cool_air()
-        if temp_set_max_cool_air is not None:
-            data[AZD_TEMP_SET_MAX_COOL_AIR] = temp_set_max_cool_air
-        temp_set_max_dry_air = self.get_temp_set_max_dry_air()
-        if temp_set_max_dry_air is not None:
-            data[AZD_TEMP_SET_MAX_DRY_AIR] = temp_set_max_dry_air
-        temp_set_max_emerheat_air = self.get_temp_set_max_emerheat_air()
-        if temp_set_max_emerheat_air is not None:
-            data[AZD_TEMP_SET_MAX_EMERHEAT_AIR] = temp_set_max_emerheat_air
-        temp_set_max_hot_air = self.get_temp_set_max_hot_air()
-        if temp_set_max_hot_air is not None:
-            data[AZD_TEMP_SET_MAX_HOT_AIR] = temp_set_max_hot_air
-        temp_set_max_stop_air = self.get_temp_set_max_stop_air()
-        if temp_set_max_stop_air is not None:
-            data[AZD_TEMP_SET_MAX_STOP_AIR] = temp_set_max_stop_air
-        temp_set_max_vent_air = self.get_temp_set_max_vent_air()
-        if temp_set_max_vent_air is not None:
-            data[AZD_TEMP_SET_MAX_VENT_AIR] = temp_set_max_vent_air
-
-        temp_set_min = self.get_temp_set_min()
-        if temp_set_min is not None:
-            data[AZD_TEMP_SET_MIN] = temp_set_min
-        temp_set_min_auto_air = self.get_temp_set_min_auto_air()
-        if temp_set_min_auto_air is not None:
-            data[AZD_TEMP_SET_MIN_AUTO_AIR] = temp_set_min_auto_air
-        temp_set_min_cool_air = self.get_temp_set_min_cool_air()
-        if temp_set_min_cool_air is not None:
-            data[AZD_TEMP_SET_MIN_COOL_AIR] = temp_set_min_cool_air
-        temp_set_min_dry_air = self.get_temp_set_min_dry_air()
-        if temp_set_min_dry_air is not None:
-            data[AZD_TEMP_SET_MIN_DRY_AIR] = temp_set_min_dry_air
-        temp_set_min_emerheat_air = self.get_temp_set_min_emerheat_air()
-        if temp_set_min_emerheat_air is not None:
-            data[AZD_TEMP_SET_MIN_EMERHEAT_AIR] = temp_set_min_emerheat_air
-        temp_set_min_hot_air = self.get_temp_set_min_hot_air()
-        if temp_set_min_hot_air is not None:
-            data[AZD_TEMP_SET_MIN_HOT_AIR] = temp_set_min_hot_air
-        temp_set_min_stop_air = self.get_temp_set_min_stop_air()
-        if temp_set_min_stop_air is not None:
-            data[AZD_TEMP_SET_MIN_STOP_AIR] = temp_set_min_stop_air
-        temp_set_min_vent_air = self.get_temp_set_min_vent_air()
-        if temp_set_min_vent_air is not None:
-            data[AZD_TEMP_SET_MIN_VENT_AIR] = temp_set_min_vent_air
-
-        temp_set = self.get_temp_set()
-        if temp_set is not None:
-            data[AZD_TEMP_SET] = temp_set
-        temp_set_auto_air = self.get_temp_set_auto_air()
-        if temp_set_auto_air is not None:
-            data[AZD_TEMP_SET_AUTO_AIR] = temp_set_auto_air
-        temp_set_cool_air = self.get_temp_set_cool_air()
-        if temp_set_cool_air is not None:
-            data[AZD_TEMP_SET_COOL_AIR] = temp_set_cool_air
-        temp_set_dry_air = self.get_temp_set_dry_air()
-        if temp_set_dry_air is not None:
-            data[AZD_TEMP_SET_DRY_AIR] = temp_set_dry_air
-        temp_set_hot_air = self.get_temp_set_hot_air()
-        if temp_set_hot_air is not None:
-            data[AZD_TEMP_SET_HOT_AIR] = temp_set_hot_air
-        temp_set_stop_air = self.get_temp_set_stop_air()
-        if temp_set_stop_air is not None:
-            data[AZD_TEMP_SET_STOP_AIR] = temp_set_stop_air
-        temp_set_vent_air = self.get_temp_set_vent_air()
-        if temp_set_vent_air is not None:
-            data[AZD_TEMP_SET_VENT_AIR] = temp_set_vent_air
-
-        thermostat_battery = self.get_thermostat_battery()
-        if thermostat_battery is not None:
-            data[AZD_THERMOSTAT_BATTERY] = thermostat_battery
-
-        thermostat_battery_low = self.get_thermostat_battery_low()
-        if thermostat_battery_low is not None:
-            data[AZD_THERMOSTAT_BATTERY_LOW] = thermostat_battery_low
-
-        thermostat_coverage = self.get_thermostat_coverage()
-        if thermostat_coverage is not None:
-            data[AZD_THERMOSTAT_COVERAGE] = thermostat_coverage
-
-        thermostat_firmware = self.get_thermostat_fw()
-        if thermostat_firmware is not None:
-            data[AZD_THERMOSTAT_FW] = thermostat_firmware
-
-        thermostat_model = self.get_thermostat_type()
-        if thermostat_model is not None:
-            data[AZD_THERMOSTAT_MODEL] = thermostat_model
-
-        return data
-
     def get_action(self) -> OperationAction:
         """Return HVAC action."""
         if self.get_power():
@@ -744,247 +981,3 @@ class HVAC(Device):
         """Set HVAC vent setpoint."""
         if self.temp_set_vent_air is not None:
             self.temp_set_vent_air = setpoint
-
-    def update_data(self, update: EntityUpdate) -> None:
-        """Update HVAC device data."""
-        super().update_data(update)
-
-        data = update.get_data()
-
-        if API_ACTIVE in data:
-            active = parse_bool(data.get(API_ACTIVE))
-            if active is not None:
-                self.active = active
-            else:
-                # API sends active as null instead of False
-                self.active = False
-        else:
-            if update.get_type() != UpdateType.WS_PARTIAL:
-                self.active = None
-
-        if API_AIR_ACTIVE in data:
-            air_demand = parse_bool(data.get(API_AIR_ACTIVE))
-            if air_demand is not None:
-                self.air_demand = air_demand
-            else:
-                # API sends API_AIR_ACTIVE as null instead of False
-                self.air_demand = False
-        else:
-            if update.get_type() != UpdateType.WS_PARTIAL:
-                self.air_demand = None
-
-        if API_RAD_ACTIVE in data:
-            floor_demand = parse_bool(data.get(API_RAD_ACTIVE))
-            if floor_demand is not None:
-                self.floor_demand = floor_demand
-            else:
-                # API sends API_RAD_ACTIVE as null instead of False
-                self.floor_demand = False
-        else:
-            if update.get_type() != UpdateType.WS_PARTIAL:
-                self.floor_demand = None
-
-        aq_mode_conf = data.get(API_AQ_MODE_CONF)
-        if aq_mode_conf is not None:
-            self.aq_mode_conf = AirQualityMode(aq_mode_conf)
-
-        aq_mode_values = data.get(API_AQ_MODE_VALUES)
-        if aq_mode_values is not None:
-            self.aq_mode_values = []
-            for aq_mode_value in aq_mode_values:
-                self.aq_mode_values += [AirQualityMode(aq_mode_value)]
-
-        humidity = parse_int(data.get(API_HUMIDITY))
-        if humidity is not None:
-            self.humidity = humidity
-
-        api_local_temp = data.get(API_LOCAL_TEMP) or {}
-        local_temp = parse_float(api_local_temp.get(API_CELSIUS))
-        if local_temp is not None:
-            self.temp = local_temp
-
-        api_return_temp = data.get(API_RETURN_TEMP) or {}
-        indoor_return_temp = parse_float(api_return_temp.get(API_CELSIUS))
-        if indoor_return_temp is not None:
-            self.indoor_return_temp = indoor_return_temp
-
-        api_exch_heat_temp_iu = data.get(API_EXCH_HEAT_TEMP_IU) or {}
-        indoor_exchanger_temp = parse_float(api_exch_heat_temp_iu.get(API_CELSIUS))
-        if indoor_exchanger_temp is not None:
-            self.indoor_exchanger_temp = indoor_exchanger_temp
-
-        api_work_temp = data.get(API_WORK_TEMP) or {}
-        indoor_work_temp = parse_float(api_work_temp.get(API_CELSIUS))
-        if indoor_work_temp is not None:
-            self.indoor_work_temp = indoor_work_temp
-
-        outdoor_electric_current = parse_float(data.get(API_CONSUMPTION_UE))
-        if outdoor_electric_current is not None:
-            self.outdoor_electric_current = outdoor_electric_current
-
-        outdoor_condenser_press = parse_float(data.get(API_PC_UE))
-        if outdoor_condenser_press is not None:
-            self.outdoor_condenser_press = outdoor_condenser_press
-
-        api_disch_comp_temp_ue = data.get(API_DISCH_COMP_TEMP_UE) or {}
-        outdoor_discharge_temp = parse_float(api_disch_comp_temp_ue.get(API_CELSIUS))
-        if outdoor_discharge_temp is not None:
-            self.outdoor_discharge_temp = outdoor_discharge_temp
-
-        outdoor_evaporator_press = parse_float(data.get(API_PE_UE))
-        if outdoor_evaporator_press is not None:
-            self.outdoor_evaporator_press = outdoor_evaporator_press
-
-        api_exch_heat_temp_ue = data.get(API_EXCH_HEAT_TEMP_UE) or {}
-        outdoor_exchanger_temp = parse_float(api_exch_heat_temp_ue.get(API_CELSIUS))
-        if outdoor_exchanger_temp is not None:
-            self.outdoor_exchanger_temp = outdoor_exchanger_temp
-
-        api_ext_temp = data.get(API_EXT_TEMP) or {}
-        outdoor_temp = parse_float(api_ext_temp.get(API_CELSIUS))
-        if outdoor_temp is not None:
-            self.outdoor_temp = outdoor_temp
-
-        power = parse_bool(data.get(API_POWER))
-        if power is not None:
-            self.power = power
-
-        api_range_max_air = data.get(API_RANGE_MAX_AIR) or {}
-        range_max_air = parse_float(api_range_max_air.get(API_CELSIUS))
-        if range_max_air is not None:
-            self.temp_set_max = range_max_air
-        api_range_sp_max_auto_air = data.get(API_RANGE_SP_MAX_AUTO_AIR) or {}
-        range_sp_max_auto_air = parse_float(api_range_sp_max_auto_air.get(API_CELSIUS))
-        if range_sp_max_auto_air is not None:
-            self.temp_set_max_auto_air = range_sp_max_auto_air
-        api_range_sp_max_cool_air = data.get(API_RANGE_SP_MAX_COOL_AIR) or {}
-        range_sp_max_cool_air = parse_float(api_range_sp_max_cool_air.get(API_CELSIUS))
-        if range_sp_max_cool_air is not None:
-            self.temp_set_max_cool_air = range_sp_max_cool_air
-        api_range_sp_max_dry_air = data.get(API_RANGE_SP_MAX_DRY_AIR) or {}
-        range_sp_max_dry_air = parse_float(api_range_sp_max_dry_air.get(API_CELSIUS))
-        if range_sp_max_dry_air is not None:
-            self.temp_set_max_dry_air = range_sp_max_dry_air
-        api_range_sp_max_emerheat_air = data.get(API_RANGE_SP_MAX_EMERHEAT_AIR) or {}
-        range_sp_max_emerheat_air = parse_float(
-            api_range_sp_max_emerheat_air.get(API_CELSIUS)
-        )
-        if range_sp_max_emerheat_air is not None:
-            self.temp_set_max_emerheat_air = range_sp_max_emerheat_air
-        api_range_sp_max_hot_air = data.get(API_RANGE_SP_MAX_HOT_AIR) or {}
-        range_sp_max_hot_air = parse_float(api_range_sp_max_hot_air.get(API_CELSIUS))
-        if range_sp_max_hot_air is not None:
-            self.temp_set_max_hot_air = range_sp_max_hot_air
-        api_range_sp_max_stop_air = data.get(API_RANGE_SP_MAX_STOP_AIR) or {}
-        range_sp_max_stop_air = parse_float(api_range_sp_max_stop_air.get(API_CELSIUS))
-        if range_sp_max_stop_air is not None:
-            self.temp_set_max_stop_air = range_sp_max_stop_air
-        api_range_sp_max_vent_air = data.get(API_RANGE_SP_MAX_VENT_AIR) or {}
-        range_sp_max_vent_air = parse_float(api_range_sp_max_vent_air.get(API_CELSIUS))
-        if range_sp_max_vent_air is not None:
-            self.temp_set_max_vent_air = range_sp_max_vent_air
-
-        api_range_min_air = data.get(API_RANGE_MIN_AIR) or {}
-        range_min_air = parse_float(api_range_min_air.get(API_CELSIUS))
-        if range_min_air is not None:
-            self.temp_set_min = range_min_air
-        api_range_sp_min_auto_air = data.get(API_RANGE_SP_MIN_AUTO_AIR) or {}
-        range_sp_min_auto_air = parse_float(api_range_sp_min_auto_air.get(API_CELSIUS))
-        if range_sp_min_auto_air is not None:
-            self.temp_set_min_auto_air = range_sp_min_auto_air
-        api_range_sp_min_cool_air = data.get(API_RANGE_SP_MIN_COOL_AIR) or {}
-        range_sp_min_cool_air = parse_float(api_range_sp_min_cool_air.get(API_CELSIUS))
-        if range_sp_min_cool_air is not None:
-            self.temp_set_min_cool_air = range_sp_min_cool_air
-        api_range_sp_min_dry_air = data.get(API_RANGE_SP_MIN_DRY_AIR) or {}
-        range_sp_min_dry_air = parse_float(api_range_sp_min_dry_air.get(API_CELSIUS))
-        if range_sp_min_dry_air is not None:
-            self.temp_set_min_dry_air = range_sp_min_dry_air
-        api_range_sp_min_emerheat_air = data.get(API_RANGE_SP_MIN_EMERHEAT_AIR) or {}
-        range_sp_min_emerheat_air = parse_float(
-            api_range_sp_min_emerheat_air.get(API_CELSIUS)
-        )
-        if range_sp_min_emerheat_air is not None:
-            self.temp_set_min_emerheat_air = range_sp_min_emerheat_air
-        api_range_sp_min_hot_air = data.get(API_RANGE_SP_MIN_HOT_AIR) or {}
-        range_sp_min_hot_air = parse_float(api_range_sp_min_hot_air.get(API_CELSIUS))
-        if range_sp_min_hot_air is not None:
-            self.temp_set_min_hot_air = range_sp_min_hot_air
-        api_range_sp_min_stop_air = data.get(API_RANGE_SP_MIN_STOP_AIR) or {}
-        range_sp_min_stop_air = parse_float(api_range_sp_min_stop_air.get(API_CELSIUS))
-        if range_sp_min_stop_air is not None:
-            self.temp_set_min_stop_air = range_sp_min_stop_air
-        api_range_sp_min_vent_air = data.get(API_RANGE_SP_MIN_VENT_AIR) or {}
-        range_sp_min_vent_air = parse_float(api_range_sp_min_vent_air.get(API_CELSIUS))
-        if range_sp_min_vent_air is not None:
-            self.temp_set_min_vent_air = range_sp_min_vent_air
-
-        speed = parse_int(data.get(API_SPEED_CONF))
-        if speed is not None:
-            self.speed = speed
-
-        speed_type = data.get(API_SPEED_TYPE)
-        if speed_type is not None:
-            self.speed_type = SpeedType(speed_type)
-
-        speeds_values: list[int] | None = data.get(API_SPEED_VALUES)
-        if speeds_values is not None:
-            speeds: dict[int, int] = {}
-
-            if 0 in speeds_values:
-                speeds[0] = 0
-
-            speed_count = 1
-            speeds_values.sort()
-            for speed_value in speeds_values:
-                if speed_value > 0:
-                    speeds[speed_count] = int(speed_value)
-                    speed_count += 1
-
-            self.speeds = speeds
-
-        api_sp_air_auto = data.get(API_SP_AIR_AUTO) or {}
-        sp_air_auto = parse_float(api_sp_air_auto.get(API_CELSIUS))
-        if sp_air_auto is not None:
-            self.temp_set_auto_air = sp_air_auto
-        api_sp_air_cool = data.get(API_SP_AIR_COOL) or {}
-        sp_air_cool = parse_float(api_sp_air_cool.get(API_CELSIUS))
-        if sp_air_cool is not None:
-            self.temp_set_cool_air = sp_air_cool
-        api_sp_air_dry = data.get(API_SP_AIR_DRY) or {}
-        sp_air_dry = parse_float(api_sp_air_dry.get(API_CELSIUS))
-        if sp_air_dry is not None:
-            self.temp_set_dry_air = sp_air_dry
-        api_sp_air_heat = data.get(API_SP_AIR_HEAT) or {}
-        sp_air_heat = parse_float(api_sp_air_heat.get(API_CELSIUS))
-        if sp_air_heat is not None:
-            self.temp_set_hot_air = sp_air_heat
-        api_sp_air_stop = data.get(API_SP_AIR_STOP) or {}
-        sp_air_stop = parse_float(api_sp_air_stop.get(API_CELSIUS))
-        if sp_air_stop is not None:
-            self.temp_set_stop_air = sp_air_stop
-        api_sp_air_vent = data.get(API_SP_AIR_VENT) or {}
-        sp_air_vent = parse_float(api_sp_air_vent.get(API_CELSIUS))
-        if sp_air_vent is not None:
-            self.temp_set_vent_air = sp_air_vent
-
-        api_step = data.get(API_STEP) or {}
-        step = parse_float(api_step.get(API_CELSIUS))
-        if step is not None:
-            self.temp_step = step
-
-        thermostat_battery = parse_int(data.get(API_RADIO_BATTERY_PERCENT))
-        if thermostat_battery is not None:
-            self.thermostat_battery = thermostat_battery
-
-        thermostat_coverage = parse_int(data.get(API_RADIO_COVERAGE_PERCENT))
-        if thermostat_coverage is not None:
-            self.thermostat_coverage = thermostat_coverage
-
-        thermostat_fw = parse_str(data.get(API_THERMOSTAT_FW))
-        if thermostat_fw is not None:
-            self.thermostat_fw = thermostat_fw
-
-        thermostat_type = parse_str(data.get(API_THERMOSTAT_TYPE))
-        if thermostat_type is not None:
-            self.thermostat_type = thermostat_type
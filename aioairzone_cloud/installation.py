@@ -19,11 +19,20 @@ from .const import (
 )
 from .device_group import DeviceGroup
 from .group import Group
+from .snapshot import InstallationSnapshot
 
 
 class Installation(DeviceGroup):
     """Airzone Cloud Installation."""
 
+    __slots__ = (
+        "groups",
+        "user_access",
+        "webservers",
+    )
+
+    snapshot_class = InstallationSnapshot
+
     def __init__(self, inst_data: dict[str, Any]) -> None:
         """Airzone Cloud Installation init."""
         super().__init__()
@@ -64,6 +73,7 @@ class Installation(DeviceGroup):
         group_id = group.get_id()
         if group_id not in self.groups:
             self.groups[group_id] = group
+            self.set_dirty()
 
     def get_groups_num(self) -> int:
         """Return Groups count."""
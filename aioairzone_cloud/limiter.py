@@ -0,0 +1,150 @@
+"""Airzone Cloud API requests limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio import Lock, Semaphore
+from time import monotonic
+from types import TracebackType
+
+from .const import HTTP_MAX_REQUESTS, HTTP_RATE_BURST
+
+
+class TokenBucket:
+    """Airzone Cloud API requests token bucket.
+
+    Holds up to burst tokens, refilled at rate tokens per second. Each
+    request takes one token, waiting for it in FIFO order if the bucket is
+    empty.
+    """
+
+    def __init__(self, rate: float, burst: int = HTTP_RATE_BURST) -> None:
+        """Airzone Cloud Token Bucket init."""
+        if rate <= 0 or burst < 1:
+            raise ValueError("Token bucket rate and burst must be positive")
+        self.burst: int = burst
+        self.lock: Lock = Lock()
+        self.rate: float = rate
+        self.stamp: float = monotonic()
+        self.tokens: float = float(burst)
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        async with self.lock:
+            self.refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.refill()
+            self.tokens -= 1
+
+    def get_rate(self) -> float:
+        """Return refill rate in tokens per second."""
+        return self.rate
+
+    def get_tokens(self) -> float:
+        """Return available tokens."""
+        self.refill()
+        return self.tokens
+
+    def refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+
+class RequestLimiter:
+    """Airzone Cloud API requests limiter.
+
+    Limits the number of concurrent API requests and, if rate is set, the
+    number of requests per second through a token bucket. Used as an async
+    context manager around each request.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = HTTP_MAX_REQUESTS,
+        rate: float | None = None,
+        burst: int = HTTP_RATE_BURST,
+    ) -> None:
+        """Airzone Cloud Request Limiter init."""
+        self.active: int = 0
+        self.bucket: TokenBucket | None = None
+        self.max_requests: int = max_requests
+        self.semaphore: Semaphore = Semaphore(max_requests)
+        if rate is not None:
+            self.bucket = TokenBucket(rate, burst)
+
+    async def acquire(self) -> None:
+        """Wait for a request token and slot."""
+        if self.bucket is not None:
+            await self.bucket.acquire()
+        await self.semaphore.acquire()
+        self.active += 1
+
+    def release(self) -> None:
+        """Release a request slot."""
+        self.active -= 1
+        self.semaphore.release()
+
+    def get_active(self) -> int:
+        """Return number of active requests."""
+        return self.active
+
+    def get_max_requests(self) -> int:
+        """Return max number of concurrent requests."""
+        return self.max_requests
+
+    def get_rate(self) -> float | None:
+        """Return max number of requests per second."""
+        if self.bucket is None:
+            return None
+        return self.bucket.get_rate()
+
+    async def __aenter__(self) -> None:
+        """Acquire request slot on context enter."""
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release request slot on context exit."""
+        self.release()
+
+
+class AccountLimiter(RequestLimiter):
+    """Airzone Cloud account requests limiter.
+
+    Requests must get a token and a slot from the account quota first and
+    then from the limiter shared by all accounts. Accounts can't take more
+    than their quota of the shared slots nor their own rate of the shared
+    tokens, and waiters on the shared limiter are served in FIFO order.
+    """
+
+    def __init__(
+        self,
+        shared: RequestLimiter,
+        quota: int = HTTP_MAX_REQUESTS,
+        rate: float | None = None,
+        burst: int = HTTP_RATE_BURST,
+    ) -> None:
+        """Airzone Cloud Account Limiter init."""
+        super().__init__(quota, rate, burst)
+        self.shared: RequestLimiter = shared
+
+    async def acquire(self) -> None:
+        """Wait for an account and a shared request slot."""
+        await super().acquire()
+        try:
+            await self.shared.acquire()
+        except BaseException:
+            super().release()
+            raise
+
+    def release(self) -> None:
+        """Release account and shared request slots."""
+        self.shared.release()
+        super().release()
@@ -0,0 +1,241 @@
+"""Airzone Cloud multi-account manager."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio import Event, Task
+from collections.abc import Callable
+import heapq
+import logging
+from time import monotonic, perf_counter
+from typing import Any
+
+from aiohttp import ClientSession
+
+from .cloudapi import AirzoneCloudApi
+from .common import ConnectionOptions
+from .const import (
+    HTTP_MAX_REQUESTS,
+    HTTP_RATE_LIMIT,
+    MANAGER_MAX_REQUESTS,
+    MANAGER_RATE_BURST,
+    MANAGER_RATE_LIMIT,
+    MANAGER_SCHEDULE_SPREAD,
+    MANAGER_UPDATE_INTERVAL,
+    METRICS_ACCOUNTS,
+    METRICS_ACTIVE,
+    METRICS_API,
+    METRICS_HISTOGRAM_API,
+    METRICS_LIMITER,
+    METRICS_MAX,
+    METRICS_RATE,
+    METRICS_UPDATES,
+    METRICS_WEBSOCKETS,
+)
+from .entity import EntityEvent
+from .exceptions import AirzoneCloudError, LoginError
+from .limiter import AccountLimiter, RequestLimiter
+from .metrics import EventMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AirzoneCloudManager:
+    """Airzone Cloud multi-account manager.
+
+    Hosts many accounts on a single ClientSession. API requests from all
+    accounts share one rate and concurrency limiter, and each account also
+    has its own rate and concurrency quota.
+    A single scheduler task updates each account once per interval, with
+    accounts spread over the interval. Accounts are discovered when added
+    and again after a failed login.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        max_requests: int = MANAGER_MAX_REQUESTS,
+        account_requests: int = HTTP_MAX_REQUESTS,
+        update_interval: float = MANAGER_UPDATE_INTERVAL,
+        *,
+        rate: float | None = MANAGER_RATE_LIMIT,
+        account_rate: float | None = HTTP_RATE_LIMIT,
+    ) -> None:
+        """Airzone Cloud Manager init."""
+        self.account_rate: float | None = account_rate
+        self.account_requests: int = account_requests
+        self.accounts: dict[str, AirzoneCloudApi] = {}
+        self.api_metrics: EventMetrics = EventMetrics(METRICS_HISTOGRAM_API)
+        self.limiter: RequestLimiter = RequestLimiter(
+            max_requests, rate, MANAGER_RATE_BURST
+        )
+        self.rediscover: set[str] = set()
+        self.running: dict[str, Task[None]] = {}
+        self.schedule: list[tuple[float, int, str]] = []
+        self.schedule_count: int = 0
+        self.session: ClientSession = session
+        self.task: Task[None] | None = None
+        self.update_interval: float = update_interval
+        self.update_metrics: EventMetrics = EventMetrics(METRICS_HISTOGRAM_API)
+        self.wakeup: Event = Event()
+
+    async def add_account(
+        self,
+        account_id: str,
+        options: ConnectionOptions,
+        quota: int | None = None,
+        changes_function: Callable[[list[EntityEvent]], None] | None = None,
+    ) -> AirzoneCloudApi:
+        """Add account to manager, log in and discover its devices.
+
+        The changes callback is set before discovery, so that no change
+        events are lost once WebSockets are connected.
+        """
+        if account_id in self.accounts:
+            raise AirzoneCloudError(f"Account {account_id} already added")
+
+        limiter = AccountLimiter(
+            self.limiter, quota or self.account_requests, self.account_rate
+        )
+        api = AirzoneCloudApi(self.session, options, limiter)
+        api.set_changes_callback(changes_function)
+        await api.login()
+        try:
+            await api.discover()
+        except BaseException:
+            await api.logout()
+            raise
+
+        self.accounts[account_id] = api
+        offset = (len(self.accounts) * MANAGER_SCHEDULE_SPREAD) % 1
+        self.schedule_account(account_id, monotonic() + offset * self.update_interval)
+
+        return api
+
+    def get_account(self, account_id: str) -> AirzoneCloudApi | None:
+        """Return account API."""
+        return self.accounts.get(account_id)
+
+    def get_accounts(self) -> dict[str, AirzoneCloudApi]:
+        """Return accounts API."""
+        return self.accounts
+
+    async def remove_account(self, account_id: str) -> None:
+        """Remove account from manager and log out."""
+        api = self.accounts.pop(account_id, None)
+        if api is None:
+            return
+        self.rediscover.discard(account_id)
+
+        task = self.running.pop(account_id, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        # Keep aggregated counters monotonic
+        self.api_metrics.merge(api.get_api_metrics())
+
+        await api.logout()
+
+    def schedule_account(self, account_id: str, due: float) -> None:
+        """Schedule account update."""
+        self.schedule_count += 1
+        heapq.heappush(self.schedule, (due, self.schedule_count, account_id))
+        self.wakeup.set()
+
+    async def scheduler(self) -> None:
+        """Run account updates when due."""
+        schedule = self.schedule
+        while True:
+            self.wakeup.clear()
+
+            if len(schedule) == 0:
+                await self.wakeup.wait()
+                continue
+
+            due, _, account_id = schedule[0]
+            delay = due - monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(schedule)
+            if account_id not in self.accounts:
+                continue
+
+            if account_id not in self.running:
+                self.running[account_id] = asyncio.create_task(
+                    self.update_account(account_id)
+                )
+            else:
+                _LOGGER.debug("Account[%s]: update still running", account_id)
+
+            self.schedule_account(
+                account_id, max(due + self.update_interval, monotonic())
+            )
+
+    def start(self) -> None:
+        """Start accounts update scheduler."""
+        if self.task is None:
+            self.task = asyncio.create_task(self.scheduler())
+
+    async def stop(self) -> None:
+        """Stop accounts update scheduler and log out all accounts."""
+        task = self.task
+        self.task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        for account_id in list(self.accounts):
+            await self.remove_account(account_id)
+
+    async def update_account(self, account_id: str) -> None:
+        """Update account data."""
+        api = self.accounts.get(account_id)
+        if api is None:
+            return
+
+        start = perf_counter()
+        error = True
+        try:
+            if account_id in self.rediscover:
+                await api.login()
+                await api.discover()
+                self.rediscover.discard(account_id)
+            await api.update()
+            error = False
+        except LoginError as err:
+            _LOGGER.warning("Account[%s]: login failed (%s)", account_id, err)
+            self.rediscover.add(account_id)
+        except (AirzoneCloudError, TimeoutError) as err:
+            _LOGGER.warning("Account[%s]: update failed (%s)", account_id, err)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOGGER.exception("Account[%s]: unexpected update error", account_id)
+        finally:
+            self.update_metrics.observe(perf_counter() - start, error)
+            self.running.pop(account_id, None)
+
+    def metrics(self) -> dict[str, Any]:
+        """Return aggregated metrics of all accounts."""
+        api_metrics = EventMetrics(METRICS_HISTOGRAM_API)
+        api_metrics.merge(self.api_metrics)
+        websockets = 0
+        for api in self.accounts.values():
+            api_metrics.merge(api.get_api_metrics())
+            websockets += len(api.websockets)
+
+        return {
+            METRICS_ACCOUNTS: len(self.accounts),
+            METRICS_API: api_metrics.data(),
+            METRICS_LIMITER: {
+                METRICS_ACTIVE: self.limiter.get_active(),
+                METRICS_MAX: self.limiter.get_max_requests(),
+                METRICS_RATE: self.limiter.get_rate(),
+            },
+            METRICS_UPDATES: self.update_metrics.data(),
+            METRICS_WEBSOCKETS: websockets,
+        }
@@ -0,0 +1,200 @@
+"""Airzone Cloud API metrics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from time import monotonic
+from typing import Any
+
+from .const import (
+    METRICS_BUCKETS,
+    METRICS_BUCKETS_INF,
+    METRICS_COUNT,
+    METRICS_ERRORS,
+    METRICS_HISTOGRAM,
+    METRICS_MAX,
+    METRICS_MIN,
+    METRICS_P50,
+    METRICS_P90,
+    METRICS_P99,
+    METRICS_SUM,
+    METRICS_TIME,
+    WS_STATS_BYTES,
+    WS_STATS_DEVICES,
+    WS_STATS_FRAMES,
+    WS_STATS_HANDLER_LATENCY,
+    WS_STATS_LAST_FRAME_AGE,
+    WS_STATS_PERIOD,
+    WS_STATS_RATES,
+    WS_STATS_RECONNECTS,
+    WS_STATS_SAMPLES,
+    WS_STATS_STATE_DURATION,
+)
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Return percentile from sorted values."""
+    if len(values) == 0:
+        return None
+    idx = round(pct / 100 * (len(values) - 1))
+    return values[idx]
+
+
+class Histogram:
+    """Airzone Cloud fixed buckets histogram."""
+
+    def __init__(self, buckets: tuple[float, ...] = METRICS_HISTOGRAM) -> None:
+        """Airzone Cloud Histogram init."""
+        self.buckets: tuple[float, ...] = buckets
+        self.count: int = 0
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.max: float | None = None
+        self.min: float | None = None
+        self.sum: float = 0.0
+
+    def merge(self, other: Histogram) -> None:
+        """Add values from another Histogram with the same buckets."""
+        for idx, count in enumerate(other.counts):
+            self.counts[idx] += count
+        self.count += other.count
+        self.sum += other.sum
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def observe(self, value: float) -> None:
+        """Add value to Histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def data(self) -> dict[str, Any]:
+        """Return Histogram data."""
+        buckets: dict[str, int] = {}
+        for idx, bucket in enumerate(self.buckets):
+            buckets[str(bucket)] = self.counts[idx]
+        buckets[METRICS_BUCKETS_INF] = self.counts[-1]
+
+        return {
+            METRICS_BUCKETS: buckets,
+            METRICS_COUNT: self.count,
+            METRICS_MAX: self.max,
+            METRICS_MIN: self.min,
+            METRICS_SUM: self.sum,
+        }
+
+
+class EventMetrics:
+    """Airzone Cloud event metrics."""
+
+    def __init__(self, buckets: tuple[float, ...] = METRICS_HISTOGRAM) -> None:
+        """Airzone Cloud Event Metrics init."""
+        self.count: int = 0
+        self.errors: int = 0
+        self.time: Histogram = Histogram(buckets)
+
+    def data(self) -> dict[str, Any]:
+        """Return Event Metrics data."""
+        return {
+            METRICS_COUNT: self.count,
+            METRICS_ERRORS: self.errors,
+            METRICS_TIME: self.time.data(),
+        }
+
+    def merge(self, other: EventMetrics) -> None:
+        """Add events from another Event Metrics."""
+        self.count += other.count
+        self.errors += other.errors
+        self.time.merge(other.time)
+
+    def observe(self, elapsed: float, error: bool) -> None:
+        """Add event to metrics."""
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.time.observe(elapsed)
+
+
+class WebSocketsStats:
+    """Airzone Cloud WebSockets rolling statistics."""
+
+    def __init__(self) -> None:
+        """Airzone Cloud WebSockets Stats init."""
+        self.bytes: int = 0
+        self.frames: int = 0
+        self.last_frame: float | None = None
+        self.latency: deque[float] = deque(maxlen=WS_STATS_SAMPLES)
+        self.rates: deque[tuple[float, str]] = deque()
+        self.reconnects: int = 0
+        self.state_duration: float | None = None
+        self.state_start: float | None = None
+
+    def add_frame(self, key: str, size: int, latency: float) -> None:
+        """Add received frame to statistics."""
+        now = monotonic()
+
+        self.bytes += size
+        self.frames += 1
+        self.last_frame = now
+        self.latency.append(latency)
+        self.rates.append((now, key))
+        self.prune(now)
+
+    def add_reconnect(self) -> None:
+        """Add reconnection to statistics."""
+        self.reconnects += 1
+
+    def prune(self, now: float) -> None:
+        """Remove frames older than statistics period."""
+        rates = self.rates
+        while len(rates) > 0 and now - rates[0][0] > WS_STATS_PERIOD:
+            rates.popleft()
+
+    def set_state_end(self) -> None:
+        """Set WebSockets initial state end."""
+        if self.state_start is not None:
+            self.state_duration = monotonic() - self.state_start
+            self.state_start = None
+
+    def set_state_init(self) -> None:
+        """Set WebSockets initial state start."""
+        self.state_start = monotonic()
+
+    def data(self, devices: int) -> dict[str, Any]:
+        """Return WebSockets statistics data."""
+        now = monotonic()
+        self.prune(now)
+
+        rates: dict[str, float] = {}
+        for _, key in self.rates:
+            rates[key] = rates.get(key, 0) + 1
+        for key, count in rates.items():
+            rates[key] = count / WS_STATS_PERIOD
+
+        last_frame_age: float | None = None
+        if self.last_frame is not None:
+            last_frame_age = now - self.last_frame
+
+        latency = sorted(self.latency)
+
+        return {
+            WS_STATS_BYTES: self.bytes,
+            WS_STATS_DEVICES: devices,
+            WS_STATS_FRAMES: self.frames,
+            WS_STATS_HANDLER_LATENCY: {
+                METRICS_COUNT: len(latency),
+                METRICS_P50: percentile(latency, 50),
+                METRICS_P90: percentile(latency, 90),
+                METRICS_P99: percentile(latency, 99),
+            },
+            WS_STATS_LAST_FRAME_AGE: last_frame_age,
+            WS_STATS_RATES: rates,
+            WS_STATS_RECONNECTS: self.reconnects,
+            WS_STATS_STATE_DURATION: self.state_duration,
+        }
@@ -0,0 +1,583 @@
+"""Airzone Cloud mock server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+import copy
+from dataclasses import dataclass
+from json import load as json_load
+import logging
+import os
+import random
+from typing import Any, Final
+import urllib.parse
+from uuid import uuid4
+
+from aiohttp import WSMsgType, web
+
+from .const import (
+    API_ACCESS_TYPE,
+    API_AUTH_LOGIN,
+    API_AUTH_REFRESH_TOKEN,
+    API_AZ_AIDOO,
+    API_AZ_SYSTEM,
+    API_AZ_ZONE,
+    API_CELSIUS,
+    API_CONFIG,
+    API_DEVICE_ID,
+    API_DEVICE_TYPE,
+    API_DEVICES,
+    API_GROUP,
+    API_GROUP_ID,
+    API_GROUPS,
+    API_INSTALLATION_ID,
+    API_INSTALLATIONS,
+    API_IS_CONNECTED,
+    API_LOCAL_TEMP,
+    API_META,
+    API_NAME,
+    API_PARAM,
+    API_PARAMS,
+    API_REFRESH_TOKEN,
+    API_STATUS,
+    API_SYSTEM_NUMBER,
+    API_TOKEN,
+    API_TYPE,
+    API_UNITS,
+    API_USER,
+    API_USER_LOGOUT,
+    API_V1,
+    API_VALUE,
+    API_WS,
+    API_WS_ID,
+    API_WS_IDS,
+    API_ZONE_NUMBER,
+    HEADER_AUTHORIZATION,
+    WS_AUTH,
+    WS_BODY,
+    WS_CHANGE,
+    WS_CORR_ID,
+    WS_DEVICE_STATE,
+    WS_DEVICE_STATE_END,
+    WS_DEVICES_UPDATES,
+    WS_EVENT,
+    WS_INIT_TIMEOUT,
+    WS_INSTALLATION,
+    WS_INSTALLATION_ID,
+    WS_STATUS,
+    WS_WEBSOCKETS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MOCK_ZONES_PER_SYSTEM: Final[int] = 8
+MOCK_SYSTEMS_PER_WEBSERVER: Final[int] = 4
+MOCK_WEBSERVERS_PER_INSTALLATION: Final[int] = 4
+
+MOCK_ZONES_PER_WEBSERVER: Final[int] = (
+    MOCK_ZONES_PER_SYSTEM * MOCK_SYSTEMS_PER_WEBSERVER
+)
+MOCK_ZONES_PER_INSTALLATION: Final[int] = (
+    MOCK_ZONES_PER_WEBSERVER * MOCK_WEBSERVERS_PER_INSTALLATION
+)
+
+MOCK_STATS_DISCONNECTS: Final[str] = "disconnects"
+MOCK_STATS_RATE_LIMITED: Final[str] = "rate-limited"
+MOCK_STATS_REQUESTS: Final[str] = "requests"
+MOCK_STATS_WEBSOCKETS: Final[str] = "websockets"
+
+
+@dataclass
+class MockServerOptions:
+    """Airzone Cloud mock server options.
+
+    Latencies are in seconds. rate_limit is the probability of answering an
+    HTTP request with 429 and ws_disconnect the probability of closing a
+    WebSocket after each DEVICES_UPDATES burst, sent every ws_update_interval
+    seconds when set.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    rate_limit: float = 0.0
+    seed: int | None = None
+    ws_disconnect: float = 0.0
+    ws_update_interval: float | None = None
+
+
+class MockFleet:
+    """Airzone Cloud synthetic fleet built from the docs/ JSON fixtures.
+
+    Installations are filled with Flexa webservers, systems and zones up to
+    the requested number of zones, plus one Aidoo each. Fixture responses
+    are shared between devices until a device parameter is changed.
+    """
+
+    def __init__(self, docs_dir: str, zones: int) -> None:
+        """Airzone Cloud Mock Fleet init."""
+        flexa = load_fixture(docs_dir, "diagnostics-airzone-flexa.json")
+        aidoo = load_fixture(docs_dir, "diagnostics-airzone-aidoo.json")
+
+        self.config: dict[str, dict[str, Any]] = {}
+        self.device_installation: dict[str, str] = {}
+        self.devices: dict[str, list[str]] = {}
+        self.installation: dict[str, dict[str, Any]] = {}
+        self.installations: dict[str, Any] = {API_INSTALLATIONS: []}
+        self.login: dict[str, Any] = load_fixture(
+            docs_dir, "airzone-cloud-api-auth-login.json"
+        )
+        self.status: dict[str, dict[str, Any]] = {}
+        self.user: dict[str, Any] = {
+            key: value
+            for key, value in self.login.items()
+            if key not in (API_REFRESH_TOKEN, API_TOKEN)
+        }
+        self.webserver_devices: dict[str, list[dict[str, Any]]] = {}
+        self.webservers: dict[str, dict[str, Any]] = {}
+        self.zones: dict[str, list[str]] = {}
+
+        inst_template = flexa[API_INSTALLATIONS]["installation1"]
+        ws_az = flexa["webservers"]["webserver1"]
+        ws_aidoo = aidoo["webservers"]["webserver1"]
+        aidoo_status = aidoo["devices-status"]["device1"]
+        system_config = load_fixture(
+            docs_dir, "airzone-cloud-api-device-system-config.json"
+        )
+        system_status = load_fixture(
+            docs_dir, "airzone-cloud-api-device-system-status.json"
+        )
+        master_config = load_fixture(
+            docs_dir, "airzone-cloud-api-device-zone-master-config.json"
+        )
+        master_status = load_fixture(
+            docs_dir, "airzone-cloud-api-device-zone-master-status.json"
+        )
+        slave_config = load_fixture(
+            docs_dir, "airzone-cloud-api-device-zone-slave-config.json"
+        )
+        slave_status = load_fixture(
+            docs_dir, "airzone-cloud-api-device-zone-slave-status.json"
+        )
+
+        installations = max(1, -(-zones // MOCK_ZONES_PER_INSTALLATION))
+        for inst_idx in range(installations):
+            inst_id = f"installation{inst_idx}"
+            inst_zones = range(
+                inst_idx * MOCK_ZONES_PER_INSTALLATION,
+                min(zones, (inst_idx + 1) * MOCK_ZONES_PER_INSTALLATION),
+            )
+
+            devices: list[dict[str, Any]] = []
+            ws_ids: list[str] = []
+            zone_ids: list[str] = []
+            for zone_idx in inst_zones:
+                ws_num = zone_idx // MOCK_ZONES_PER_WEBSERVER
+                sys_num = 1 + (zone_idx // MOCK_ZONES_PER_SYSTEM) % (
+                    MOCK_SYSTEMS_PER_WEBSERVER
+                )
+                zone_num = 1 + zone_idx % MOCK_ZONES_PER_SYSTEM
+                ws_id = f"webserver{ws_num}"
+
+                if ws_id not in self.webservers:
+                    ws_ids += [ws_id]
+                    self.webservers[ws_id] = ws_az
+                if zone_num == 1:
+                    sys_id = f"system{ws_num}-{sys_num}"
+                    devices += [
+                        {
+                            API_DEVICE_ID: sys_id,
+                            API_TYPE: API_AZ_SYSTEM,
+                            API_WS_ID: ws_id,
+                            API_META: {API_SYSTEM_NUMBER: sys_num},
+                        }
+                    ]
+                    self.config[sys_id] = system_config
+                    self.status[sys_id] = system_status
+
+                zone_id = f"zone{zone_idx}"
+                devices += [
+                    {
+                        API_DEVICE_ID: zone_id,
+                        API_TYPE: API_AZ_ZONE,
+                        API_WS_ID: ws_id,
+                        API_META: {
+                            API_SYSTEM_NUMBER: sys_num,
+                            API_ZONE_NUMBER: zone_num,
+                        },
+                        API_NAME: f"Zone {zone_idx}",
+                    }
+                ]
+                zone_ids += [zone_id]
+                if zone_num == 1:
+                    self.config[zone_id] = master_config
+                    self.status[zone_id] = master_status
+                else:
+                    self.config[zone_id] = slave_config
+                    self.status[zone_id] = slave_status
+
+            aidoo_ws_id = f"aidoo-webserver{inst_idx}"
+            aidoo_id = f"aidoo{inst_idx}"
+            ws_ids += [aidoo_ws_id]
+            self.webservers[aidoo_ws_id] = ws_aidoo
+            devices += [
+                {
+                    API_DEVICE_ID: aidoo_id,
+                    API_TYPE: API_AZ_AIDOO,
+                    API_WS_ID: aidoo_ws_id,
+                    API_META: {API_UNITS: 0},
+                    API_NAME: f"Aidoo {inst_idx}",
+                }
+            ]
+            self.status[aidoo_id] = aidoo_status
+
+            installation = copy.deepcopy(inst_template)
+            installation[API_INSTALLATION_ID] = inst_id
+            installation[API_GROUPS] = [
+                {
+                    API_GROUP_ID: f"group{inst_idx}",
+                    API_NAME: "Group",
+                    API_DEVICES: devices,
+                }
+            ]
+            self.devices[inst_id] = [device[API_DEVICE_ID] for device in devices]
+            for device in devices:
+                ws_device: dict[str, Any] = {
+                    API_CONFIG: device[API_META],
+                    API_DEVICE_ID: device[API_DEVICE_ID],
+                    API_DEVICE_TYPE: device[API_TYPE],
+                    API_IS_CONNECTED: True,
+                }
+                if API_NAME in device:
+                    ws_device[API_NAME] = device[API_NAME]
+                self.webserver_devices.setdefault(device[API_WS_ID], []).append(
+                    ws_device
+                )
+            for dev_id in self.devices[inst_id]:
+                self.device_installation[dev_id] = inst_id
+            self.zones[inst_id] = zone_ids
+            self.installation[inst_id] = installation
+            self.installations[API_INSTALLATIONS] += [
+                {
+                    API_INSTALLATION_ID: inst_id,
+                    API_NAME: inst_id,
+                    API_WS_IDS: ws_ids,
+                    API_ACCESS_TYPE: installation[API_ACCESS_TYPE],
+                }
+            ]
+        self.installations["total"] = installations
+
+    def get_response(self, path: str) -> dict[str, Any] | None:
+        """Return fixture response of an API request path."""
+        url = urllib.parse.urlsplit(path)
+        parts = url.path.strip("/").removeprefix(f"{API_V1}/")
+        res: dict[str, Any] | None = None
+        if parts == API_AUTH_LOGIN or parts.startswith(f"{API_AUTH_REFRESH_TOKEN}/"):
+            res = self.login
+        elif parts == API_USER:
+            res = self.user
+        elif parts == API_USER_LOGOUT:
+            res = {}
+        else:
+            keys = parts.split("/")
+            if keys[0] == API_INSTALLATIONS:
+                if len(keys) == 1:
+                    res = self.installations
+                else:
+                    res = self.installation.get(keys[1])
+            elif keys[0] == API_DEVICES and len(keys) == 3:
+                if keys[2] == API_STATUS:
+                    res = self.status.get(keys[1])
+                elif keys[2] == API_CONFIG:
+                    res = self.config.get(keys[1], {})
+            elif keys[0] == API_DEVICES and len(keys) == 4 and keys[1] == API_WS:
+                res = self.webservers.get(keys[2])
+                if res is not None and API_DEVICES in urllib.parse.parse_qs(url.query):
+                    res = res | {API_DEVICES: self.webserver_devices.get(keys[2], [])}
+        return res
+
+    def get_installation_id(self, dev_id: str) -> str | None:
+        """Return installation ID of a device."""
+        return self.device_installation.get(dev_id)
+
+    def get_zones(self, inst_id: str | None = None) -> list[str]:
+        """Return zone IDs of an installation or of the whole fleet."""
+        if inst_id is not None:
+            return self.zones.get(inst_id, [])
+        return [zone_id for zones in self.zones.values() for zone_id in zones]
+
+    def set_param(self, dev_id: str, param: str, value: Any) -> dict[str, Any]:
+        """Set device status parameter and return the status change."""
+        status = dict(self.status[dev_id])
+        cur = status.get(param)
+        if isinstance(cur, dict) and API_CELSIUS in cur:
+            value = {API_CELSIUS: value}
+        status[param] = value
+        self.status[dev_id] = status
+        return {param: value}
+
+
+class AirzoneCloudMockServer:
+    """Airzone Cloud mock server.
+
+    Serves the REST endpoints and the installation WebSockets used by
+    AirzoneCloudApi from a MockFleet, so that the client can be load tested
+    offline through ConnectionOptions api_url and ws_url.
+    """
+
+    def __init__(self, fleet: MockFleet, options: MockServerOptions | None = None):
+        """Airzone Cloud Mock Server init."""
+        self.app: web.Application = web.Application(middlewares=[self.middleware])
+        self.fleet: MockFleet = fleet
+        self.options: MockServerOptions = options or MockServerOptions()
+        self.random: random.Random = random.Random(self.options.seed)
+        self.runner: web.AppRunner | None = None
+        self.site: web.TCPSite | None = None
+        self.stats: Counter[str] = Counter()
+        self.websockets: dict[str, list[web.WebSocketResponse]] = {}
+
+        prefix = f"/{API_V1}"
+        self.app.router.add_post(f"{prefix}/{API_AUTH_LOGIN}", self.handle_get)
+        self.app.router.add_get(
+            f"{prefix}/{API_AUTH_REFRESH_TOKEN}/{{token}}", self.handle_get
+        )
+        self.app.router.add_get(f"{prefix}/{API_USER}", self.handle_get)
+        self.app.router.add_get(f"{prefix}/{API_USER_LOGOUT}", self.handle_get)
+        self.app.router.add_get(f"{prefix}/{API_INSTALLATIONS}", self.handle_get)
+        self.app.router.add_get(
+            f"{prefix}/{API_INSTALLATIONS}/{{inst_id}}", self.handle_get
+        )
+        self.app.router.add_put(
+            f"{prefix}/{API_INSTALLATIONS}/{{inst_id}}", self.handle_put_installation
+        )
+        self.app.router.add_put(
+            f"{prefix}/{API_INSTALLATIONS}/{{inst_id}}/{API_GROUP}/{{group_id}}",
+            self.handle_put_group,
+        )
+        self.app.router.add_get(
+            f"{prefix}/{API_DEVICES}/{API_WS}/{{ws_id}}/{API_STATUS}", self.handle_get
+        )
+        self.app.router.add_get(
+            f"{prefix}/{API_DEVICES}/{{dev_id}}/{API_STATUS}", self.handle_get
+        )
+        self.app.router.add_get(
+            f"{prefix}/{API_DEVICES}/{{dev_id}}/{API_CONFIG}", self.handle_get
+        )
+        self.app.router.add_patch(
+            f"{prefix}/{API_DEVICES}/{{dev_id}}", self.handle_patch_device
+        )
+        self.app.router.add_get(
+            f"{prefix}/{WS_WEBSOCKETS}/{WS_INSTALLATION}", self.handle_websocket
+        )
+
+    def get_api_url(self) -> str:
+        """Return mock server API base URL."""
+        return f"http://{self.get_host()}"
+
+    def get_host(self) -> str:
+        """Return mock server host:port."""
+        if self.runner is None:
+            raise RuntimeError("Mock server not started")
+        host, port = self.runner.addresses[0][:2]
+        return f"{host}:{port}"
+
+    def get_stats(self) -> dict[str, int]:
+        """Return mock server statistics."""
+        return dict(self.stats)
+
+    def get_ws_url(self) -> str:
+        """Return mock server WebSockets base URL."""
+        return f"ws://{self.get_host()}"
+
+    @web.middleware
+    async def middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Apply latency, 429 injection and authorization to API requests."""
+        if request.path.endswith(f"/{WS_WEBSOCKETS}/{WS_INSTALLATION}"):
+            return await handler(request)
+
+        self.stats[MOCK_STATS_REQUESTS] += 1
+        options = self.options
+        if options.latency > 0 or options.latency_jitter > 0:
+            await asyncio.sleep(
+                options.latency + self.random.random() * options.latency_jitter
+            )
+        if options.rate_limit > 0 and self.random.random() < options.rate_limit:
+            self.stats[MOCK_STATS_RATE_LIMITED] += 1
+            raise web.HTTPTooManyRequests()
+        if (
+            not request.path.endswith(API_AUTH_LOGIN)
+            and HEADER_AUTHORIZATION not in request.headers
+        ):
+            raise web.HTTPUnauthorized()
+
+        return await handler(request)
+
+    async def handle_get(self, request: web.Request) -> web.Response:
+        """Handle fixture requests."""
+        res = self.fleet.get_response(request.path_qs)
+        if res is None:
+            raise web.HTTPNotFound()
+        return web.json_response(res)
+
+    async def handle_patch_device(self, request: web.Request) -> web.Response:
+        """Handle device parameter changes."""
+        dev_id = request.match_info["dev_id"]
+        if dev_id not in self.fleet.status:
+            raise web.HTTPNotFound()
+
+        data: dict[str, Any] = await request.json()
+        param = data.get(API_PARAM)
+        if param is None or API_VALUE not in data:
+            raise web.HTTPBadRequest()
+
+        await self.set_params(dev_id, {param: data[API_VALUE]})
+
+        return web.json_response({})
+
+    async def handle_put_group(self, request: web.Request) -> web.Response:
+        """Handle group parameter changes."""
+        inst_id = request.match_info["inst_id"]
+        group_id = request.match_info["group_id"]
+        installation = self.fleet.installation.get(inst_id)
+        if installation is None:
+            raise web.HTTPNotFound()
+
+        data: dict[str, Any] = await request.json()
+        params: dict[str, Any] = data.get(API_PARAMS) or {}
+        for group in installation[API_GROUPS]:
+            if group[API_GROUP_ID] == group_id:
+                for device in group[API_DEVICES]:
+                    await self.set_params(device[API_DEVICE_ID], params)
+                return web.json_response({})
+
+        raise web.HTTPNotFound()
+
+    async def handle_put_installation(self, request: web.Request) -> web.Response:
+        """Handle installation parameter changes."""
+        inst_id = request.match_info["inst_id"]
+        if inst_id not in self.fleet.devices:
+            raise web.HTTPNotFound()
+
+        data: dict[str, Any] = await request.json()
+        params: dict[str, Any] = data.get(API_PARAMS) or {}
+        for dev_id in self.fleet.devices[inst_id]:
+            await self.set_params(dev_id, params)
+
+        return web.json_response({})
+
+    async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Handle installation WebSockets."""
+        inst_id = request.query.get(WS_INSTALLATION_ID, "")
+        if inst_id not in self.fleet.devices:
+            raise web.HTTPNotFound()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.stats[MOCK_STATS_WEBSOCKETS] += 1
+
+        corr_id = str(uuid4())
+        await ws.send_json({WS_EVENT: WS_AUTH, WS_CORR_ID: corr_id})
+        try:
+            auth = await ws.receive_json(timeout=WS_INIT_TIMEOUT)
+        except (TimeoutError, TypeError, ValueError):
+            await ws.close()
+            return ws
+        if auth.get(WS_CORR_ID) != corr_id:
+            await ws.close()
+            return ws
+
+        for dev_id in self.fleet.devices[inst_id]:
+            await ws.send_json(
+                {
+                    WS_EVENT: WS_DEVICE_STATE,
+                    WS_BODY: {
+                        API_DEVICE_ID: dev_id,
+                        WS_STATUS: self.fleet.status[dev_id],
+                    },
+                }
+            )
+        await ws.send_json({WS_EVENT: WS_DEVICE_STATE_END, WS_BODY: inst_id})
+
+        self.websockets.setdefault(inst_id, []).append(ws)
+        try:
+            await self.websocket_loop(inst_id, ws)
+        finally:
+            self.websockets[inst_id].remove(ws)
+
+        return ws
+
+    async def send_change(self, dev_id: str, status: dict[str, Any]) -> None:
+        """Send device status change to installation WebSockets."""
+        inst_id = self.fleet.get_installation_id(dev_id)
+        if inst_id is None:
+            return
+
+        msg = {
+            WS_EVENT: f"{WS_DEVICES_UPDATES}.{dev_id}",
+            WS_BODY: {
+                API_DEVICE_ID: dev_id,
+                WS_CHANGE: {WS_STATUS: status},
+            },
+        }
+        for ws in list(self.websockets.get(inst_id, [])):
+            if not ws.closed:
+                try:
+                    await ws.send_json(msg)
+                except ConnectionError:
+                    # Peer went away without closing the WebSocket
+                    await ws.close()
+
+    async def set_params(self, dev_id: str, params: dict[str, Any]) -> None:
+        """Set device status parameters and notify WebSockets."""
+        for param, value in params.items():
+            await self.send_change(dev_id, self.fleet.set_param(dev_id, param, value))
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start mock server."""
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        self.site = web.TCPSite(self.runner, host, port)
+        await self.site.start()
+
+    async def stop(self) -> None:
+        """Stop mock server."""
+        for websockets in self.websockets.values():
+            for ws in list(websockets):
+                await ws.close()
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+            self.site = None
+
+    async def websocket_loop(self, inst_id: str, ws: web.WebSocketResponse) -> None:
+        """Send periodic updates until the WebSocket is closed."""
+        interval = self.options.ws_update_interval
+        while not ws.closed:
+            try:
+                msg = await ws.receive(timeout=interval)
+            except TimeoutError:
+                await self.websocket_updates(inst_id)
+                if self.random.random() < self.options.ws_disconnect:
+                    self.stats[MOCK_STATS_DISCONNECTS] += 1
+                    await ws.close()
+                continue
+            if msg.type in (WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.ERROR):
+                break
+
+    async def websocket_updates(self, inst_id: str) -> None:
+        """Send a burst of zone temperature changes."""
+        for dev_id in self.fleet.get_zones(inst_id):
+            temp = round(self.random.uniform(18.0, 26.0), 1)
+            await self.send_change(dev_id, {API_LOCAL_TEMP: {API_CELSIUS: temp}})
+
+
+def load_fixture(docs_dir: str, name: str) -> dict[str, Any]:
+    """Load JSON fixture."""
+    with open(os.path.join(docs_dir, name), encoding="utf-8") as file:
+        data: dict[str, Any] = json_load(file)
+        return data
@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from .common import EntityKind
 from .const import API_SYSTEM_NUMBER, AZD_SYSTEM
 from .device import Device
 from .entity import EntityUpdate
+from .snapshot import OutputSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +17,11 @@ _LOGGER = logging.getLogger(__name__)
 class Output(Device):
     """Airzone Cloud Output device."""
 
+    __slots__ = ("system_number",)
+
+    kind = EntityKind.OUTPUT
+    snapshot_class = OutputSnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud Output device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -0,0 +1,175 @@
+"""Airzone Cloud devices query."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from enum import StrEnum
+from typing import Any, Final
+
+from .air_quality import AirQuality
+from .common import EntityKind, OperationMode
+from .device import Device
+from .device_group import DeviceGroup
+from .entity import Entity, EntityChanges
+from .output import Output
+from .system import System
+from .zone import Zone
+
+
+class QueryIndex(StrEnum):
+    """Airzone Cloud devices query indexes."""
+
+    AVAILABLE = "available"
+    GROUP = "group"
+    INSTALLATION = "installation"
+    KIND = "kind"
+    MODE = "mode"
+    SYSTEM = "system"
+    WEBSERVER = "webserver"
+
+
+DYNAMIC_INDEXES: Final[tuple[QueryIndex, ...]] = (
+    QueryIndex.AVAILABLE,
+    QueryIndex.MODE,
+)
+
+# Entity attributes which can change the value of dynamic indexes
+QUERY_ATTRS: Final[dict[str, tuple[QueryIndex, ...]]] = {
+    "is_connected": (QueryIndex.AVAILABLE,),
+    "mode": (QueryIndex.MODE,),
+    "ws_connected": (QueryIndex.AVAILABLE,),
+}
+
+
+def get_index_value(device: Device, index: QueryIndex) -> Any:
+    """Return device value for a dynamic query index."""
+    if index is QueryIndex.AVAILABLE:
+        return device.get_available()
+    return device.get_mode()
+
+
+class DeviceQuery:
+    """Airzone Cloud devices query.
+
+    Devices are kept in secondary indexes so that selective queries only
+    iterate over the smallest matching index bucket. Static indexes are
+    filled when devices are added, while dynamic ones (availability and
+    mode) are refreshed from entity change events.
+    """
+
+    def __init__(self) -> None:
+        """Airzone Cloud Device Query init."""
+        self.devices: dict[str, Device] = {}
+        self.indexes: dict[QueryIndex, dict[Any, dict[str, Device]]] = {
+            index: {} for index in QueryIndex
+        }
+        self.values: dict[str, dict[QueryIndex, Any]] = {}
+
+    def add_device(self, device: Device) -> None:
+        """Add device to query indexes."""
+        dev_id = device.get_id()
+        if dev_id in self.devices:
+            return
+
+        self.devices[dev_id] = device
+        self.values[dev_id] = {}
+
+        self.set_index(device, QueryIndex.INSTALLATION, device.get_installation())
+        self.set_index(device, QueryIndex.KIND, device.get_kind())
+        self.set_index(device, QueryIndex.WEBSERVER, device.get_webserver())
+        if isinstance(device, (AirQuality, Output, System, Zone)):
+            self.set_index(device, QueryIndex.SYSTEM, device.get_system_num())
+        for index in DYNAMIC_INDEXES:
+            self.set_index(device, index, get_index_value(device, index))
+
+    def add_group(self, group: DeviceGroup) -> None:
+        """Add group devices to query indexes."""
+        group_id = group.get_id()
+        for device in group.get_devices():
+            self.add_device(device)
+            self.set_index(device, QueryIndex.GROUP, group_id)
+
+    def get_devices(
+        self,
+        *,
+        available: bool | None = None,
+        group_id: str | None = None,
+        installation_id: str | None = None,
+        kind: EntityKind | None = None,
+        mode: OperationMode | None = None,
+        system_num: int | None = None,
+        webserver_id: str | None = None,
+    ) -> Iterator[Device]:
+        """Return lazy iterator of devices matching all the filters."""
+        filters: list[tuple[QueryIndex, Any]] = [
+            (index, value)
+            for index, value in (
+                (QueryIndex.AVAILABLE, available),
+                (QueryIndex.GROUP, group_id),
+                (QueryIndex.INSTALLATION, installation_id),
+                (QueryIndex.KIND, kind),
+                (QueryIndex.MODE, mode),
+                (QueryIndex.SYSTEM, system_num),
+                (QueryIndex.WEBSERVER, webserver_id),
+            )
+            if value is not None
+        ]
+
+        if len(filters) == 0:
+            return iter(tuple(self.devices.values()))
+
+        buckets: list[dict[str, Device]] = []
+        for index, value in filters:
+            bucket = self.indexes[index].get(value)
+            if bucket is None:
+                return iter(())
+            buckets += [bucket]
+        buckets.sort(key=len)
+
+        return filter_devices(tuple(buckets[0].items()), buckets[1:])
+
+    def set_index(self, device: Device, index: QueryIndex, value: Any) -> None:
+        """Move device to the index bucket of value."""
+        dev_id = device.get_id()
+        values = self.values[dev_id]
+        index_buckets = self.indexes[index]
+
+        if index in values:
+            cur = values[index]
+            if cur == value:
+                return
+            bucket = index_buckets[cur]
+            bucket.pop(dev_id, None)
+            if len(bucket) == 0:
+                del index_buckets[cur]
+            del values[index]
+
+        if value is not None:
+            index_buckets.setdefault(value, {})[dev_id] = device
+            values[index] = value
+
+    def update_changes(self, entity: Entity, changes: EntityChanges) -> None:
+        """Refresh dynamic indexes affected by Entity changes."""
+        if not isinstance(entity, Device) or entity.get_id() not in self.devices:
+            return
+        for attr in changes:
+            for index in QUERY_ATTRS.get(attr, ()):
+                self.set_index(entity, index, get_index_value(entity, index))
+
+    def update_device(self, device: Device) -> None:
+        """Refresh device dynamic indexes."""
+        if device.get_id() in self.devices:
+            for index in DYNAMIC_INDEXES:
+                self.set_index(device, index, get_index_value(device, index))
+
+
+def filter_devices(
+    devices: tuple[tuple[str, Device], ...], buckets: list[dict[str, Device]]
+) -> Iterator[Device]:
+    """Yield devices present in all buckets."""
+    for dev_id, device in devices:
+        for bucket in buckets:
+            if dev_id not in bucket:
+                break
+        else:
+            yield device
@@ -0,0 +1,93 @@
+"""Airzone Cloud API raw data."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .common import RawDataMode
+from .const import RAW_DATA_MAX
+
+
+class RawDataStore:
+    """Airzone Cloud API raw data store.
+
+    Keeps the last API response of each section and subkey, depending on
+    the retention mode: nothing (off), up to max_items subkeys per section,
+    dropping the least recently updated (latest) or everything (full).
+
+    Snapshots are read-only views shared with the store, which copies a
+    section before its next update (copy-on-write), so taking a snapshot
+    doesn't copy unchanged sections. Responses are shared and must not be
+    modified.
+    """
+
+    def __init__(
+        self,
+        sections: Iterable[str],
+        mode: RawDataMode = RawDataMode.FULL,
+        max_items: int = RAW_DATA_MAX,
+    ) -> None:
+        """Airzone Cloud Raw Data Store init."""
+        self.data: dict[str, Any] = {}
+        self.max_items: int = max_items
+        self.mode: RawDataMode = mode
+        self.sections: dict[str, OrderedDict[str, Any]] = {
+            key: OrderedDict() for key in sections
+        }
+        self.shared: set[str] = set()
+        self.snapshot: Mapping[str, Any] | None = None
+
+    def clear(self) -> None:
+        """Remove all raw data."""
+        self.data = {}
+        self.sections = {key: OrderedDict() for key in self.sections}
+        self.shared.clear()
+        self.snapshot = None
+
+    def get_mode(self) -> RawDataMode:
+        """Return retention mode."""
+        return self.mode
+
+    def get_snapshot(self) -> Mapping[str, Any]:
+        """Return read-only snapshot of raw data."""
+        snapshot = self.snapshot
+        if snapshot is None:
+            data: dict[str, Any] = dict(self.data)
+            for key, section in self.sections.items():
+                data[key] = MappingProxyType(section)
+            self.shared = set(self.sections)
+            snapshot = self.snapshot = MappingProxyType(data)
+        return snapshot
+
+    def set(self, key: str, subkey: str | None, value: dict[str, Any]) -> None:
+        """Save raw data."""
+        if self.mode == RawDataMode.OFF:
+            return
+
+        self.snapshot = None
+
+        if subkey is None:
+            self.data[key] = value
+            return
+
+        section = self.sections.get(key)
+        if section is None:
+            section = self.sections[key] = OrderedDict()
+        elif key in self.shared:
+            section = self.sections[key] = section.copy()
+            self.shared.discard(key)
+
+        section[subkey] = value
+        if self.mode == RawDataMode.LATEST:
+            section.move_to_end(subkey)
+            while len(section) > self.max_items:
+                section.popitem(last=False)
+
+    def set_mode(self, mode: RawDataMode) -> None:
+        """Set retention mode."""
+        self.mode = mode
+        if mode == RawDataMode.OFF:
+            self.clear()
@@ -0,0 +1,127 @@
+"""Airzone Cloud WebSockets recorder and replay."""
+
+from __future__ import annotations
+
+import asyncio
+from json import dumps as json_dumps, loads as json_loads
+import logging
+import os
+from time import monotonic
+from typing import IO, TYPE_CHECKING, Any, cast
+import urllib.parse
+
+from aiohttp import ClientWebSocketResponse, WSMessage, WSMsgType
+
+from .const import WS_RECORD_DATA, WS_RECORD_EXT, WS_RECORD_TIME, WS_RECORD_TYPE
+
+if TYPE_CHECKING:
+    from .websockets import AirzoneCloudIWS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WebSocketsRecorder:
+    """Airzone Cloud WebSockets frame recorder."""
+
+    def __init__(self, directory: str, inst_id: str) -> None:
+        """Airzone Cloud WebSockets Recorder init."""
+        file_name = urllib.parse.quote(inst_id, safe="")
+
+        self.file: IO[str] | None = None
+        self.path: str = os.path.join(directory, f"{file_name}.{WS_RECORD_EXT}")
+        self.start: float = monotonic()
+
+    def close(self) -> None:
+        """Close WebSockets recording file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def record(self, msg: WSMessage) -> None:
+        """Record WebSockets frame."""
+        data: Any = msg.data
+        if not isinstance(data, (int, str)):
+            data = None
+
+        frame = {
+            WS_RECORD_DATA: data,
+            WS_RECORD_TIME: round(monotonic() - self.start, 6),
+            WS_RECORD_TYPE: int(msg.type),
+        }
+
+        try:
+            if self.file is None:
+                # File is kept open between frames and closed on disconnect
+                # pylint: disable-next=consider-using-with
+                self.file = open(self.path, "a", buffering=1, encoding="utf-8")
+            self.file.write(json_dumps(frame, separators=(",", ":")) + "\n")
+        except OSError as err:
+            _LOGGER.error("WS recorder: %s", err)
+
+
+class ReplayWebSocket:
+    """Airzone Cloud WebSockets replay connection."""
+
+    async def close(self) -> bool:
+        """Close replay connection."""
+        return True
+
+    async def pong(self, message: bytes = b"") -> None:
+        """Send replay PONG."""
+
+    async def send_json(self, data: Any) -> None:
+        """Send replay JSON data."""
+
+
+class WebSocketsReplay:
+    """Airzone Cloud WebSockets recording replay."""
+
+    def __init__(self, path: str) -> None:
+        """Airzone Cloud WebSockets Replay init."""
+        self.frames: list[tuple[float, WSMessage]] = []
+        self.path: str = path
+
+    def load(self) -> int:
+        """Load WebSockets recording frames."""
+        frames: list[tuple[float, WSMessage]] = []
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if len(line.strip()) == 0:
+                    continue
+                frame = json_loads(line)
+                msg = WSMessage(
+                    WSMsgType(frame[WS_RECORD_TYPE]),
+                    frame.get(WS_RECORD_DATA),
+                    None,
+                )
+                frames += [(float(frame[WS_RECORD_TIME]), msg)]
+
+        self.frames = frames
+
+        return len(frames)
+
+    async def run(self, inst_ws: AirzoneCloudIWS, speed: float | None = 1.0) -> int:
+        """Feed recorded frames to WebSockets handler.
+
+        Speed 1.0 replays at original speed, higher values accelerate it and
+        None replays at maximum speed.
+        """
+        if len(self.frames) == 0:
+            self.load()
+
+        ws = cast(ClientWebSocketResponse, ReplayWebSocket())
+
+        start = monotonic()
+        first: float | None = None
+        for frame_time, msg in self.frames:
+            if speed is not None and speed > 0:
+                if first is None:
+                    first = frame_time
+                delay = (frame_time - first) / speed - (monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await inst_ws.handler(ws, msg)
+
+        return len(self.frames)
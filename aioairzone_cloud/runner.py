@@ -0,0 +1,381 @@
+"""Airzone Cloud multi-process runner."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect, insort
+from collections.abc import Callable
+from enum import IntEnum
+from hashlib import blake2b
+import logging
+import multiprocessing
+from multiprocessing.context import SpawnProcess
+from multiprocessing.queues import Queue
+import os
+from queue import Empty
+from time import monotonic
+from typing import Any
+
+from aiohttp import ClientSession
+
+from .common import ConnectionOptions, EntityKind
+from .const import (
+    HTTP_MAX_REQUESTS,
+    MANAGER_MAX_REQUESTS,
+    MANAGER_UPDATE_INTERVAL,
+    RUNNER_POLL_TIMEOUT,
+    RUNNER_VNODES,
+)
+from .entity import EntityChange, EntityEvent
+from .exceptions import AirzoneCloudError
+from .manager import AirzoneCloudManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# (kind, entity id, ((attr, old, new), ...))
+PackedEvent = tuple[str, str, tuple[tuple[str, Any, Any], ...]]
+
+RunnerChangesCallback = Callable[[str, list[EntityEvent]], None]
+RunnerErrorCallback = Callable[[str, str], None]
+
+
+class RunnerMessage(IntEnum):
+    """Airzone Cloud runner IPC messages."""
+
+    ADD = 1
+    REMOVE = 2
+    STOP = 3
+    EVENTS = 4
+    ERROR = 5
+
+
+def get_hash(key: str) -> int:
+    """Return stable 64-bit hash of key."""
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest())
+
+
+def pack_events(events: list[EntityEvent]) -> list[PackedEvent]:
+    """Pack change events for IPC."""
+    return [
+        (
+            str(event.kind),
+            event.id,
+            tuple(
+                (attr, change.old, change.new) for attr, change in event.changes.items()
+            ),
+        )
+        for event in events
+    ]
+
+
+def unpack_events(packed: list[PackedEvent]) -> list[EntityEvent]:
+    """Unpack change events received from IPC."""
+    return [
+        EntityEvent(
+            EntityKind(kind),
+            entity_id,
+            {attr: EntityChange(old, new) for attr, old, new in changes},
+        )
+        for kind, entity_id, changes in packed
+    ]
+
+
+class HashRing:
+    """Consistent hashing ring.
+
+    Every node is placed on the ring several times so that keys are spread
+    evenly and removing a node only moves the keys it owned.
+    """
+
+    def __init__(self, vnodes: int = RUNNER_VNODES) -> None:
+        """Hash Ring init."""
+        self.hashes: list[int] = []
+        self.nodes: dict[int, int] = {}
+        self.vnodes: int = vnodes
+
+    def add_node(self, node: int) -> None:
+        """Add node to ring."""
+        for idx in range(self.vnodes):
+            key_hash = get_hash(f"{node}:{idx}")
+            if key_hash not in self.nodes:
+                self.nodes[key_hash] = node
+                insort(self.hashes, key_hash)
+
+    def get_node(self, key: str) -> int:
+        """Return node owning key."""
+        if len(self.hashes) == 0:
+            raise AirzoneCloudError("No nodes available")
+        idx = bisect(self.hashes, get_hash(key)) % len(self.hashes)
+        return self.nodes[self.hashes[idx]]
+
+    def remove_node(self, node: int) -> None:
+        """Remove node from ring."""
+        self.hashes = [
+            key_hash for key_hash in self.hashes if self.nodes[key_hash] != node
+        ]
+        self.nodes = {
+            key_hash: key_node
+            for key_hash, key_node in self.nodes.items()
+            if key_node != node
+        }
+
+
+class AirzoneCloudRunner:
+    """Airzone Cloud multi-process runner.
+
+    Accounts are sharded across worker processes with consistent hashing.
+    Each worker runs its own event loop with an AirzoneCloudManager and
+    streams packed change events back through a queue. When a worker dies,
+    a replacement is started with the same ID and its accounts are added
+    to it again.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_requests: int = MANAGER_MAX_REQUESTS,
+        account_requests: int = HTTP_MAX_REQUESTS,
+        update_interval: float = MANAGER_UPDATE_INTERVAL,
+    ) -> None:
+        """Airzone Cloud Runner init."""
+        self.account_requests: int = account_requests
+        self.accounts: dict[str, ConnectionOptions] = {}
+        self.assignments: dict[str, int] = {}
+        self.changes_function: RunnerChangesCallback | None = None
+        self.context = multiprocessing.get_context("spawn")
+        self.error_function: RunnerErrorCallback | None = None
+        self.events: Queue[tuple[Any, ...]] = self.context.Queue()
+        self.max_requests: int = max_requests
+        self.processes: dict[int, SpawnProcess] = {}
+        self.queues: dict[int, Queue[tuple[Any, ...]]] = {}
+        self.ring: HashRing = HashRing()
+        self.task: asyncio.Task[None] | None = None
+        self.update_interval: float = update_interval
+        self.workers: int = workers or os.cpu_count() or 1
+
+    def add_account(self, account_id: str, options: ConnectionOptions) -> None:
+        """Add account to its worker shard."""
+        self.accounts[account_id] = options
+        self.assign_account(account_id)
+
+    def assign_account(self, account_id: str) -> None:
+        """Send account to the worker owning it."""
+        worker_id = self.ring.get_node(account_id)
+        self.assignments[account_id] = worker_id
+        self.queues[worker_id].put(
+            (RunnerMessage.ADD, account_id, self.accounts[account_id])
+        )
+
+    def get_worker(self, account_id: str) -> int | None:
+        """Return worker assigned to account."""
+        return self.assignments.get(account_id)
+
+    def get_workers(self) -> list[int]:
+        """Return alive workers."""
+        return list(self.processes)
+
+    def remove_account(self, account_id: str) -> None:
+        """Remove account from its worker shard."""
+        self.accounts.pop(account_id, None)
+        worker_id = self.assignments.pop(account_id, None)
+        if worker_id is not None and worker_id in self.queues:
+            self.queues[worker_id].put((RunnerMessage.REMOVE, account_id))
+
+    def check_workers(self) -> None:
+        """Rebalance accounts of dead workers."""
+        dead = [
+            worker_id
+            for worker_id, process in self.processes.items()
+            if not process.is_alive()
+        ]
+        if len(dead) == 0:
+            return
+
+        for worker_id in dead:
+            _LOGGER.warning("Runner: worker %s died, restarting", worker_id)
+            self.processes.pop(worker_id).close()
+            self.queues.pop(worker_id).close()
+            self.ring.remove_node(worker_id)
+            self.start_worker(worker_id)
+
+        for account_id, worker_id in list(self.assignments.items()):
+            if worker_id in dead:
+                self.assign_account(account_id)
+
+    def handle_message(self, msg: tuple[Any, ...]) -> None:
+        """Handle worker message."""
+        if msg[0] == RunnerMessage.EVENTS:
+            _, account_id, packed = msg
+            if self.changes_function is not None:
+                self.changes_function(account_id, unpack_events(packed))
+        elif msg[0] == RunnerMessage.ERROR:
+            _, account_id, error = msg
+            _LOGGER.error("Runner: account %s error (%s)", account_id, error)
+            if self.error_function is not None:
+                self.error_function(account_id, error)
+
+    async def monitor(self) -> None:
+        """Receive worker messages and watch workers."""
+        checked = monotonic()
+        while True:
+            try:
+                msg = await asyncio.to_thread(
+                    self.events.get, True, RUNNER_POLL_TIMEOUT
+                )
+            except Empty:
+                pass
+            else:
+                self.handle_message(msg)
+
+            now = monotonic()
+            if now - checked >= RUNNER_POLL_TIMEOUT:
+                checked = now
+                self.check_workers()
+
+    def set_changes_callback(self, changes_function: RunnerChangesCallback) -> None:
+        """Set change events callback, called with account ID and events."""
+        self.changes_function = changes_function
+
+    def set_error_callback(self, error_function: RunnerErrorCallback) -> None:
+        """Set account errors callback, called with account ID and error."""
+        self.error_function = error_function
+
+    def start(self) -> None:
+        """Start worker processes."""
+        for worker_id in range(self.workers):
+            self.start_worker(worker_id)
+
+        if self.task is None:
+            self.task = asyncio.create_task(self.monitor())
+
+    def start_worker(self, worker_id: int) -> None:
+        """Start worker process and add it to the ring."""
+        queue: Queue[tuple[Any, ...]] = self.context.Queue()
+        process = self.context.Process(
+            target=run_worker,
+            args=(
+                queue,
+                self.events,
+                self.max_requests,
+                self.account_requests,
+                self.update_interval,
+            ),
+            daemon=True,
+            name=f"airzone-cloud-worker-{worker_id}",
+        )
+        process.start()
+        self.processes[worker_id] = process
+        self.queues[worker_id] = queue
+        self.ring.add_node(worker_id)
+
+    async def stop(self) -> None:
+        """Stop worker processes."""
+        task = self.task
+        self.task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        for queue in self.queues.values():
+            queue.put((RunnerMessage.STOP,))
+        for process in self.processes.values():
+            await asyncio.to_thread(process.join, RUNNER_POLL_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        self.processes.clear()
+        self.queues.clear()
+
+
+def worker_changes_callback(
+    events: Queue[tuple[Any, ...]], account_id: str
+) -> Callable[[list[EntityEvent]], None]:
+    """Return account change events callback sending packed events."""
+
+    def changes_callback(changes: list[EntityEvent]) -> None:
+        events.put((RunnerMessage.EVENTS, account_id, pack_events(changes)))
+
+    return changes_callback
+
+
+def worker_task_done(
+    tasks: dict[str, asyncio.Task[None]], account_id: str
+) -> Callable[[asyncio.Task[None]], None]:
+    """Return callback forgetting the finished command task of an account."""
+
+    def task_done(task: asyncio.Task[None]) -> None:
+        if tasks.get(account_id) is task:
+            tasks.pop(account_id)
+
+    return task_done
+
+
+def run_worker(
+    commands: Queue[tuple[Any, ...]],
+    events: Queue[tuple[Any, ...]],
+    max_requests: int,
+    account_requests: int,
+    update_interval: float,
+) -> None:
+    """Run Airzone Cloud worker process."""
+    asyncio.run(
+        worker_main(commands, events, max_requests, account_requests, update_interval)
+    )
+
+
+async def worker_command(
+    manager: AirzoneCloudManager,
+    events: Queue[tuple[Any, ...]],
+    msg: tuple[Any, ...],
+    previous: asyncio.Task[None] | None,
+) -> None:
+    """Handle worker account command after the previous one of the account."""
+    if previous is not None:
+        await asyncio.gather(previous, return_exceptions=True)
+
+    account_id = msg[1]
+    # Account errors must not kill the worker and its whole shard
+    try:
+        if msg[0] == RunnerMessage.ADD:
+            await manager.add_account(
+                account_id,
+                msg[2],
+                changes_function=worker_changes_callback(events, account_id),
+            )
+        elif msg[0] == RunnerMessage.REMOVE:
+            await manager.remove_account(account_id)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        events.put((RunnerMessage.ERROR, account_id, str(err) or repr(err)))
+
+
+async def worker_main(
+    commands: Queue[tuple[Any, ...]],
+    events: Queue[tuple[Any, ...]],
+    max_requests: int,
+    account_requests: int,
+    update_interval: float,
+) -> None:
+    """Airzone Cloud worker main loop."""
+    async with ClientSession() as session:
+        manager = AirzoneCloudManager(
+            session, max_requests, account_requests, update_interval
+        )
+        manager.start()
+
+        # Commands run as tasks so a slow login doesn't block other accounts
+        tasks: dict[str, asyncio.Task[None]] = {}
+        while True:
+            msg = await asyncio.to_thread(commands.get)
+            if msg[0] == RunnerMessage.STOP:
+                break
+            account_id = msg[1]
+            task = asyncio.create_task(
+                worker_command(manager, events, msg, tasks.get(account_id))
+            )
+            tasks[account_id] = task
+            task.add_done_callback(worker_task_done(tasks, account_id))
+
+        for task in list(tasks.values()):
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        await manager.stop()
@@ -0,0 +1,516 @@
+"""Airzone Cloud entity snapshots."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Final, Self
+
+from .common import (
+    AirQualityMode,
+    HotWaterOperation,
+    OperationAction,
+    OperationMode,
+    SpeedType,
+)
+from .const import (
+    AZD_ACTION,
+    AZD_ACTIVE,
+    AZD_AIDOOS,
+    AZD_AIR_DEMAND,
+    AZD_AIR_QUALITY,
+    AZD_AIR_QUALITY_ID,
+    AZD_AQ_ACTIVE,
+    AZD_AQ_INDEX,
+    AZD_AQ_MODE_CONF,
+    AZD_AQ_MODE_VALUES,
+    AZD_AQ_PM_1,
+    AZD_AQ_PM_2P5,
+    AZD_AQ_PM_10,
+    AZD_AQ_PRESENT,
+    AZD_AQ_STATUS,
+    AZD_AVAILABLE,
+    AZD_CONNECTION_DATE,
+    AZD_CPU_USAGE,
+    AZD_DISCONNECTION_DATE,
+    AZD_DOUBLE_SET_POINT,
+    AZD_DUAL_SP_CONF,
+    AZD_ERRORS,
+    AZD_FIRMWARE,
+    AZD_FLOOR_DEMAND,
+    AZD_GROUPS,
+    AZD_HOT_WATERS,
+    AZD_HUMIDITY,
+    AZD_ID,
+    AZD_INDOOR_EXCHANGER_TEMP,
+    AZD_INDOOR_RETURN_TEMP,
+    AZD_INDOOR_WORK_TEMP,
+    AZD_INSTALLATION,
+    AZD_IS_CONNECTED,
+    AZD_MASTER,
+    AZD_MEMORY_FREE,
+    AZD_MODE,
+    AZD_MODE_AUTO,
+    AZD_MODEL,
+    AZD_MODES,
+    AZD_NAME,
+    AZD_NUM_DEVICES,
+    AZD_NUM_GROUPS,
+    AZD_OLD,
+    AZD_OPERATION,
+    AZD_OPERATIONS,
+    AZD_OUTDOOR_CONDENSER_PRESS,
+    AZD_OUTDOOR_DISCHARGE_TEMP,
+    AZD_OUTDOOR_ELECTRIC_CURRENT,
+    AZD_OUTDOOR_EVAPORATOR_PRESS,
+    AZD_OUTDOOR_EXCHANGER_TEMP,
+    AZD_OUTDOOR_TEMP,
+    AZD_OUTPUTS,
+    AZD_POWER,
+    AZD_POWER_MODE,
+    AZD_PROBLEMS,
+    AZD_SIMULATOR_MODE,
+    AZD_SPEED,
+    AZD_SPEED_TYPE,
+    AZD_SPEEDS,
+    AZD_SYSTEM,
+    AZD_SYSTEM_ID,
+    AZD_SYSTEMS,
+    AZD_TEMP,
+    AZD_TEMP_SET,
+    AZD_TEMP_SET_AUTO_AIR,
+    AZD_TEMP_SET_COOL_AIR,
+    AZD_TEMP_SET_DRY_AIR,
+    AZD_TEMP_SET_HOT_AIR,
+    AZD_TEMP_SET_MAX,
+    AZD_TEMP_SET_MAX_AUTO_AIR,
+    AZD_TEMP_SET_MAX_COOL_AIR,
+    AZD_TEMP_SET_MAX_DRY_AIR,
+    AZD_TEMP_SET_MAX_EMERHEAT_AIR,
+    AZD_TEMP_SET_MAX_HOT_AIR,
+    AZD_TEMP_SET_MAX_STOP_AIR,
+    AZD_TEMP_SET_MAX_VENT_AIR,
+    AZD_TEMP_SET_MIN,
+    AZD_TEMP_SET_MIN_AUTO_AIR,
+    AZD_TEMP_SET_MIN_COOL_AIR,
+    AZD_TEMP_SET_MIN_DRY_AIR,
+    AZD_TEMP_SET_MIN_EMERHEAT_AIR,
+    AZD_TEMP_SET_MIN_HOT_AIR,
+    AZD_TEMP_SET_MIN_STOP_AIR,
+    AZD_TEMP_SET_MIN_VENT_AIR,
+    AZD_TEMP_SET_STOP_AIR,
+    AZD_TEMP_SET_VENT_AIR,
+    AZD_TEMP_STEP,
+    AZD_THERMOSTAT_BATTERY,
+    AZD_THERMOSTAT_BATTERY_LOW,
+    AZD_THERMOSTAT_COVERAGE,
+    AZD_THERMOSTAT_FW,
+    AZD_THERMOSTAT_MODEL,
+    AZD_TYPE,
+    AZD_USER_ACCESS,
+    AZD_WARNINGS,
+    AZD_WEBSERVER,
+    AZD_WEBSERVERS,
+    AZD_WIFI_CHANNEL,
+    AZD_WIFI_MAC,
+    AZD_WIFI_QUALITY,
+    AZD_WIFI_RSSI,
+    AZD_WIFI_SSID,
+    AZD_WS_CONNECTED,
+    AZD_ZONE,
+    AZD_ZONES,
+)
+
+SNAPSHOT_KEYS: Final[dict[str, str]] = {
+    "action": AZD_ACTION,
+    "active": AZD_ACTIVE,
+    "aidoos": AZD_AIDOOS,
+    "air_demand": AZD_AIR_DEMAND,
+    "air_quality": AZD_AIR_QUALITY,
+    "air_quality_id": AZD_AIR_QUALITY_ID,
+    "aq_active": AZD_AQ_ACTIVE,
+    "aq_index": AZD_AQ_INDEX,
+    "aq_mode_conf": AZD_AQ_MODE_CONF,
+    "aq_mode_values": AZD_AQ_MODE_VALUES,
+    "aq_pm_1": AZD_AQ_PM_1,
+    "aq_pm_10": AZD_AQ_PM_10,
+    "aq_pm_2p5": AZD_AQ_PM_2P5,
+    "aq_present": AZD_AQ_PRESENT,
+    "aq_status": AZD_AQ_STATUS,
+    "available": AZD_AVAILABLE,
+    "connection_date": AZD_CONNECTION_DATE,
+    "cpu_usage": AZD_CPU_USAGE,
+    "disconnection_date": AZD_DISCONNECTION_DATE,
+    "double_set_point": AZD_DOUBLE_SET_POINT,
+    "dual_sp_conf": AZD_DUAL_SP_CONF,
+    "errors": AZD_ERRORS,
+    "firmware": AZD_FIRMWARE,
+    "floor_demand": AZD_FLOOR_DEMAND,
+    "groups": AZD_GROUPS,
+    "hot_waters": AZD_HOT_WATERS,
+    "humidity": AZD_HUMIDITY,
+    "id": AZD_ID,
+    "indoor_exchanger_temp": AZD_INDOOR_EXCHANGER_TEMP,
+    "indoor_return_temp": AZD_INDOOR_RETURN_TEMP,
+    "indoor_work_temp": AZD_INDOOR_WORK_TEMP,
+    "installation": AZD_INSTALLATION,
+    "is_connected": AZD_IS_CONNECTED,
+    "master": AZD_MASTER,
+    "memory_free": AZD_MEMORY_FREE,
+    "mode": AZD_MODE,
+    "model": AZD_MODEL,
+    "modes": AZD_MODES,
+    "mode_auto": AZD_MODE_AUTO,
+    "name": AZD_NAME,
+    "num_devices": AZD_NUM_DEVICES,
+    "num_groups": AZD_NUM_GROUPS,
+    "old": AZD_OLD,
+    "operation": AZD_OPERATION,
+    "operations": AZD_OPERATIONS,
+    "outdoor_condenser_press": AZD_OUTDOOR_CONDENSER_PRESS,
+    "outdoor_discharge_temp": AZD_OUTDOOR_DISCHARGE_TEMP,
+    "outdoor_electric_current": AZD_OUTDOOR_ELECTRIC_CURRENT,
+    "outdoor_evaporator_press": AZD_OUTDOOR_EVAPORATOR_PRESS,
+    "outdoor_exchanger_temp": AZD_OUTDOOR_EXCHANGER_TEMP,
+    "outdoor_temp": AZD_OUTDOOR_TEMP,
+    "outputs": AZD_OUTPUTS,
+    "power": AZD_POWER,
+    "power_mode": AZD_POWER_MODE,
+    "problems": AZD_PROBLEMS,
+    "simulator_mode": AZD_SIMULATOR_MODE,
+    "speed": AZD_SPEED,
+    "speeds": AZD_SPEEDS,
+    "speed_type": AZD_SPEED_TYPE,
+    "system": AZD_SYSTEM,
+    "systems": AZD_SYSTEMS,
+    "system_id": AZD_SYSTEM_ID,
+    "temp": AZD_TEMP,
+    "temp_set": AZD_TEMP_SET,
+    "temp_set_auto_air": AZD_TEMP_SET_AUTO_AIR,
+    "temp_set_cool_air": AZD_TEMP_SET_COOL_AIR,
+    "temp_set_dry_air": AZD_TEMP_SET_DRY_AIR,
+    "temp_set_hot_air": AZD_TEMP_SET_HOT_AIR,
+    "temp_set_max": AZD_TEMP_SET_MAX,
+    "temp_set_max_auto_air": AZD_TEMP_SET_MAX_AUTO_AIR,
+    "temp_set_max_cool_air": AZD_TEMP_SET_MAX_COOL_AIR,
+    "temp_set_max_dry_air": AZD_TEMP_SET_MAX_DRY_AIR,
+    "temp_set_max_emerheat_air": AZD_TEMP_SET_MAX_EMERHEAT_AIR,
+    "temp_set_max_hot_air": AZD_TEMP_SET_MAX_HOT_AIR,
+    "temp_set_max_stop_air": AZD_TEMP_SET_MAX_STOP_AIR,
+    "temp_set_max_vent_air": AZD_TEMP_SET_MAX_VENT_AIR,
+    "temp_set_min": AZD_TEMP_SET_MIN,
+    "temp_set_min_auto_air": AZD_TEMP_SET_MIN_AUTO_AIR,
+    "temp_set_min_cool_air": AZD_TEMP_SET_MIN_COOL_AIR,
+    "temp_set_min_dry_air": AZD_TEMP_SET_MIN_DRY_AIR,
+    "temp_set_min_emerheat_air": AZD_TEMP_SET_MIN_EMERHEAT_AIR,
+    "temp_set_min_hot_air": AZD_TEMP_SET_MIN_HOT_AIR,
+    "temp_set_min_stop_air": AZD_TEMP_SET_MIN_STOP_AIR,
+    "temp_set_min_vent_air": AZD_TEMP_SET_MIN_VENT_AIR,
+    "temp_set_stop_air": AZD_TEMP_SET_STOP_AIR,
+    "temp_set_vent_air": AZD_TEMP_SET_VENT_AIR,
+    "temp_step": AZD_TEMP_STEP,
+    "thermostat_battery": AZD_THERMOSTAT_BATTERY,
+    "thermostat_battery_low": AZD_THERMOSTAT_BATTERY_LOW,
+    "thermostat_coverage": AZD_THERMOSTAT_COVERAGE,
+    "thermostat_fw": AZD_THERMOSTAT_FW,
+    "thermostat_model": AZD_THERMOSTAT_MODEL,
+    "type": AZD_TYPE,
+    "user_access": AZD_USER_ACCESS,
+    "warnings": AZD_WARNINGS,
+    "webserver": AZD_WEBSERVER,
+    "webservers": AZD_WEBSERVERS,
+    "wifi_channel": AZD_WIFI_CHANNEL,
+    "wifi_mac": AZD_WIFI_MAC,
+    "wifi_quality": AZD_WIFI_QUALITY,
+    "wifi_rssi": AZD_WIFI_RSSI,
+    "wifi_ssid": AZD_WIFI_SSID,
+    "ws_connected": AZD_WS_CONNECTED,
+    "zone": AZD_ZONE,
+    "zones": AZD_ZONES,
+}
+
+SNAPSHOT_FIELDS: dict[type[EntitySnapshot], dict[str, str]] = {}
+
+
+def freeze(value: Any) -> Any:
+    """Return immutable copy of data value."""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return mutable copy of frozen data value."""
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return value
+
+
+def get_snapshot_keys(cls: type[EntitySnapshot]) -> dict[str, str]:
+    """Return snapshot data keys and their attributes."""
+    keys = SNAPSHOT_FIELDS.get(cls)
+    if keys is None:
+        keys = {
+            SNAPSHOT_KEYS[item.name]: item.name
+            for item in fields(cls)
+            if item.name in SNAPSHOT_KEYS
+        }
+        SNAPSHOT_FIELDS[cls] = keys
+    return keys
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EntitySnapshot:
+    """Airzone Cloud entity snapshot.
+
+    Snapshots are immutable, so they can be shared between threads. Values
+    missing from entity data are None.
+    """
+
+    data_keys: tuple[str, ...] = field(compare=False, repr=False)
+    dict_cache: Mapping[str, Any] | None = field(
+        compare=False, default=None, repr=False
+    )
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> Self:
+        """Create snapshot from entity data.
+
+        Values are frozen copies, so data isn't referenced by the snapshot.
+        Data values don't nest containers, so shallow copies are enough.
+        """
+        attrs = get_snapshot_keys(cls)
+        data_keys: list[str] = []
+        values: dict[str, Any] = dict.fromkeys(attrs.values())
+        for key, value in data.items():
+            attr = attrs.get(key)
+            if attr is not None:
+                data_keys += [key]
+                values[attr] = freeze(value)
+        return cls(data_keys=tuple(data_keys), **values)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return snapshot as a new entity data dictionary."""
+        data = self.dict_cache
+        if data is None:
+            attrs = get_snapshot_keys(type(self))
+            data = MappingProxyType(
+                {key: getattr(self, attrs[key]) for key in self.data_keys}
+            )
+            object.__setattr__(self, "dict_cache", data)
+        return {key: thaw(value) for key, value in data.items()}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DeviceSnapshot(EntitySnapshot):
+    """Airzone Cloud Device snapshot."""
+
+    aq_active: bool | None
+    aq_index: int | None
+    aq_pm_1: int | None
+    aq_pm_10: int | None
+    aq_pm_2p5: int | None
+    aq_present: bool | None
+    aq_status: str | None
+    available: bool
+    double_set_point: bool
+    dual_sp_conf: bool | None
+    errors: tuple[str, ...] | None
+    id: str
+    installation: str
+    is_connected: bool
+    mode: OperationMode | None
+    modes: tuple[OperationMode, ...] | None
+    mode_auto: OperationMode | None
+    name: str
+    problems: bool
+    simulator_mode: bool | None
+    warnings: tuple[str, ...] | None
+    webserver: str
+    ws_connected: bool
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class HVACSnapshot(DeviceSnapshot):
+    """Airzone Cloud HVAC snapshot."""
+
+    action: OperationAction
+    active: bool | None
+    aq_mode_conf: AirQualityMode | None
+    aq_mode_values: tuple[AirQualityMode, ...] | None
+    humidity: int | None
+    indoor_exchanger_temp: float | None
+    indoor_return_temp: float | None
+    indoor_work_temp: float | None
+    outdoor_condenser_press: float | None
+    outdoor_discharge_temp: float | None
+    outdoor_electric_current: float | None
+    outdoor_evaporator_press: float | None
+    outdoor_exchanger_temp: float | None
+    outdoor_temp: float | None
+    power: bool | None
+    speed: int | None
+    speeds: Mapping[int, int] | None
+    speed_type: SpeedType | None
+    temp: float | None
+    temp_set: float | None
+    temp_set_auto_air: float | None
+    temp_set_cool_air: float | None
+    temp_set_dry_air: float | None
+    temp_set_hot_air: float | None
+    temp_set_max: float | None
+    temp_set_max_auto_air: float | None
+    temp_set_max_cool_air: float | None
+    temp_set_max_dry_air: float | None
+    temp_set_max_emerheat_air: float | None
+    temp_set_max_hot_air: float | None
+    temp_set_max_stop_air: float | None
+    temp_set_max_vent_air: float | None
+    temp_set_min: float | None
+    temp_set_min_auto_air: float | None
+    temp_set_min_cool_air: float | None
+    temp_set_min_dry_air: float | None
+    temp_set_min_emerheat_air: float | None
+    temp_set_min_hot_air: float | None
+    temp_set_min_stop_air: float | None
+    temp_set_min_vent_air: float | None
+    temp_set_stop_air: float | None
+    temp_set_vent_air: float | None
+    temp_step: float | None
+    thermostat_battery: int | None
+    thermostat_battery_low: bool | None
+    thermostat_coverage: int | None
+    thermostat_fw: str | None
+    thermostat_model: str | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AidooSnapshot(HVACSnapshot):
+    """Airzone Cloud Aidoo snapshot."""
+
+    model: str | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AirQualitySnapshot(DeviceSnapshot):
+    """Airzone Cloud Air Quality snapshot."""
+
+    firmware: str | None
+    system: int
+    zone: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class HotWaterSnapshot(DeviceSnapshot):
+    """Airzone Cloud Hot Water snapshot."""
+
+    active: bool | None
+    operation: HotWaterOperation
+    operations: tuple[HotWaterOperation, ...]
+    power: bool | None
+    power_mode: bool | None
+    temp: float | None
+    temp_set: int | None
+    temp_set_max: int | None
+    temp_set_min: int | None
+    temp_step: int | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class OutputSnapshot(DeviceSnapshot):
+    """Airzone Cloud Output snapshot."""
+
+    system: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SystemSnapshot(DeviceSnapshot):
+    """Airzone Cloud System snapshot."""
+
+    firmware: str | None
+    model: str | None
+    system: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ZoneSnapshot(HVACSnapshot):
+    """Airzone Cloud Zone snapshot."""
+
+    air_demand: bool | None
+    air_quality_id: str | None
+    floor_demand: bool | None
+    master: bool
+    system: int
+    system_id: str | None
+    zone: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WebServerSnapshot(EntitySnapshot):
+    """Airzone Cloud WebServer snapshot."""
+
+    available: bool
+    connection_date: str | None
+    cpu_usage: int | None
+    disconnection_date: str | None
+    firmware: str | None
+    id: str
+    installation: str
+    memory_free: int | None
+    name: str
+    old: bool | None
+    type: str | None
+    wifi_channel: int | None
+    wifi_mac: str | None
+    wifi_quality: int | None
+    wifi_rssi: int | None
+    wifi_ssid: str | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DeviceGroupSnapshot(EntitySnapshot):
+    """Airzone Cloud DeviceGroup snapshot."""
+
+    action: OperationAction
+    active: bool | None
+    aidoos: tuple[str, ...] | None
+    air_quality: tuple[str, ...] | None
+    available: bool
+    hot_waters: tuple[str, ...] | None
+    humidity: int | None
+    id: str
+    mode: OperationMode | None
+    modes: tuple[OperationMode, ...] | None
+    name: str
+    num_devices: int
+    outputs: tuple[str, ...] | None
+    power: bool | None
+    systems: tuple[str, ...] | None
+    temp: float | None
+    temp_set: float | None
+    temp_set_max: float | None
+    temp_set_min: float | None
+    temp_step: float | None
+    zones: tuple[str, ...] | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class GroupSnapshot(DeviceGroupSnapshot):
+    """Airzone Cloud Group snapshot."""
+
+    installation: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class InstallationSnapshot(DeviceGroupSnapshot):
+    """Airzone Cloud Installation snapshot."""
+
+    groups: tuple[str, ...] | None
+    num_groups: int
+    user_access: str
+    webservers: tuple[str, ...]
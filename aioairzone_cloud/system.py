@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from .common import parse_str
+from .common import EntityKind, parse_str
 from .const import (
     API_MODE,
     API_SYSTEM_FW,
@@ -17,6 +17,7 @@ from .const import (
 )
 from .device import Device
 from .entity import EntityUpdate
+from .snapshot import SystemSnapshot
 
 if TYPE_CHECKING:
     from .zone import Zone
@@ -25,6 +26,16 @@ if TYPE_CHECKING:
 class System(Device):
     """Airzone Cloud System device."""
 
+    __slots__ = (
+        "system_fw",
+        "system_number",
+        "system_type",
+        "zones",
+    )
+
+    kind = EntityKind.SYSTEM
+    snapshot_class = SystemSnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud System device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -79,6 +90,9 @@ class System(Device):
             self.set_mode(data[API_VALUE])
             for zone in self.zones.values():
                 zone.set_mode(data[API_VALUE])
+                zone.set_dirty()
+
+        self.set_dirty()
 
     def update_data(self, update: EntityUpdate) -> None:
         """Update System data."""
@@ -88,8 +102,8 @@ class System(Device):
 
         system_fw = parse_str(data.get(API_SYSTEM_FW))
         if system_fw is not None:
-            self.system_fw = system_fw
+            self.set_attr("system_fw", system_fw)
 
         system_type = parse_str(data.get(API_SYSTEM_TYPE))
         if system_type is not None:
-            self.system_type = system_type
+            self.set_attr("system_type", system_type)
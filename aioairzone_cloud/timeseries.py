@@ -0,0 +1,184 @@
+"""Airzone Cloud time series."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .const import TIMESERIES_CAPACITY
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+
+class SeriesSpec(NamedTuple):
+    """Airzone Cloud time series metric.
+
+    A sample of the getter value is recorded whenever any of attrs changes.
+    """
+
+    name: str
+    getter: str
+    attrs: frozenset[str]
+
+
+class TimeSeries:
+    """Airzone Cloud time series ring buffer.
+
+    Timestamps and values are stored as C doubles in two fixed-capacity
+    arrays, so samples don't allocate Python objects and the buffers can be
+    shared with NumPy (numpy.frombuffer) without copies. Once full, the
+    oldest samples are overwritten.
+    """
+
+    __slots__ = (
+        "capacity",
+        "count",
+        "index",
+        "timestamps",
+        "values",
+    )
+
+    def __init__(self, capacity: int = TIMESERIES_CAPACITY) -> None:
+        """Airzone Cloud Time Series init."""
+        if capacity < 1:
+            raise ValueError("Time series capacity must be positive")
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.index: int = 0
+        self.timestamps: array[float] = array("d", bytes(8 * capacity))
+        self.values: array[float] = array("d", bytes(8 * capacity))
+
+    def __len__(self) -> int:
+        """Return number of samples."""
+        return self.count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add sample, overwriting the oldest one if full."""
+        idx = self.index
+        self.timestamps[idx] = timestamp
+        self.values[idx] = value
+        self.index = (idx + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.count = 0
+        self.index = 0
+
+    def get_capacity(self) -> int:
+        """Return max number of samples."""
+        return self.capacity
+
+    def get_last(self) -> tuple[float, float] | None:
+        """Return last (timestamp, value) sample."""
+        if self.count == 0:
+            return None
+        idx = self.index - 1
+        return self.timestamps[idx], self.values[idx]
+
+    def get_start(self, last: int | None = None, since: float | None = None) -> int:
+        """Return number of samples to skip for a window query."""
+        start = 0
+        if last is not None:
+            start = max(self.count - last, 0)
+        if since is not None:
+            # Samples are appended in time order: bisect the ring
+            timestamps = self.timestamps
+            offset = self.index - self.count
+            high = self.count
+            while start < high:
+                mid = (start + high) // 2
+                if timestamps[(offset + mid) % self.capacity] < since:
+                    start = mid + 1
+                else:
+                    high = mid
+        return start
+
+    def get_window(
+        self, buffer: array[float], last: int | None = None, since: float | None = None
+    ) -> array[float]:
+        """Return buffer window in time order, oldest first."""
+        start = self.get_start(last, since)
+        first = (self.index - self.count + start) % self.capacity
+        length = self.count - start
+        end = first + length
+        if end <= self.capacity:
+            return buffer[first:end]
+        return buffer[first:] + buffer[: end - self.capacity]
+
+    def get_timestamps(
+        self, last: int | None = None, since: float | None = None
+    ) -> array[float]:
+        """Return window timestamps, oldest first."""
+        return self.get_window(self.timestamps, last, since)
+
+    def get_values(
+        self, last: int | None = None, since: float | None = None
+    ) -> array[float]:
+        """Return window values, oldest first."""
+        return self.get_window(self.values, last, since)
+
+    def max(self, last: int | None = None, since: float | None = None) -> float | None:
+        """Return window max value."""
+        values = self.get_values(last, since)
+        if len(values) == 0:
+            return None
+        return max(values)
+
+    def mean(self, last: int | None = None, since: float | None = None) -> float | None:
+        """Return window mean value."""
+        values = self.get_values(last, since)
+        if len(values) == 0:
+            return None
+        return math.fsum(values) / len(values)
+
+    def min(self, last: int | None = None, since: float | None = None) -> float | None:
+        """Return window min value."""
+        values = self.get_values(last, since)
+        if len(values) == 0:
+            return None
+        return min(values)
+
+
+class EntityTimeSeries:
+    """Airzone Cloud Entity time series.
+
+    Holds one ring buffer per metric, fed from Entity update changes.
+    """
+
+    __slots__ = (
+        "series",
+        "specs",
+    )
+
+    def __init__(
+        self, specs: Iterable[SeriesSpec], capacity: int = TIMESERIES_CAPACITY
+    ) -> None:
+        """Airzone Cloud Entity Time Series init."""
+        self.specs: tuple[SeriesSpec, ...] = tuple(specs)
+        self.series: dict[str, TimeSeries] = {
+            spec.name: TimeSeries(capacity) for spec in self.specs
+        }
+
+    def add_changes(
+        self, entity: Entity, changes: Mapping[str, Any], timestamp: float
+    ) -> None:
+        """Record samples of the metrics affected by changes."""
+        for spec in self.specs:
+            if spec.attrs.isdisjoint(changes):
+                continue
+            value = getattr(entity, spec.getter)()
+            if value is not None:
+                self.series[spec.name].append(timestamp, value)
+
+    def get_series(self, name: str) -> TimeSeries | None:
+        """Return metric time series."""
+        return self.series.get(name)
+
+    def get_names(self) -> list[str]:
+        """Return metric names."""
+        return list(self.series)
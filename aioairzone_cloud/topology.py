@@ -0,0 +1,142 @@
+"""Airzone Cloud devices topology."""
+
+from __future__ import annotations
+
+from .air_quality import AirQuality
+from .entity import Entity, EntityChanges
+from .system import System
+from .zone import Zone
+
+SystemKey = tuple[str, str, int]
+ZoneKey = tuple[str, str, int, int]
+
+
+def get_system_key(device: AirQuality | System | Zone) -> SystemKey:
+    """Return device (installation, webserver, system number) key."""
+    return (
+        device.get_installation(),
+        device.get_webserver(),
+        device.get_system_num(),
+    )
+
+
+def get_zone_key(device: AirQuality | Zone, zone_num: int) -> ZoneKey:
+    """Return device (installation, webserver, system number, zone number) key."""
+    return (
+        device.get_installation(),
+        device.get_webserver(),
+        device.get_system_num(),
+        zone_num,
+    )
+
+
+class DeviceTopology:
+    """Airzone Cloud devices topology.
+
+    Systems, Zones and Air Quality sensors are indexed by installation,
+    webserver, system number and zone number, and linked together as soon
+    as they are added. Slave zones modes are only propagated from their
+    System when the topology or the relevant device fields change.
+    """
+
+    def __init__(self) -> None:
+        """Airzone Cloud Device Topology init."""
+        self.air_quality: dict[SystemKey, list[AirQuality]] = {}
+        self.linked_version: int = 0
+        self.pending: dict[SystemKey, None] = {}
+        self.systems: dict[SystemKey, list[System]] = {}
+        self.system_zones: dict[SystemKey, list[Zone]] = {}
+        self.version: int = 0
+        self.zones: dict[ZoneKey, list[Zone]] = {}
+
+    def add_air_quality(self, air_quality: AirQuality) -> None:
+        """Add Air Quality to topology and link it."""
+        key = get_system_key(air_quality)
+        self.air_quality.setdefault(key, []).append(air_quality)
+
+        for system in self.systems.get(key, []):
+            link_air_quality_system(air_quality, system)
+        for zone in self.zones.get(
+            get_zone_key(air_quality, air_quality.get_zone_num()), []
+        ):
+            link_air_quality_zone(air_quality, zone)
+
+        self.version += 1
+
+    def add_system(self, system: System) -> None:
+        """Add System to topology and link it."""
+        key = get_system_key(system)
+        self.systems.setdefault(key, []).append(system)
+
+        for zone in self.system_zones.get(key, []):
+            link_system_zone(system, zone)
+        for air_quality in self.air_quality.get(key, []):
+            link_air_quality_system(air_quality, system)
+
+        self.pending[key] = None
+        self.version += 1
+
+    def add_zone(self, zone: Zone) -> None:
+        """Add Zone to topology and link it."""
+        key = get_system_key(zone)
+        self.system_zones.setdefault(key, []).append(zone)
+        self.zones.setdefault(get_zone_key(zone, zone.get_zone()), []).append(zone)
+
+        for system in self.systems.get(key, []):
+            link_system_zone(system, zone)
+        for air_quality in self.air_quality.get(key, []):
+            if air_quality.get_zone_num() == zone.get_zone():
+                link_air_quality_zone(air_quality, zone)
+
+        self.pending[key] = None
+        self.version += 1
+
+    def get_version(self) -> int:
+        """Return topology version."""
+        return self.version
+
+    def link(self) -> None:
+        """Propagate System modes to slave Zones if needed."""
+        if self.linked_version == self.version and len(self.pending) == 0:
+            return
+
+        pending = self.pending
+        self.pending = {}
+        for key in pending:
+            zones = self.system_zones.get(key, [])
+            for system in self.systems.get(key, []):
+                modes = system.get_modes()
+                if not modes:
+                    continue
+                for zone in zones:
+                    if zone.get_master() is False:
+                        zone.set_modes(modes)
+
+        self.linked_version = self.version
+
+    def update_changes(self, entity: Entity, changes: EntityChanges) -> None:
+        """Check if Entity changes require propagating System modes."""
+        if isinstance(entity, System):
+            if "modes" in changes:
+                self.pending[get_system_key(entity)] = None
+        elif isinstance(entity, Zone):
+            if "master" in changes or "modes" in changes:
+                self.pending[get_system_key(entity)] = None
+
+
+def link_air_quality_system(air_quality: AirQuality, system: System) -> None:
+    """Link Air Quality and System."""
+    air_quality.add_system(system)
+    system.set_air_quality(air_quality)
+
+
+def link_air_quality_zone(air_quality: AirQuality, zone: Zone) -> None:
+    """Link Air Quality and Zone."""
+    air_quality.add_zone(zone)
+    zone.set_air_quality(air_quality)
+
+
+def link_system_zone(system: System, zone: Zone) -> None:
+    """Link System and Zone."""
+    system.add_zone(zone)
+    zone.set_system(system)
@@ -0,0 +1,209 @@
+"""Airzone Cloud tracing."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+import importlib
+from time import perf_counter
+from types import TracebackType
+from typing import Any
+
+from .const import TRACING_MAX_TRACES
+
+NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+class Span:
+    """Airzone Cloud tracing span.
+
+    Spans are nested through a context variable, so spans started from
+    tasks created inside another span become its children.
+    """
+
+    __slots__ = (
+        "adapter_span",
+        "attributes",
+        "children",
+        "end",
+        "error",
+        "name",
+        "parent",
+        "start",
+        "token",
+        "tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        parent: Span | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        """Airzone Cloud Span init."""
+        self.adapter_span: Any = None
+        self.attributes: dict[str, Any] = attributes
+        self.children: list[Span] = []
+        self.end: float | None = None
+        self.error: str | None = None
+        self.name: str = name
+        self.parent: Span | None = parent
+        self.start: float = 0.0
+        self.token: Token[Span | None] | None = None
+        self.tracer: Tracer = tracer
+
+    def __enter__(self) -> Span:
+        """Start span."""
+        self.tracer.start_span(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """End span."""
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        self.tracer.end_span(self)
+
+    def data(self, origin: float | None = None) -> dict[str, Any]:
+        """Return span data, with times relative to the root span."""
+        if origin is None:
+            origin = self.start
+        data: dict[str, Any] = {
+            "name": self.name,
+            "start": self.start - origin,
+            "duration": self.get_duration(),
+        }
+        if len(self.attributes) > 0:
+            data["attributes"] = self.attributes
+        if self.error is not None:
+            data["error"] = self.error
+        if len(self.children) > 0:
+            data["children"] = [child.data(origin) for child in self.children]
+        return data
+
+    def get_duration(self) -> float | None:
+        """Return span duration."""
+        if self.end is not None:
+            return self.end - self.start
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set span attribute."""
+        self.attributes[key] = value
+
+
+class TracingAdapter:
+    """Airzone Cloud tracing adapter.
+
+    Adapters forward spans to another tracing system.
+    """
+
+    def start_span(self, span: Span) -> None:
+        """Handle span start."""
+
+    def end_span(self, span: Span) -> None:
+        """Handle span end."""
+
+
+class OpenTelemetryAdapter(TracingAdapter):
+    """Airzone Cloud OpenTelemetry tracing adapter.
+
+    Requires the opentelemetry-api package.
+    """
+
+    def __init__(self, tracer: Any) -> None:
+        """Airzone Cloud OpenTelemetry Adapter init."""
+        self.trace: Any = importlib.import_module("opentelemetry.trace")
+        self.tracer: Any = tracer
+
+    def start_span(self, span: Span) -> None:
+        """Start OpenTelemetry span."""
+        context = None
+        parent = span.parent
+        if parent is not None and parent.adapter_span is not None:
+            context = self.trace.set_span_in_context(parent.adapter_span)
+        span.adapter_span = self.tracer.start_span(
+            span.name, context=context, attributes=span.attributes
+        )
+
+    def end_span(self, span: Span) -> None:
+        """End OpenTelemetry span."""
+        otel_span = span.adapter_span
+        if otel_span is None:
+            return
+        otel_span.set_attributes(span.attributes)
+        if span.error is not None:
+            otel_span.set_status(
+                self.trace.Status(self.trace.StatusCode.ERROR, span.error)
+            )
+        otel_span.end()
+
+
+class Tracer:
+    """Airzone Cloud tracer.
+
+    Keeps the last finished root spans. When disabled, span() returns a
+    shared no-op context manager.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        adapter: TracingAdapter | None = None,
+        max_traces: int = TRACING_MAX_TRACES,
+    ) -> None:
+        """Airzone Cloud Tracer init."""
+        self.adapter: TracingAdapter | None = adapter
+        self.current: ContextVar[Span | None] = ContextVar(
+            f"airzone_cloud_span_{id(self)}", default=None
+        )
+        self.enabled: bool = enabled
+        self.traces: deque[Span] = deque(maxlen=max_traces)
+
+    def end_span(self, span: Span) -> None:
+        """End span and restore its parent as current span."""
+        span.end = perf_counter()
+        if span.token is not None:
+            self.current.reset(span.token)
+            span.token = None
+        if self.adapter is not None:
+            self.adapter.end_span(span)
+        if span.parent is None:
+            self.traces.append(span)
+
+    def get_current(self) -> Span | None:
+        """Return current span."""
+        return self.current.get()
+
+    def get_traces(self) -> list[dict[str, Any]]:
+        """Return finished root spans data."""
+        return [span.data() for span in self.traces]
+
+    def set_adapter(self, adapter: TracingAdapter | None) -> None:
+        """Set tracing adapter."""
+        self.adapter = adapter
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Enable or disable tracing."""
+        self.enabled = enabled
+
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[Span | None]:
+        """Return span context manager."""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, self.current.get(), attributes)
+
+    def start_span(self, span: Span) -> None:
+        """Start span as child of its parent and make it current."""
+        if span.parent is not None:
+            span.parent.children.append(span)
+        span.token = self.current.set(span)
+        if self.adapter is not None:
+            self.adapter.start_span(span)
+        span.start = perf_counter()
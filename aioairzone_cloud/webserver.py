@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from .common import parse_bool, parse_int, parse_str
+from .common import EntityKind, parse_bool, parse_int, parse_str
 from .const import (
     API_CONFIG,
     API_CONNECTION_DATE,
@@ -42,13 +42,104 @@ from .const import (
     AZD_WIFI_SSID,
 )
 from .entity import Entity, EntityUpdate, UpdateType
+from .fields import FieldSpec, FieldTable
+from .snapshot import WebServerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+WEBSERVER_FIELDS = FieldTable(
+    [
+        FieldSpec(None, "available", azd_key=AZD_AVAILABLE, always=True),
+        FieldSpec(None, "id", azd_key=AZD_ID, always=True),
+        FieldSpec(
+            None,
+            "installation_id",
+            azd_key=AZD_INSTALLATION,
+            getter="get_installation",
+            always=True,
+        ),
+        FieldSpec(None, "name", azd_key=AZD_NAME, always=True),
+        FieldSpec(API_WS_TYPE, "type", parse_str, azd_key=AZD_TYPE, always=True),
+    ]
+)
+
+WEBSERVER_CONFIG_FIELDS = FieldTable(
+    [
+        FieldSpec(API_WS_FW, "firmware", parse_str, azd_key=AZD_FIRMWARE, always=True),
+        FieldSpec(API_OLD_WS, "old", parse_bool, azd_key=AZD_OLD),
+        FieldSpec(
+            API_STAT_CHANNEL, "wifi_channel", parse_int, azd_key=AZD_WIFI_CHANNEL
+        ),
+        FieldSpec(API_STAT_AP_MAC, "wifi_mac", parse_str, azd_key=AZD_WIFI_MAC),
+        FieldSpec(API_STAT_SSID, "wifi_ssid", parse_str, azd_key=AZD_WIFI_SSID),
+    ]
+)
+
+WEBSERVER_STATUS_FIELDS = FieldTable(
+    [
+        FieldSpec(
+            API_CONNECTION_DATE,
+            "connection_date",
+            parse_str,
+            azd_key=AZD_CONNECTION_DATE,
+            always=True,
+        ),
+        FieldSpec(
+            API_DISCONNECTION_DATE,
+            "disconnection_date",
+            parse_str,
+            azd_key=AZD_DISCONNECTION_DATE,
+            always=True,
+        ),
+        FieldSpec(
+            API_CPU_WS,
+            "cpu_usage",
+            parse_int,
+            sub_key=API_GENERAL,
+            azd_key=AZD_CPU_USAGE,
+        ),
+        FieldSpec(API_IS_CONNECTED, "is_connected", parse_bool),
+        FieldSpec(
+            API_FREE_MEM,
+            "memory_free",
+            parse_int,
+            sub_key=API_FREE,
+            azd_key=AZD_MEMORY_FREE,
+        ),
+        FieldSpec(
+            API_STAT_QUALITY, "wifi_quality", parse_int, azd_key=AZD_WIFI_QUALITY
+        ),
+        FieldSpec(API_STAT_RSSI, "wifi_rssi", parse_int, azd_key=AZD_WIFI_RSSI),
+    ]
+)
+
 
 class WebServer(Entity):
     """Airzone Cloud WebServer."""
 
+    __slots__ = (
+        "connection_date",
+        "cpu_usage",
+        "disconnection_date",
+        "firmware",
+        "installation_id",
+        "is_connected",
+        "memory_free",
+        "old",
+        "type",
+        "wifi_channel",
+        "wifi_mac",
+        "wifi_quality",
+        "wifi_rssi",
+        "wifi_ssid",
+    )
+
+    fields = WEBSERVER_FIELDS.extend(
+        WEBSERVER_CONFIG_FIELDS.specs + WEBSERVER_STATUS_FIELDS.specs
+    )
+    kind = EntityKind.WEBSERVER
+    snapshot_class = WebServerSnapshot
+
     def __init__(self, inst_id: str, ws_id: str):
         """Airzone Cloud WebServer init."""
         super().__init__()
@@ -63,7 +154,6 @@ class WebServer(Entity):
         self.memory_free: int | None = None
         self.name: str = f"WebServer {ws_id}"
         self.old: bool | None = None
-        self.stat_quality: int | None = None
         self.type: str | None = None
         self.wifi_channel: int | None = None
         self.wifi_mac: str | None = None
@@ -75,105 +165,22 @@ class WebServer(Entity):
         """Update WebServer data."""
         data = update.get_data()
 
-        ws_type = parse_str(data.get(API_WS_TYPE))
-        if ws_type is not None:
-            self.type = ws_type
-
         if update.get_type() != UpdateType.WS_PARTIAL:
+            WEBSERVER_FIELDS.update(self, data, True)
+
             ws_config = data.get(API_CONFIG)
+            if ws_config is not None:
+                WEBSERVER_CONFIG_FIELDS.update(self, ws_config, True)
+
             ws_status = data.get(API_STATUS)
+            if ws_status is not None:
+                WEBSERVER_STATUS_FIELDS.update(self, ws_status, True)
         else:
-            ws_config = data
-            ws_status = data
-
-        if ws_config is not None:
-            old_ws = parse_bool(ws_config.get(API_OLD_WS))
-            if old_ws is not None:
-                self.old = old_ws
-            stat_ap_mac = parse_str(ws_config.get(API_STAT_AP_MAC))
-            if stat_ap_mac is not None:
-                self.wifi_mac = stat_ap_mac
-            stat_channel = parse_int(ws_config.get(API_STAT_CHANNEL))
-            if stat_channel is not None:
-                self.wifi_channel = stat_channel
-            stat_ssid = parse_str(ws_config.get(API_STAT_SSID))
-            if stat_ssid is not None:
-                self.wifi_ssid = stat_ssid
-            ws_fw = parse_str(ws_config.get(API_WS_FW))
-            if ws_fw is not None:
-                self.firmware = ws_fw
-
-        if ws_status is not None:
-            connection_date = parse_str(ws_status.get(API_CONNECTION_DATE))
-            if connection_date is not None:
-                self.connection_date = connection_date
-            api_cpu_ws = ws_status.get(API_CPU_WS) or {}
-            cpu_usage = parse_int(api_cpu_ws.get(API_GENERAL))
-            if cpu_usage is not None:
-                self.cpu_usage = cpu_usage
-            disconnection_date = parse_str(ws_status.get(API_DISCONNECTION_DATE))
-            if disconnection_date is not None:
-                self.disconnection_date = disconnection_date
-            is_connected = parse_bool(ws_status.get(API_IS_CONNECTED))
-            if is_connected is not None:
-                self.is_connected = is_connected
-            api_free_mem = ws_status.get(API_FREE_MEM) or {}
-            memory_free = parse_int(api_free_mem.get(API_FREE))
-            if memory_free is not None:
-                self.memory_free = memory_free
-            stat_quality = parse_int(ws_status.get(API_STAT_QUALITY))
-            if stat_quality is not None:
-                self.wifi_quality = stat_quality
-            stat_rssi = parse_int(ws_status.get(API_STAT_RSSI))
-            if stat_rssi is not None:
-                self.wifi_rssi = stat_rssi
+            self.fields.update(self, data, False)
 
     def data(self) -> dict[str, Any]:
         """Return WebServer data."""
-        data: dict[str, Any] = {
-            AZD_AVAILABLE: self.get_available(),
-            AZD_CONNECTION_DATE: self.get_connection_date(),
-            AZD_DISCONNECTION_DATE: self.get_disconnection_date(),
-            AZD_FIRMWARE: self.get_firmware(),
-            AZD_ID: self.get_id(),
-            AZD_INSTALLATION: self.get_installation(),
-            AZD_NAME: self.get_name(),
-            AZD_TYPE: self.get_type(),
-        }
-
-        cpu_usage = self.get_cpu_usage()
-        if cpu_usage is not None:
-            data[AZD_CPU_USAGE] = cpu_usage
-
-        memory_free = self.get_memory_free()
-        if memory_free is not None:
-            data[AZD_MEMORY_FREE] = memory_free
-
-        old = self.get_old()
-        if old is not None:
-            data[AZD_OLD] = old
-
-        wifi_channel = self.get_wifi_channel()
-        if wifi_channel is not None:
-            data[AZD_WIFI_CHANNEL] = wifi_channel
-
-        wifi_mac = self.get_wifi_mac()
-        if wifi_mac is not None:
-            data[AZD_WIFI_MAC] = wifi_mac
-
-        wifi_quality = self.get_wifi_quality()
-        if wifi_quality is not None:
-            data[AZD_WIFI_QUALITY] = wifi_quality
-
-        wifi_rssi = self.get_wifi_rssi()
-        if wifi_rssi is not None:
-            data[AZD_WIFI_RSSI] = wifi_rssi
-
-        wifi_ssid = self.get_wifi_ssid()
-        if wifi_ssid is not None:
-            data[AZD_WIFI_SSID] = wifi_ssid
-
-        return data
+        return self.fields.data(self, {})
 
     def get_available(self) -> bool:
         """Return availability status."""
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from asyncio import Event, Lock, Task
+from dataclasses import dataclass, field
 from datetime import datetime
 from json import JSONDecodeError, loads as json_loads
 import logging
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 import urllib.parse
 
@@ -27,13 +29,16 @@ from .const import (
     WS_INIT_TIMEOUT,
     WS_INSTALLATION,
     WS_INSTALLATION_ID,
-    WS_URL,
     WS_WEBSERVER_UPDATES,
     WS_WEBSOCKETS,
 )
 from .device import Device
+from .dispatcher import WebSocketsDispatcher, WebSocketsHandler
 from .entity import EntityUpdate, UpdateType
+from .exceptions import AirzoneCloudError
 from .installation import Installation
+from .metrics import WebSocketsStats
+from .recorder import WebSocketsRecorder
 from .token import AirzoneCloudToken
 
 if TYPE_CHECKING:
@@ -42,6 +47,19 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class WebSocketsState:
+    """Airzone Cloud WebSockets initial state result."""
+
+    completed: list[str] = field(default_factory=list)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+
+    def is_complete(self) -> bool:
+        """Check if all installations received their initial state."""
+        return len(self.failed) == 0 and len(self.timed_out) == 0
+
+
 class AirzoneCloudIWS:
     """Airzone Cloud Installation WebSockets."""
 
@@ -55,19 +73,37 @@ class AirzoneCloudIWS:
         self.cloudapi: AirzoneCloudApi = cloudapi
         self.device_data_lock = Lock()
         self.device_data: dict[str, Any] = {}
+        self.dispatcher: WebSocketsDispatcher = WebSocketsDispatcher()
         self.inst_id: str = installation.get_id()
+        self.recorder: WebSocketsRecorder | None = None
         self.session: ClientSession = cloudapi.session or ClientSession()
         self.state_end: Event = Event()
+        self.stats: WebSocketsStats = WebSocketsStats()
         self.task: Task[None] | None = None
         self.token: AirzoneCloudToken = cloudapi.token
 
+        record_dir = cloudapi.options.websockets_record
+        if record_dir is not None:
+            self.recorder = WebSocketsRecorder(record_dir, self.inst_id)
+
+        self.register_handler(WS_AUTH, self.handler_auth)
+        self.register_handler(WS_DEVICE_STATE, self.handler_device_state)
+        self.register_handler(WS_DEVICE_STATE_END, self.handler_device_state_end)
+        self.register_handler(WS_DEVICES_UPDATES, self.handler_devices_update, True)
+        self.register_handler(
+            WS_WEBSERVER_UPDATES, self.handler_webserver_updates, True
+        )
+        for event, handler, prefix in cloudapi.websockets_handlers:
+            self.register_handler(event, handler, prefix)
+
     async def _connect(self) -> None:
         """WebSockets connection."""
         params = {
             WS_INSTALLATION_ID: self.inst_id,
         }
         inst_params = urllib.parse.urlencode(params)
-        url = f"{WS_URL}/{API_V1}/{WS_WEBSOCKETS}/{WS_INSTALLATION}?{inst_params}"
+        ws_url = self.cloudapi.options.ws_url
+        url = f"{ws_url}/{API_V1}/{WS_WEBSOCKETS}/{WS_INSTALLATION}?{inst_params}"
 
         await self.state_init()
 
@@ -94,6 +130,9 @@ class AirzoneCloudIWS:
         """WebSockets task deletion."""
         self.state_end.clear()
 
+        if self.recorder is not None:
+            self.recorder.close()
+
         task = self.task
         if task is None:
             return True
@@ -106,6 +145,7 @@ class AirzoneCloudIWS:
     def reconnect(self) -> bool:
         """WebSockets reconnect."""
         _LOGGER.warning("WS[%s]: reconnecting...", self.inst_id)
+        self.stats.add_reconnect()
         self.disconnect()
         return self.connect()
 
@@ -113,6 +153,16 @@ class AirzoneCloudIWS:
         """Return WebSockets device data."""
         return self.device_data.get(device.get_id())
 
+    def get_events_metrics(self) -> dict[str, Any]:
+        """Return WebSockets events metrics."""
+        return self.dispatcher.data()
+
+    def register_handler(
+        self, event: str, handler: WebSocketsHandler, prefix: bool = False
+    ) -> None:
+        """Register WebSockets event handler."""
+        self.dispatcher.register(event, handler, prefix)
+
     async def handler_auth(
         self, ws: ClientWebSocketResponse, data: dict[str, Any]
     ) -> None:
@@ -133,7 +183,9 @@ class AirzoneCloudIWS:
         _LOGGER.debug("WS[%s]: CLOSE", self.inst_id)
         await ws.close()
 
-    async def handler_device_state(self, data: dict[str, Any]) -> None:
+    async def handler_device_state(
+        self, _ws: ClientWebSocketResponse, data: dict[str, Any]
+    ) -> None:
         """WebSockets DEVICE_STATE handler."""
         body: dict[str, Any] = data.get(WS_BODY) or {}
         update = EntityUpdate(UpdateType.WS_FULL, body)
@@ -146,19 +198,25 @@ class AirzoneCloudIWS:
             async with self.device_data_lock:
                 self.device_data[device.get_id()] = body
 
-            await device.update(update)
+            await self.cloudapi.update_entity(device, update)
+            self.cloudapi.entity_changes_callback()
 
-    def handler_device_state_end(self, data: dict[str, Any]) -> None:
+    async def handler_device_state_end(
+        self, _ws: ClientWebSocketResponse, data: dict[str, Any]
+    ) -> None:
         """WebSockets DEVICE_STATE_END handler."""
         body: str | None = data.get(WS_BODY)
 
         if body == self.inst_id:
             _LOGGER.debug("WS[%s]: DEVICE_STATE_END", self.inst_id)
+            self.stats.set_state_end()
             self.state_end.set()
         else:
             _LOGGER.error("WS[%s]: DEVICE_STATE_END mismatch (%s)", self.inst_id, body)
 
-    async def handler_devices_update(self, data: dict[str, Any]) -> None:
+    async def handler_devices_update(
+        self, _ws: ClientWebSocketResponse, data: dict[str, Any]
+    ) -> None:
         """WebSockets DEVICES_UPDATES handler."""
         body: dict[str, Any] = data.get(WS_BODY) or {}
         update = EntityUpdate(UpdateType.WS_PARTIAL, body)
@@ -168,7 +226,10 @@ class AirzoneCloudIWS:
 
         device = self.cloudapi.get_device_id(dev_id)
         if device is not None:
-            await device.update(update)
+            await self.cloudapi.update_entity(device, update)
+            self.cloudapi.entity_changes_callback()
+
+        self.cloudapi.update_callback()
 
     async def handler_error(self, msg: WSMessage) -> None:
         """WebSockets ERROR handler."""
@@ -183,23 +244,13 @@ class AirzoneCloudIWS:
         self, ws: ClientWebSocketResponse, data: dict[str, Any]
     ) -> None:
         """WebSockets TEXT handler."""
-        event: str = data.get(WS_EVENT, "")
-        if event == WS_AUTH:
-            await self.handler_auth(ws, data)
-        elif event == WS_DEVICE_STATE:
-            await self.handler_device_state(data)
-        elif event == WS_DEVICE_STATE_END:
-            self.handler_device_state_end(data)
-        elif event.startswith(WS_DEVICES_UPDATES):
-            await self.handler_devices_update(data)
-            self.cloudapi.update_callback()
-        elif event.startswith(WS_WEBSERVER_UPDATES):
-            await self.handler_webserver_updates(data)
-            self.cloudapi.update_callback()
-        else:
+        if not await self.dispatcher.dispatch(ws, data):
+            event = data.get(WS_EVENT)
             _LOGGER.warning("WS[%s]: EVENT[%s] -> %s", self.inst_id, event, data)
 
-    async def handler_webserver_updates(self, data: dict[str, Any]) -> None:
+    async def handler_webserver_updates(
+        self, _ws: ClientWebSocketResponse, data: dict[str, Any]
+    ) -> None:
         """WebSockets WEBSERVER_UPDATES handler."""
         body: dict[str, Any] = data.get(WS_BODY) or {}
         update = EntityUpdate(UpdateType.WS_PARTIAL, body)
@@ -209,29 +260,44 @@ class AirzoneCloudIWS:
 
         webserver = self.cloudapi.get_webserver_id(ws_id)
         if webserver is not None:
-            await webserver.update(update)
+            await self.cloudapi.update_entity(webserver, update)
+            self.cloudapi.entity_changes_callback()
+
+        self.cloudapi.update_callback()
 
     async def handler(self, ws: ClientWebSocketResponse, msg: WSMessage) -> None:
         """WebSockets message handler."""
-        if msg.type == WSMsgType.TEXT:
-            json_data = None
-            try:
-                json_data = json_loads(msg.data)
-            except (JSONDecodeError, TypeError) as err:
-                _LOGGER.error(err)
-
-            if json_data is not None:
+        if self.recorder is not None:
+            self.recorder.record(msg)
+
+        start = perf_counter()
+        key = msg.type.name
+        size = 0
+
+        try:
+            if msg.type == WSMsgType.TEXT:
+                json_data = None
+                try:
+                    size = len(msg.data)
+                    json_data = json_loads(msg.data)
+                except (JSONDecodeError, TypeError) as err:
+                    _LOGGER.error(err)
+
+                if json_data is not None:
+                    key = self.dispatcher.get_key(json_data.get(WS_EVENT, ""))
+                    self.set_alive()
+                    await self.handler_text(ws, json_data)
+            elif msg.type == WSMsgType.PING:
                 self.set_alive()
-                await self.handler_text(ws, json_data)
-        elif msg.type == WSMsgType.PING:
-            self.set_alive()
-            await self.handler_ping(ws)
-        elif msg.type == WSMsgType.CLOSE:
-            await self.handler_close(ws)
-        elif msg.type == WSMsgType.ERROR:
-            await self.handler_error(msg)
-        else:
-            _LOGGER.warning("Unknown WS msg: %s", msg)
+                await self.handler_ping(ws)
+            elif msg.type == WSMsgType.CLOSE:
+                await self.handler_close(ws)
+            elif msg.type == WSMsgType.ERROR:
+                await self.handler_error(msg)
+            else:
+                _LOGGER.warning("Unknown WS msg: %s", msg)
+        finally:
+            self.stats.add_frame(key, size, perf_counter() - start)
 
     def is_alive(self) -> bool:
         """WebSockets connection alive."""
@@ -262,7 +328,37 @@ class AirzoneCloudIWS:
 
         self.alive_dt = None
         self.state_end.clear()
+        self.stats.set_state_init()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return WebSockets statistics."""
+        return self.stats.data(len(self.device_data))
 
     async def state_wait(self) -> None:
         """WebSockets state end wait."""
         await asyncio.wait_for(self.state_end.wait(), WS_INIT_TIMEOUT)
+
+    async def state_wait_end(self) -> None:
+        """WebSockets state end wait until the connection task finishes."""
+        task = self.task
+        if task is None:
+            raise AirzoneCloudError(f"WS[{self.inst_id}]: not connected")
+
+        state_task = asyncio.ensure_future(self.state_end.wait())
+        try:
+            await asyncio.wait(
+                [state_task, task],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            if not state_task.done():
+                state_task.cancel()
+
+        if self.state_end.is_set():
+            return
+
+        if not task.cancelled():
+            err = task.exception()
+            if err is not None:
+                raise err
+        raise AirzoneCloudError(f"WS[{self.inst_id}]: connection closed")
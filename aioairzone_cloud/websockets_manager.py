@@ -0,0 +1,147 @@
+"""Airzone Cloud WebSockets manager."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from .installation import Installation
+from .websockets import AirzoneCloudIWS
+
+if TYPE_CHECKING:
+    from .cloudapi import AirzoneCloudApi
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WebSocketsManager:
+    """Airzone Cloud WebSockets manager.
+
+    Keeps at most websockets_max installation WebSockets connected.
+    Installations with more subscribers get live sockets first and the
+    remaining ones are served by REST polling.
+    """
+
+    def __init__(self, cloudapi: AirzoneCloudApi) -> None:
+        """Airzone Cloud WebSockets Manager init."""
+        self.cloudapi: AirzoneCloudApi = cloudapi
+        self.installations: dict[str, Installation] = {}
+        self.poll_index: int = 0
+        self.polled: dict[str, Installation] = {}
+        self.subscribers: dict[str, int] = {}
+
+    def add_installation(self, inst: Installation) -> None:
+        """Add installation to WebSockets manager."""
+        inst_id = inst.get_id()
+        if inst_id in self.installations:
+            return
+
+        # Rebalancing is left to the next update, so that adding all the
+        # installations of an account stays linear.
+        self.installations[inst_id] = inst
+        websockets = self.cloudapi.websockets
+        if len(websockets) < self.get_max():
+            websockets[inst_id] = AirzoneCloudIWS(self.cloudapi, inst)
+        else:
+            self.polled[inst_id] = inst
+
+    def clear(self) -> None:
+        """Remove all installations from WebSockets manager."""
+        for inst_id in list(self.installations):
+            self.remove_installation(inst_id)
+
+    def get_max(self) -> int:
+        """Return max number of WebSockets connections."""
+        ws_max = self.cloudapi.options.websockets_max
+        if ws_max is None:
+            return len(self.installations)
+        return max(ws_max, 0)
+
+    def get_polled(self) -> list[Installation]:
+        """Return installations served by REST polling."""
+        return list(self.polled.values())
+
+    def get_polled_budget(self, budget: int) -> list[Installation]:
+        """Return polled installations that fit in the requests budget.
+
+        Installations are rotated between calls so all of them get polled
+        when the budget doesn't allow polling every installation at once.
+        """
+        polled = self.get_polled()
+        if len(polled) == 0:
+            return []
+
+        insts: list[Installation] = []
+        start = self.poll_index % len(polled)
+        for idx in range(len(polled)):
+            inst = polled[(start + idx) % len(polled)]
+            req_cnt = self.cloudapi.count_installation_poll_requests(inst)
+            if req_cnt > budget:
+                _LOGGER.debug(
+                    "WS[%s]: polling skipped (%s requests)", inst.get_id(), req_cnt
+                )
+                continue
+            budget -= req_cnt
+            insts += [inst]
+        self.poll_index = start + 1
+
+        return insts
+
+    def get_subscribers(self, inst_id: str) -> int:
+        """Return installation subscribers."""
+        return self.subscribers.get(inst_id, 0)
+
+    def is_live(self, inst_id: str) -> bool:
+        """Check if installation is served by WebSockets."""
+        return inst_id in self.cloudapi.websockets
+
+    def rebalance(self) -> None:
+        """Promote and demote installations WebSockets."""
+        websockets = self.cloudapi.websockets
+
+        order = {inst_id: idx for idx, inst_id in enumerate(self.installations)}
+        candidates = sorted(
+            order,
+            key=lambda inst_id: (
+                -self.get_subscribers(inst_id),
+                not self.is_live(inst_id),
+                order[inst_id],
+            ),
+        )
+        live = set(candidates[: self.get_max()])
+
+        for inst_id, inst in self.installations.items():
+            if inst_id in live:
+                self.polled.pop(inst_id, None)
+                if inst_id not in websockets:
+                    _LOGGER.debug("WS[%s]: promoted", inst_id)
+                    websockets[inst_id] = AirzoneCloudIWS(self.cloudapi, inst)
+            else:
+                self.polled[inst_id] = inst
+                inst_ws = websockets.pop(inst_id, None)
+                if inst_ws is not None:
+                    _LOGGER.debug("WS[%s]: demoted", inst_id)
+                    inst_ws.disconnect()
+
+    def remove_installation(self, inst_id: str) -> None:
+        """Remove installation from WebSockets manager."""
+        self.installations.pop(inst_id, None)
+        self.polled.pop(inst_id, None)
+
+        inst_ws = self.cloudapi.websockets.pop(inst_id, None)
+        if inst_ws is not None:
+            inst_ws.disconnect()
+
+    def subscribe(self, inst_id: str) -> None:
+        """Add installation subscriber."""
+        self.subscribers[inst_id] = self.get_subscribers(inst_id) + 1
+        self.rebalance()
+
+    def unsubscribe(self, inst_id: str) -> None:
+        """Remove installation subscriber."""
+        subscribers = self.get_subscribers(inst_id) - 1
+        if subscribers > 0:
+            self.subscribers[inst_id] = subscribers
+        else:
+            self.subscribers.pop(inst_id, None)
+        self.rebalance()
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from aioairzone_cloud.common import OperationMode
 
-from .common import parse_str
+from .common import EntityKind, parse_str
 from .const import (
     API_AQ_MODE_CONF,
     API_MODE,
@@ -34,6 +34,7 @@ from .const import (
 )
 from .entity import EntityUpdate
 from .hvac import HVAC
+from .snapshot import ZoneSnapshot
 
 if TYPE_CHECKING:
     from .system import System
@@ -42,6 +43,16 @@ if TYPE_CHECKING:
 class Zone(HVAC):
     """Airzone Cloud Zone device."""
 
+    __slots__ = (
+        "master",
+        "system",
+        "system_number",
+        "zone_number",
+    )
+
+    kind = EntityKind.ZONE
+    snapshot_class = ZoneSnapshot
+
     def __init__(self, inst_id: str, ws_id: str, device_data: dict[str, Any]):
         """Airzone Cloud Zone device init."""
         super().__init__(inst_id, ws_id, device_data)
@@ -111,7 +122,9 @@ class Zone(HVAC):
 
     def set_modes(self, modes: list[OperationMode]) -> None:
         """Set slave zone modes."""
-        self.modes = modes
+        if self.modes != modes:
+            self.modes = modes
+            self.set_dirty()
 
     def set_param(self, param: str, data: dict[str, Any]) -> None:
         """Update device parameter from API request."""
@@ -142,9 +155,13 @@ class Zone(HVAC):
         elif param == API_SPEED_CONF:
             self.set_speed(data[API_VALUE])
 
+        self.set_dirty()
+
     def set_system(self, system: System) -> None:
         """Set System."""
-        self.system = system
+        if self.system is not system:
+            self.system = system
+            self.set_dirty()
 
     def update_data(self, update: EntityUpdate) -> None:
         """Update Zone data."""
@@ -154,6 +171,6 @@ class Zone(HVAC):
             data = update.get_data()
 
             if API_MODE_AVAIL in data:
-                self.master = len(data[API_MODE_AVAIL]) > 0
+                self.set_attr("master", len(data[API_MODE_AVAIL]) > 0)
             else:
-                self.master = None
+                self.set_attr("master", None)
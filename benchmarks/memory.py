@@ -0,0 +1,73 @@
+"""Airzone Cloud entities memory benchmark."""
+
+import asyncio
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any
+
+from aioairzone_cloud.entity import EntityUpdate, UpdateType
+from aioairzone_cloud.zone import Zone
+
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "..", "docs")
+ZONES = 10000
+
+
+def load_json(name: str) -> dict[str, Any]:
+    """Load JSON document."""
+    with open(os.path.join(DOCS_DIR, name), encoding="utf-8") as file:
+        data: dict[str, Any] = json.load(file)
+        return data
+
+
+async def create_zones(count: int, update_data: dict[str, Any]) -> list[Zone]:
+    """Create and update Airzone Cloud zones."""
+    zones: list[Zone] = []
+
+    for idx in range(count):
+        device_data = {
+            "device_id": f"DUMMY-DEVICE-ID-ZONE-{idx}",
+            "meta": {
+                "system_number": 1 + idx // 32,
+                "zone_number": 1 + idx % 32,
+            },
+            "name": f"Zone {idx}",
+            "type": "az_zone",
+            "ws_id": "DUMMY-WS-MAC",
+        }
+        zone = Zone("DUMMY-INSTALLATION-ID", "DUMMY-WS-MAC", device_data)
+        await zone.update(EntityUpdate(UpdateType.API_FULL, update_data))
+        zones += [zone]
+
+    return zones
+
+
+async def main() -> None:
+    """Airzone Cloud entities memory benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ZONES
+
+    config_data = load_json("airzone-cloud-api-device-zone-master-config.json")
+    status_data = load_json("airzone-cloud-api-device-zone-master-status.json")
+    update_data = config_data | status_data
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    zones = await create_zones(count, update_data)
+
+    gc.collect()
+    end, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"zones: {len(zones)}")
+    print(f"zone instance: {sys.getsizeof(zones[0])} bytes")
+    print(f"has __dict__: {hasattr(zones[0], '__dict__')}")
+    print(f"bytes per zone: {(end - start) / len(zones):.1f}")
+    print(f"peak bytes per zone: {(peak - start) / len(zones):.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
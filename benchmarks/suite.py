@@ -0,0 +1,273 @@
+"""Airzone Cloud performance benchmark suite.
+
+Synthesizes accounts of several sizes from the docs/ JSON fixtures and
+measures discovery, entity updates, data() construction, device linking,
+WebSockets frame handling and memory usage. Results are written as JSON
+for regression tracking:
+
+    python benchmarks/suite.py --sizes 10 100 1000 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+import gc
+from json import dumps as json_dumps
+import os
+import platform
+import statistics
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Any
+
+from aiohttp import ClientSession, WSMessage, WSMsgType
+
+from aioairzone_cloud.cloudapi import AirzoneCloudApi
+from aioairzone_cloud.common import ConnectionOptions
+from aioairzone_cloud.const import WS_BODY, WS_DEVICES_UPDATES, WS_EVENT
+from aioairzone_cloud.entity import EntityUpdate, UpdateType
+from aioairzone_cloud.mock_server import MockFleet
+from aioairzone_cloud.websockets import AirzoneCloudIWS
+from aioairzone_cloud.zone import Zone
+
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "..", "docs")
+
+REPEAT = 5
+SIZES = (10, 100, 1000, 10000)
+
+
+class FixtureCloudApi(AirzoneCloudApi):
+    """Airzone Cloud API answering requests from fleet."""
+
+    def __init__(
+        self, session: ClientSession, options: ConnectionOptions, fleet: MockFleet
+    ) -> None:
+        """Fixture Airzone Cloud API init."""
+        super().__init__(session, options)
+        self.fleet = fleet
+
+    async def api_request(
+        self, method: str, path: str, json: Any | None = None
+    ) -> dict[str, Any]:
+        """Airzone Cloud API request."""
+        return self.fleet.get_response(path) or {}
+
+
+def get_stats(times: list[float], items: int) -> dict[str, Any]:
+    """Return timing stats in seconds."""
+    median = statistics.median(times)
+    return {
+        "items": items,
+        "max": max(times),
+        "mean": statistics.fmean(times),
+        "median": median,
+        "min": min(times),
+        "per_item_us": median / max(items, 1) * 1e6,
+        "repeat": len(times),
+    }
+
+
+async def measure(
+    func: Callable[[int], Awaitable[Any]],
+    items: int,
+    repeat: int,
+    setup: Callable[[], Any] | None = None,
+) -> dict[str, Any]:
+    """Measure async function call times."""
+    times: list[float] = []
+    for idx in range(repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        await func(idx)
+        times += [perf_counter() - start]
+    return get_stats(times, items)
+
+
+def measure_sync(
+    func: Callable[[], Any],
+    items: int,
+    repeat: int,
+    setup: Callable[[], Any] | None = None,
+) -> dict[str, Any]:
+    """Measure function call times."""
+    times: list[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        times += [perf_counter() - start]
+    return get_stats(times, items)
+
+
+async def discover(api: AirzoneCloudApi) -> None:
+    """Perform account discovery."""
+    await api.login()
+    await api.discover()
+
+
+def update_runner(
+    zones: list[Zone], updates: list[list[EntityUpdate]]
+) -> Callable[[int], Awaitable[None]]:
+    """Return function applying a round of updates to zones."""
+
+    async def run_updates(idx: int) -> None:
+        for zone, update in zip(zones, updates[idx], strict=True):
+            await zone.update(update)
+
+    return run_updates
+
+
+def ws_frame(zone_id: str, temp: float) -> WSMessage:
+    """Return WebSockets DEVICES_UPDATES text frame."""
+    data = {
+        WS_EVENT: f"{WS_DEVICES_UPDATES}.status",
+        WS_BODY: {
+            "device_id": zone_id,
+            "change": {"status": {"local_temp": {"celsius": temp}}},
+        },
+    }
+    return WSMessage(WSMsgType.TEXT, json_dumps(data), None)
+
+
+async def bench_size(session: ClientSession, zones: int, repeat: int) -> dict[str, Any]:
+    """Run benchmarks for an account size."""
+    fleet = MockFleet(DOCS_DIR, zones)
+    zone_ids = fleet.get_zones()
+    options = ConnectionOptions("user", "pass", websockets=False)
+    results: dict[str, Any] = {}
+
+    async def run_discovery(_idx: int) -> None:
+        await discover(FixtureCloudApi(session, options, fleet))
+
+    results["discovery"] = await measure(run_discovery, zones, repeat)
+
+    api = FixtureCloudApi(session, options, fleet)
+    await discover(api)
+    results["update_polling"] = await measure(
+        lambda _idx: api.update_polling(), zones, repeat
+    )
+
+    zone_list = [api.zones[zone_id] for zone_id in zone_ids]
+    full = {
+        zone_id: fleet.config[zone_id] | fleet.status[zone_id] for zone_id in zone_ids
+    }
+
+    def make_update(update_type: UpdateType, zone_id: str, idx: int) -> EntityUpdate:
+        if update_type == UpdateType.API_FULL:
+            return EntityUpdate(update_type, full[zone_id])
+        if update_type == UpdateType.API_PARTIAL:
+            return EntityUpdate(update_type, fleet.config[zone_id])
+        if update_type == UpdateType.WS_FULL:
+            return EntityUpdate(
+                update_type, {"device_id": zone_id, "status": full[zone_id]}
+            )
+        return EntityUpdate(
+            update_type,
+            {"change": {"status": {"local_temp": {"celsius": 20.0 + idx % 2}}}},
+        )
+
+    update_data: dict[str, Any] = {}
+    for update_type in UpdateType:
+        updates: list[list[EntityUpdate]] = [
+            [make_update(update_type, zone.get_id(), idx) for zone in zone_list]
+            for idx in range(repeat)
+        ]
+
+        update_data[update_type.name.lower()] = await measure(
+            update_runner(zone_list, updates), zones, repeat
+        )
+    results["update_data"] = update_data
+
+    def set_dirty() -> None:
+        for device in api.devices.values():
+            device.set_dirty()
+
+    results["data_cold"] = measure_sync(api.data, zones, repeat, set_dirty)
+    results["data_warm"] = measure_sync(api.data, zones, repeat)
+
+    def set_pending() -> None:
+        api.topology.pending = dict.fromkeys(api.topology.systems)
+
+    results["link_devices"] = measure_sync(api.link_devices, zones, repeat, set_pending)
+
+    inst = next(iter(api.installations.values()))
+    iws = AirzoneCloudIWS(api, inst)
+    frames = [
+        [ws_frame(zone_id, 20.0 + idx % 2) for zone_id in zone_ids]
+        for idx in range(repeat)
+    ]
+
+    async def run_frames(idx: int) -> None:
+        for frame in frames[idx]:
+            await iws.handler(None, frame)  # type: ignore[arg-type]
+
+    results["ws_frames"] = await measure(run_frames, zones, repeat)
+
+    return results
+
+
+async def bench_memory(session: ClientSession, zones: int) -> dict[str, Any]:
+    """Measure memory of a discovered and updated account."""
+    fleet = MockFleet(DOCS_DIR, zones)
+    options = ConnectionOptions("user", "pass", websockets=False)
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    api = FixtureCloudApi(session, options, fleet)
+    await discover(api)
+    await api.update_polling()
+    api.data()
+
+    gc.collect()
+    end, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "bytes": end - start,
+        "bytes_per_zone": (end - start) / zones,
+        "devices": len(api.devices),
+        "peak_bytes": peak - start,
+    }
+
+
+async def main() -> None:
+    """Airzone Cloud performance benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", help="JSON results file (default: stdout)")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+
+    async with ClientSession() as session:
+        for zones in args.sizes:
+            print(f"zones: {zones}", file=sys.stderr)
+            size_results = await bench_size(session, zones, args.repeat)
+            size_results["memory"] = await bench_memory(session, zones)
+            results["sizes"][str(zones)] = size_results
+
+    output = json_dumps(results, indent=4, sort_keys=True)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -38,7 +38,7 @@ async def main():
             print(f"Update time: {update_end - update_start}")
             print("***")
 
-            print(json.dumps(client.raw_data(), indent=4, sort_keys=True))
+            print(json.dumps(client.raw_data(), default=dict, indent=4, sort_keys=True))
 
             await client.logout()
         except LoginError:
@@ -0,0 +1 @@
+"""Tests for aioairzone-cloud."""
@@ -0,0 +1,44 @@
+"""Airzone Cloud tests common code."""
+
+import asyncio
+from collections.abc import Callable
+import os
+from time import monotonic
+
+from aioairzone_cloud.common import ConnectionOptions, EntityKind
+from aioairzone_cloud.entity import EntityEvent
+from aioairzone_cloud.mock_server import AirzoneCloudMockServer
+
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "..", "docs")
+
+WAIT_INTERVAL = 0.05
+WAIT_TIMEOUT = 30.0
+
+
+def get_options(server: AirzoneCloudMockServer, websockets: bool) -> ConnectionOptions:
+    """Return connection options for mock server."""
+    return ConnectionOptions(
+        "user@domain.com",
+        "password",
+        api_url=server.get_api_url(),
+        ws_url=server.get_ws_url(),
+        websockets=websockets,
+    )
+
+
+def get_temps(events: list[EntityEvent]) -> dict[str, float]:
+    """Return last temperature of each zone in change events."""
+    temps: dict[str, float] = {}
+    for event in events:
+        change = event.changes.get("temp")
+        if event.kind == EntityKind.ZONE and change is not None:
+            temps[event.id] = change.new
+    return temps
+
+
+async def wait_for(check: Callable[[], bool], timeout: float = WAIT_TIMEOUT) -> None:
+    """Wait until check passes."""
+    end = monotonic() + timeout
+    while not check():
+        assert monotonic() < end, "timed out"
+        await asyncio.sleep(WAIT_INTERVAL)
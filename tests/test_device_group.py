@@ -0,0 +1,60 @@
+"""Airzone Cloud DeviceGroup tests."""
+
+from aioairzone_cloud.device_group import AverageValue, round_average
+
+
+def get_average(values: list[float]) -> AverageValue:
+    """Return running average of values."""
+    average = AverageValue()
+    for value in values:
+        average.add(value, 1)
+    return average
+
+
+def test_average_empty() -> None:
+    """Test average without values."""
+    average = get_average([])
+    assert average.get() is None
+    assert round_average(average) is None
+
+
+def test_average_none() -> None:
+    """Test average ignores missing values."""
+    average = AverageValue()
+    average.add(None, 1)
+    assert average.get() is None
+
+    average.add(21.5, 1)
+    average.add(None, -1)
+    assert average.get() == 21.5
+
+
+def test_average_float_mean() -> None:
+    """Test average rounding matches float mean."""
+    values = [17.8, 17.9]
+    assert round_average(get_average(values)) == round(sum(values) / len(values), 1)
+
+    values = [21.3, 22.4, 19.9]
+    assert round_average(get_average(values)) == round(sum(values) / len(values), 1)
+
+
+def test_average_exact_mean() -> None:
+    """Test average rounding uses the exact mean."""
+    values = [22.7, 18.4, 19.5, 27.6]
+    # Float sum is 88.19999999999999, so its mean rounds down
+    assert round(sum(values) / len(values), 1) == 22.0
+    assert round_average(get_average(values)) == 22.1
+    assert round_average(get_average(list(reversed(values)))) == 22.1
+
+
+def test_average_remove() -> None:
+    """Test removing values doesn't accumulate errors."""
+    average = get_average([0.1, 0.2])
+    for _ in range(1000):
+        average.add(0.3, 1)
+        average.add(0.3, -1)
+    average.add(0.1, -1)
+    assert average.get() == 0.2
+
+    average.add(0.2, -1)
+    assert average.get() is None
@@ -0,0 +1,119 @@
+"""Airzone Cloud entity fields tests."""
+
+import asyncio
+import json
+import os
+from typing import Any
+
+from aioairzone_cloud.aidoo import Aidoo
+from aioairzone_cloud.const import API_CELSIUS, API_LOCAL_TEMP
+from aioairzone_cloud.device import Device
+from aioairzone_cloud.entity import Entity, EntityUpdate, UpdateType
+from aioairzone_cloud.system import System
+from aioairzone_cloud.webserver import WebServer
+from aioairzone_cloud.zone import Zone
+
+from .common import DOCS_DIR
+
+BASELINE_FIELDS = os.path.join(
+    os.path.dirname(__file__), "data", "baseline-fields.json"
+)
+
+DEVICE_CLASSES: dict[str, type[Device]] = {
+    "aidoo": Aidoo,
+    "az_system": System,
+    "az_zone": Zone,
+}
+
+# Installation device index and its config and status fixtures
+DOCS_DEVICES: list[tuple[int, str, str]] = [
+    (0, "system-config", "system-status"),
+    (1, "zone-master-config", "zone-master-status"),
+    (2, "zone-slave-config", "zone-slave-status"),
+]
+
+
+def load_json(name: str) -> Any:
+    """Load docs JSON fixture."""
+    with open(os.path.join(DOCS_DIR, name), encoding="utf-8") as file:
+        return json.load(file)
+
+
+async def get_entity_data(
+    entity: Entity, data: dict[str, Any], status: dict[str, Any]
+) -> list[Any]:
+    """Return entity data after a full update and a status update."""
+    res: list[Any] = []
+    await entity.update(EntityUpdate(UpdateType.API_FULL, data))
+    res += [entity.data()]
+    await entity.update(EntityUpdate(UpdateType.API_FULL, status))
+    res += [entity.data()]
+    # Normalize enums and tuples
+    normalized: list[Any] = json.loads(json.dumps(res))
+    return normalized
+
+
+async def get_fields_data() -> dict[str, Any]:
+    """Return entity data parsed from docs fixtures."""
+    res: dict[str, Any] = {}
+
+    installation = load_json("airzone-cloud-api-installation.json")
+    inst_id = installation["installation_id"]
+    devices = [dev for group in installation["groups"] for dev in group["devices"]]
+    for idx, config_name, status_name in DOCS_DEVICES:
+        device_data = devices[idx]
+        config = load_json(f"airzone-cloud-api-device-{config_name}.json")
+        status = load_json(f"airzone-cloud-api-device-{status_name}.json")
+        device = DEVICE_CLASSES[device_data["type"]](
+            inst_id, device_data["ws_id"], device_data
+        )
+        res[f"docs/{device_data['device_id']}"] = await get_entity_data(
+            device, config | status, status
+        )
+
+    for name in ("aidoo", "flexa"):
+        diagnostics = load_json(f"diagnostics-airzone-{name}.json")
+        for inst_id, installation in diagnostics["installations"].items():
+            for group in installation["groups"]:
+                for device_data in group["devices"]:
+                    dev_id = device_data["device_id"]
+                    config = diagnostics["devices-config"].get(dev_id, {})
+                    status = diagnostics["devices-status"][dev_id]
+                    device = DEVICE_CLASSES[device_data["type"]](
+                        inst_id, device_data["ws_id"], device_data
+                    )
+                    res[f"{name}/{dev_id}"] = await get_entity_data(
+                        device, config | status, status
+                    )
+
+        for ws_id, ws_data in diagnostics["webservers"].items():
+            webserver = WebServer("installation1", ws_id)
+            res[f"{name}/{ws_id}"] = await get_entity_data(webserver, ws_data, ws_data)
+
+    return res
+
+
+def test_fields_sub_key() -> None:
+    """Test nested fields ignore values which aren't mappings."""
+
+    async def run() -> None:
+        installation = load_json("airzone-cloud-api-installation.json")
+        device_data = installation["groups"][0]["devices"][1]
+        zone = Zone(installation["installation_id"], device_data["ws_id"], device_data)
+
+        status: dict[str, Any] = {API_LOCAL_TEMP: {API_CELSIUS: 21.5}}
+        await zone.update(EntityUpdate(UpdateType.API_FULL, status))
+        assert zone.get_temperature() == 21.5
+
+        status = {API_LOCAL_TEMP: 25}
+        await zone.update(EntityUpdate(UpdateType.API_PARTIAL, status))
+        assert zone.get_temperature() == 21.5
+
+    asyncio.run(run())
+
+
+def test_fields_baseline() -> None:
+    """Test field tables parse fixtures like the baseline parsers."""
+    with open(BASELINE_FIELDS, encoding="utf-8") as file:
+        baseline = json.load(file)
+    assert asyncio.run(get_fields_data()) == baseline
@@ -0,0 +1,51 @@
+"""Airzone Cloud limiter tests."""
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from aioairzone_cloud.limiter import AccountLimiter, RequestLimiter, TokenBucket
+
+
+def test_token_bucket_rate() -> None:
+    """Test token bucket limits requests per second after the burst."""
+
+    async def run() -> None:
+        bucket = TokenBucket(20.0, 2)
+        start = monotonic()
+        for _ in range(2):
+            await bucket.acquire()
+        assert monotonic() - start < 0.05
+
+        for _ in range(4):
+            await bucket.acquire()
+        assert monotonic() - start >= 0.19
+
+    asyncio.run(run())
+
+
+def test_token_bucket_invalid() -> None:
+    """Test token bucket rejects invalid settings."""
+    with pytest.raises(ValueError):
+        TokenBucket(0.0)
+    with pytest.raises(ValueError):
+        TokenBucket(1.0, 0)
+
+
+def test_account_limiter() -> None:
+    """Test account limiter takes shared and account slots."""
+
+    async def run() -> None:
+        shared = RequestLimiter(4)
+        account = AccountLimiter(shared, 1, 100.0, 1)
+        assert shared.get_rate() is None
+        assert account.get_rate() == 100.0
+
+        async with account:
+            assert account.get_active() == 1
+            assert shared.get_active() == 1
+        assert account.get_active() == 0
+        assert shared.get_active() == 0
+
+    asyncio.run(run())
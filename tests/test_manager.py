@@ -0,0 +1,126 @@
+"""Airzone Cloud Manager tests."""
+
+import asyncio
+
+from aiohttp import ClientSession
+
+from aioairzone_cloud.const import API_LOCAL_TEMP
+from aioairzone_cloud.entity import EntityEvent
+from aioairzone_cloud.exceptions import LoginError
+from aioairzone_cloud.manager import AirzoneCloudManager
+from aioairzone_cloud.mock_server import AirzoneCloudMockServer, MockFleet
+
+from .common import DOCS_DIR, get_options, get_temps, wait_for
+
+UPDATE_INTERVAL = 0.2
+ZONES = 20
+
+
+def test_manager_polling() -> None:
+    """Test manager discovery and polling events."""
+
+    async def run() -> None:
+        fleet = MockFleet(DOCS_DIR, ZONES)
+        server = AirzoneCloudMockServer(fleet)
+        await server.start()
+        async with ClientSession() as session:
+            manager = AirzoneCloudManager(
+                session, update_interval=UPDATE_INTERVAL, rate=None, account_rate=None
+            )
+            api = await manager.add_account("account", get_options(server, False))
+
+            assert sorted(api.installations) == sorted(fleet.installation)
+            assert sorted(api.zones) == sorted(fleet.get_zones())
+
+            events: list[EntityEvent] = []
+            api.set_changes_callback(events.extend)
+            manager.start()
+
+            temps: dict[str, float] = {}
+            for idx, zone_id in enumerate(fleet.get_zones()):
+                temps[zone_id] = 30.0 + idx / 10
+                fleet.set_param(zone_id, API_LOCAL_TEMP, temps[zone_id])
+            await wait_for(lambda: get_temps(events) == temps)
+
+            await manager.stop()
+            assert len(manager.get_accounts()) == 0
+        await server.stop()
+
+    asyncio.run(run())
+
+
+def test_manager_websockets() -> None:
+    """Test manager discovery and WebSockets events."""
+
+    async def run() -> None:
+        fleet = MockFleet(DOCS_DIR, ZONES)
+        server = AirzoneCloudMockServer(fleet)
+        await server.start()
+        async with ClientSession() as session:
+            manager = AirzoneCloudManager(
+                session, update_interval=UPDATE_INTERVAL, rate=None, account_rate=None
+            )
+            api = await manager.add_account("account", get_options(server, True))
+
+            assert sorted(api.zones) == sorted(fleet.get_zones())
+            assert sorted(server.websockets) == sorted(fleet.installation)
+
+            events: list[EntityEvent] = []
+            api.set_changes_callback(events.extend)
+            manager.start()
+
+            temps: dict[str, float] = {}
+            for idx, zone_id in enumerate(fleet.get_zones()):
+                temps[zone_id] = 30.0 + idx / 10
+                await server.set_params(zone_id, {API_LOCAL_TEMP: temps[zone_id]})
+            await wait_for(lambda: get_temps(events) == temps)
+
+            await manager.stop()
+        await server.stop()
+
+    asyncio.run(run())
+
+
+def test_manager_rediscover() -> None:
+    """Test manager discovers accounts again after failed logins."""
+
+    async def run() -> None:
+        fleet = MockFleet(DOCS_DIR, ZONES)
+        server = AirzoneCloudMockServer(fleet)
+        await server.start()
+        async with ClientSession() as session:
+            manager = AirzoneCloudManager(
+                session, update_interval=UPDATE_INTERVAL, rate=None, account_rate=None
+            )
+            api = await manager.add_account("account", get_options(server, False))
+
+            discover = api.discover
+            discovered = 0
+            update = api.update
+
+            async def discover_count() -> None:
+                nonlocal discovered
+                discovered += 1
+                await discover()
+
+            async def update_error() -> None:
+                raise LoginError("expired")
+
+            setattr(api, "discover", discover_count)
+            setattr(api, "update", update_error)
+            await manager.update_account("account")
+            assert "account" in manager.rediscover
+            assert discovered == 0
+
+            setattr(api, "update", update)
+            await manager.update_account("account")
+            assert "account" not in manager.rediscover
+            assert discovered == 1
+
+            await manager.update_account("account")
+            assert discovered == 1
+
+            await manager.stop()
+        await server.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,108 @@
+"""Airzone Cloud Runner tests."""
+
+import asyncio
+
+from aioairzone_cloud.common import EntityKind
+from aioairzone_cloud.const import API_LOCAL_TEMP
+from aioairzone_cloud.entity import EntityChange, EntityEvent
+from aioairzone_cloud.mock_server import (
+    MOCK_STATS_WEBSOCKETS,
+    AirzoneCloudMockServer,
+    MockFleet,
+)
+from aioairzone_cloud.runner import (
+    AirzoneCloudRunner,
+    HashRing,
+    pack_events,
+    unpack_events,
+)
+
+from .common import DOCS_DIR, get_options, get_temps, wait_for
+
+UPDATE_INTERVAL = 1.0
+ZONES = 20
+
+
+def test_hash_ring() -> None:
+    """Test removing a node only moves its keys."""
+    ring = HashRing()
+    for node in range(4):
+        ring.add_node(node)
+    keys = [f"account{idx}" for idx in range(1000)]
+    nodes = {key: ring.get_node(key) for key in keys}
+    assert set(nodes.values()) == {0, 1, 2, 3}
+
+    ring.remove_node(2)
+    for key in keys:
+        if nodes[key] != 2:
+            assert ring.get_node(key) == nodes[key]
+        else:
+            assert ring.get_node(key) != 2
+
+    ring.add_node(2)
+    assert {key: ring.get_node(key) for key in keys} == nodes
+
+
+def test_pack_events() -> None:
+    """Test change events survive packing."""
+    events = [
+        EntityEvent(
+            EntityKind.ZONE,
+            "zone0",
+            {
+                "name": EntityChange("Old", "New"),
+                "temp": EntityChange(None, 21.5),
+            },
+        ),
+    ]
+    assert unpack_events(pack_events(events)) == events
+
+
+def test_runner_events() -> None:
+    """Test runner worker streams every change and survives being killed."""
+
+    async def run() -> None:
+        fleet = MockFleet(DOCS_DIR, ZONES)
+        server = AirzoneCloudMockServer(fleet)
+        await server.start()
+
+        errors: list[str] = []
+        events: list[EntityEvent] = []
+        runner = AirzoneCloudRunner(workers=1, update_interval=UPDATE_INTERVAL)
+        runner.set_changes_callback(lambda _, changes: events.extend(changes))
+        runner.set_error_callback(lambda _, error: errors.append(error))
+        runner.start()
+        try:
+            runner.add_account("account", get_options(server, True))
+            assert runner.get_worker("account") == 0
+
+            async def send_changes(base: float) -> None:
+                await wait_for(
+                    lambda: sorted(server.websockets) == sorted(fleet.installation)
+                    and all(len(items) > 0 for items in server.websockets.values())
+                )
+                events.clear()
+                temps: dict[str, float] = {}
+                for idx, zone_id in enumerate(fleet.get_zones()):
+                    temps[zone_id] = base + idx / 10
+                    await server.set_params(zone_id, {API_LOCAL_TEMP: temps[zone_id]})
+                await wait_for(lambda: get_temps(events) == temps)
+
+            await send_changes(30.0)
+
+            process = runner.processes[0]
+            connected = server.get_stats()[MOCK_STATS_WEBSOCKETS]
+            process.kill()
+            await wait_for(
+                lambda: server.get_stats()[MOCK_STATS_WEBSOCKETS] > connected
+            )
+            assert runner.get_workers() == [0]
+            assert runner.processes[0] is not process
+
+            await send_changes(40.0)
+            assert len(errors) == 0
+        finally:
+            await runner.stop()
+            await server.stop()
+
+    asyncio.run(run())
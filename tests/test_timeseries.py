@@ -0,0 +1,80 @@
+"""Airzone Cloud time series tests."""
+
+import pytest
+
+from aioairzone_cloud.timeseries import TimeSeries
+
+
+def get_window(
+    samples: list[tuple[float, float]],
+    capacity: int,
+    last: int | None,
+    since: float | None,
+) -> list[tuple[float, float]]:
+    """Return expected window of samples."""
+    window = samples[-capacity:] if len(samples) > 0 else []
+    if last is not None:
+        window = window[-last:] if last > 0 else []
+    if since is not None:
+        window = [sample for sample in window if sample[0] >= since]
+    return window
+
+
+def test_timeseries_empty() -> None:
+    """Test time series without samples."""
+    series = TimeSeries(4)
+    assert len(series) == 0
+    assert series.get_last() is None
+    assert len(series.get_values()) == 0
+    assert series.max() is None
+    assert series.mean() is None
+    assert series.min() is None
+
+
+def test_timeseries_invalid() -> None:
+    """Test time series rejects invalid capacity."""
+    with pytest.raises(ValueError):
+        TimeSeries(0)
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 3, 5])
+def test_timeseries_wrap(capacity: int) -> None:
+    """Test windows match the last samples while the ring wraps around."""
+    series = TimeSeries(capacity)
+    samples: list[tuple[float, float]] = []
+    for idx in range(3 * capacity + 1):
+        sample = (float(idx), float(idx * 10))
+        series.append(*sample)
+        samples += [sample]
+
+        assert len(series) == min(len(samples), capacity)
+        assert series.get_last() == sample
+
+        for last in [None, 0, 1, capacity - 1, capacity, capacity + 1]:
+            for since in [None, -1.0, 0.0, idx - 1.5, float(idx), idx + 0.5]:
+                window = get_window(samples, capacity, last, since)
+                timestamps = list(series.get_timestamps(last, since))
+                values = list(series.get_values(last, since))
+                assert timestamps == [sample[0] for sample in window]
+                assert values == [sample[1] for sample in window]
+
+                if len(window) > 0:
+                    assert series.max(last, since) == max(values)
+                    assert series.min(last, since) == min(values)
+                    assert series.mean(last, since) == sum(values) / len(values)
+                else:
+                    assert series.mean(last, since) is None
+
+
+def test_timeseries_clear() -> None:
+    """Test cleared time series starts over."""
+    series = TimeSeries(3)
+    for idx in range(5):
+        series.append(float(idx), float(idx))
+    series.clear()
+    assert len(series) == 0
+    assert series.get_last() is None
+
+    series.append(10.0, 1.0)
+    assert list(series.get_timestamps()) == [10.0]
+    assert series.get_last() == (10.0, 1.0)